@@ -0,0 +1,93 @@
+"""
+Benchmark: NPR listing-page parsing across HTML parser backends.
+
+Parses the saved NPR page fixture (tests/fixtures/npr_news_page.html) with
+`static_scraper.parse_page` on every installed backend and reports:
+
+- parse time per page (best of several rounds)
+- memory per parsed document, measured as the RSS growth of a fresh
+  process holding PAGES parsed documents (this includes the C heaps of
+  lxml and Lexbor, which tracemalloc cannot see)
+
+Usage (from the project root):
+    python -m benchmarks.bench_html_parsers [pages]
+"""
+
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "npr_news_page.html")
+ROUNDS = 5
+
+
+def load_fixture():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def time_backend(name, html, pages):
+    """Return the best seconds-per-page over ROUNDS rounds of `pages` parses."""
+    from src.scrapers.parsers import create_parser
+    from src.scrapers.static_scraper import parse_page
+
+    parser = create_parser(name)
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(pages):
+            parse_page(html, parser)
+        best = min(best, (time.perf_counter() - start) / pages)
+    return best
+
+
+def measure_memory(name, html, pages, results):
+    """In a fresh process, report KiB of RSS growth per parsed document kept alive."""
+    from src.scrapers.parsers import create_parser
+
+    parser = create_parser(name)
+    parser.parse(html)  # load the library before the baseline
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    documents = [parser.parse(html) for _ in range(pages)]
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((after - before) / len(documents))
+
+
+def main():
+    from src.scrapers.parsers import PARSERS, create_parser
+
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    html = load_fixture()
+    logging.getLogger("news_logger").setLevel(logging.ERROR)  # promo card warning
+
+    backends = []
+    for name in PARSERS:
+        try:
+            create_parser(name)
+            backends.append(name)
+        except RuntimeError as e:
+            print(f"skipping {name}: {e}")
+
+    print(f"NPR fixture: {len(html) / 1024:.0f} KiB, {pages} parses per round\n")
+    print(f"{'backend':<12} {'ms/page':>8} {'pages/s':>8} {'KiB/doc':>8}")
+    ctx = multiprocessing.get_context("spawn")
+    baseline = None
+    for name in backends:
+        per_page = time_backend(name, html, pages)
+        results = ctx.Queue()
+        proc = ctx.Process(target=measure_memory, args=(name, html, pages, results))
+        proc.start()
+        kib = results.get()
+        proc.join()
+        baseline = baseline or per_page
+        print(
+            f"{name:<12} {per_page * 1000:>8.2f} {1 / per_page:>8.0f} {kib:>8.0f}"
+            f"   ({baseline / per_page:.1f}x vs {backends[0]})"
+        )
+
+
+if __name__ == "__main__":
+    main()
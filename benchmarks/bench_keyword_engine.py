@@ -0,0 +1,94 @@
+"""
+Benchmark: title keyword counting, per-title loop vs KeywordEngine.
+
+Generates ROWS synthetic headlines and times:
+
+- the previous loop (stopword set rebuilt per call, `re.findall` and a
+  list comprehension per title, one global Counter), run on at most
+  LEGACY_ROWS titles and extrapolated
+- KeywordEngine keywords and bigrams, in-process and on a process pool
+- per-category keyword counts
+- top-N via heap vs a full sort of the vocabulary
+
+Usage (from the project root):
+    python -m benchmarks.bench_keyword_engine [rows] [workers]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+LEGACY_ROWS = 1_000_000
+CATEGORIES = ["news", "politics", "climate", "culture", "tech", "business", "science", "sport"]
+
+
+def make_titles(rows):
+    rng = random.Random(7)
+    vocabulary = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10))) for _ in range(50_000)
+    ]
+    common = ["the", "of", "and", "in", "for", "climate", "budget", "vote", "election", "market"]
+    return [
+        " ".join(rng.choice(common) if rng.random() < 0.3 else rng.choice(vocabulary) for _ in range(9)).capitalize()
+        for _ in range(rows)
+    ]
+
+
+def legacy_count(titles):
+    from src.analysis.keywords import DEFAULT_STOPWORDS
+
+    stopwords = set(DEFAULT_STOPWORDS)
+    word_counts = Counter()
+    for title in titles:
+        words = re.findall(r"\b[a-z]{3,}\b", title.lower())
+        keywords = [word for word in words if word not in stopwords]
+        word_counts.update(keywords)
+    return word_counts
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    from src.analysis.keywords import KeywordEngine, top_terms
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    titles = make_titles(rows)
+    categories = [CATEGORIES[i % len(CATEGORIES)] for i in range(rows)]
+    print(f"{rows:,} titles, {os.cpu_count()} CPUs\n")
+
+    legacy_rows = min(rows, LEGACY_ROWS)
+    legacy, expected = timed(lambda: legacy_count(titles[:legacy_rows]))
+    legacy *= rows / legacy_rows
+
+    engine = KeywordEngine()
+    single, counts = timed(lambda: engine.count(titles))
+    if legacy_rows == rows:
+        assert counts == expected
+    bigrams, _ = timed(lambda: engine.count(titles, n=2))
+    by_category, _ = timed(lambda: engine.count_by(titles, categories))
+    pool = KeywordEngine(workers=workers)
+    parallel, _ = timed(lambda: pool.count(titles))
+    heap, _ = timed(lambda: top_terms(counts, 10))
+    full_sort, _ = timed(lambda: sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10])
+
+    note = "" if legacy_rows == rows else f"  (extrapolated from {legacy_rows:,})"
+    print(f"{'step':<34} {'seconds':>8}")
+    print(f"{'legacy per-title loop':<34} {legacy:>8.2f}{note}")
+    print(f"{'engine keywords, 1 process':<34} {single:>8.2f}  ({legacy / single:.1f}x)")
+    print(f"{f'engine keywords, {workers} workers':<34} {parallel:>8.2f}  ({legacy / parallel:.1f}x)")
+    print(f"{'engine bigrams, 1 process':<34} {bigrams:>8.2f}")
+    print(f"{'engine keywords per category':<34} {by_category:>8.2f}")
+    print(f"{f'top 10 of {len(counts):,} via heap':<34} {heap * 1000:>7.1f}ms")
+    print(f"{'top 10 via full sort':<34} {full_sort * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Microbenchmark: date normalization engine versus the original implementation.
+
+Times the original `re.search` + `strptime` function against
+`src.data.dates.normalize_date` (cold and warm cache) and the
+`normalize_dates` batch API on a realistic mix of raw date strings.
+
+Usage (from the project root):
+    python -m benchmarks.bench_normalize_date
+"""
+
+import random
+import re
+import time
+from datetime import datetime
+
+from src.data.dates import clear_date_cache, normalize_date, normalize_dates
+
+ROWS = 500_000
+
+
+def legacy_normalize_date(date_str):
+    """The original implementation, kept here as the baseline."""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    try:
+        date_match = re.search(r"\d{4}[-/]\d{2}[-/]\d{2}", date_str)
+        if date_match:
+            dt = datetime.strptime(
+                date_match.group(),
+                "%Y-%m-%d" if "-" in date_match.group() else "%Y/%m/%d",
+            )
+            return dt.strftime("%Y-%m-%d")
+    except Exception:
+        pass
+    return None
+
+
+def build_column(rows):
+    """Mix of formats seen across sources, with realistic repetition."""
+    rng = random.Random(7)
+    column = []
+    for _ in range(rows):
+        month, day, hour = rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23)
+        column.append(rng.choice([
+            f"2025-{month:02d}-{day:02d}T{hour:02d}:{rng.randint(0, 59):02d}:00+00:00",
+            f"2025-{month:02d}-{day:02d}",
+            f"2025/{month:02d}/{day:02d}",
+            f"Tue, {day} Jun 2025 {hour:02d}:00:00 +0000",
+            "N/A",
+        ]))
+    return column
+
+
+def timed(label, func):
+    """Run `func` once and print its duration."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:>8.3f}s  {ROWS / elapsed / 1e6:>6.2f} M rows/s")
+
+
+def main():
+    column = build_column(ROWS)
+    timed("legacy normalize_date", lambda: [legacy_normalize_date(v) for v in column])
+    clear_date_cache()
+    timed("normalize_date (cold cache)", lambda: [normalize_date(v) for v in column])
+    timed("normalize_date (warm cache)", lambda: [normalize_date(v) for v in column])
+    clear_date_cache()
+    timed("normalize_dates (batch)", lambda: normalize_dates(column))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: raw-article processing time versus worker count.
+
+Generates a synthetic raw directory (several indented JSON array files, as the
+scrapers write them, plus one large JSON Lines file; both kinds get sharded)
+and times `stream_raw_articles` with an increasing number of worker processes.
+
+Usage (from the project root):
+    python -m benchmarks.bench_parallel_processing [articles_per_file]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import src.data.processors as processors
+
+FILES = 8
+
+
+def synthetic_article(i):
+    """Build one raw article record; every 10th link is a duplicate."""
+    return {
+        "title": f"Synthetic headline number {i} about markets and policy",
+        "link": f"https://example.com/news/{i - i % 10 if i % 10 == 9 else i}",
+        "category": ("europe", "business", "tech")[i % 3],
+        "published": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00+00:00",
+    }
+
+
+def build_raw_dir(raw_dir, per_file):
+    """Write FILES JSON arrays and one JSON Lines file of the same total size."""
+    for n in range(FILES):
+        with open(os.path.join(raw_dir, f"part_{n}.json"), "w", encoding="utf-8") as f:
+            json.dump([synthetic_article(n * per_file + i) for i in range(per_file)], f, indent=2)
+    with open(os.path.join(raw_dir, "stream.jsonl"), "w", encoding="utf-8") as f:
+        for i in range(FILES * per_file):
+            f.write(json.dumps(synthetic_article(10 ** 8 + i)) + "\n")
+
+
+def main():
+    per_file = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, max(cores, 4) + 1)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        processors.RAW_DIR = os.path.join(tmp, "raw")
+        processors.PROCESSED_PATH = os.path.join(tmp, "processed", "cleaned_articles.json")
+        processors.SHARD_BYTES = 8 * 1024 * 1024
+        os.makedirs(processors.RAW_DIR)
+        build_raw_dir(processors.RAW_DIR, per_file)
+        start = time.perf_counter()
+        tasks = processors.plan_raw_tasks()
+        print(f"{len(tasks)} tasks from {FILES + 1} files, planned in {time.perf_counter() - start:.2f}s\n")
+
+        print(f"{'workers':>8} {'seconds':>8} {'speedup':>8} {'cleaned':>10}")
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            stats = processors.stream_raw_articles(workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>8.2f} {baseline / elapsed:>8.2f} {stats.cleaned:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: loading cleaned articles from JSON vs the partitioned Parquet store.
+
+Generates a synthetic corpus (ROWS articles spread over 24 months and 4
+sources), writes it both as the pretty-printed `cleaned_articles.json` and
+as the month/source-partitioned Parquet store, then reports for:
+
+- the full JSON load every analysis job used to do
+- the trend analysis columns (title, category, published) from Parquet
+- one month of one source from Parquet
+
+the load time (best of ROUNDS) and the size of the files scanned (Parquet
+reads only the requested column chunks of those).
+
+Usage (from the project root):
+    python -m benchmarks.bench_parquet_store [rows]
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROUNDS = 3
+SOURCES = ["npr.org", "euronews.com", "theverge.com", "aljazeera.com"]
+CATEGORIES = ["news", "politics", "climate", "culture", "tech", "business", "science", "sport"]
+WORDS = "budget vote heat wave film festival chip exports election storm market court".split()
+
+
+def make_articles(rows):
+    rng = random.Random(7)
+    for i in range(rows):
+        source = SOURCES[i % len(SOURCES)]
+        year, month = 2024 + (i // 13) % 2, (i % 12) + 1
+        yield {
+            "title": " ".join(rng.choices(WORDS, k=8)).capitalize(),
+            "link": f"https://www.{source}/{year}/{month:02d}/story-{i}",
+            "category": rng.choice(CATEGORIES),
+            "published": f"{year}-{month:02d}-{rng.randint(1, 28):02d}",
+        }
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parquet_bytes(directory, months=None, sources=None):
+    total = 0
+    for root, _, files in os.walk(directory):
+        parts = dict(p.split("=", 1) for p in os.path.relpath(root, directory).split(os.sep) if "=" in p)
+        if months and parts.get("month") not in months:
+            continue
+        if sources and parts.get("source") not in sources:
+            continue
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def main():
+    from src.data.parquet_store import (
+        ParquetArticleWriter,
+        load_articles_frame,
+        load_articles_table,
+        table_to_records,
+    )
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    logging.getLogger("news_logger").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "cleaned_articles.json")
+        store = os.path.join(tmp, "articles")
+        articles = list(make_articles(rows))
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(articles, f, indent=2, ensure_ascii=False)
+        with ParquetArticleWriter(store) as writer:
+            for article in articles:
+                writer.write(article)
+        del articles
+
+        def load_json():
+            with open(json_path, encoding="utf-8") as f:
+                return json.load(f)
+
+        columns = ["title", "category", "published"]
+        cases = [
+            ("json, all columns", load_json, os.path.getsize(json_path)),
+            (
+                "parquet, trend columns (dicts)",
+                lambda: table_to_records(load_articles_table(columns, directory=store)),
+                parquet_bytes(store),
+            ),
+            (
+                "parquet, trend columns (arrow)",
+                lambda: load_articles_table(columns, directory=store),
+                parquet_bytes(store),
+            ),
+            (
+                "parquet, trend columns (pandas)",
+                lambda: load_articles_frame(columns, directory=store),
+                parquet_bytes(store),
+            ),
+            (
+                "parquet, 1 month x 1 source",
+                lambda: load_articles_table(columns, months=["2025-05"], sources=["npr.org"], directory=store),
+                parquet_bytes(store, months=["2025-05"], sources=["npr.org"]),
+            ),
+        ]
+
+        print(f"{rows:,} articles\n")
+        print(f"{'load':<32} {'seconds':>8} {'MiB files':>9} {'speedup':>8}")
+        baseline = None
+        for name, func, size in cases:
+            seconds = best_of(func)
+            baseline = baseline or seconds
+            print(f"{name:<32} {seconds:>8.2f} {size / 2**20:>9.1f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
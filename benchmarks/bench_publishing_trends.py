@@ -0,0 +1,100 @@
+"""
+Benchmark: publishing-activity trends, per-row loop vs vectorized pandas.
+
+Builds a synthetic article frame (ROWS articles over three years, 8
+categories, 4 sources) and times:
+
+- the previous implementation: `datetime.fromisoformat` per article, then
+  `value_counts` and a 7-observation rolling mean (run on at most
+  LEGACY_ROWS articles and extrapolated)
+- parsing the `published` column with one `pd.to_datetime` call, and with
+  `dataset.parse_dates` (each distinct date parsed once)
+- dense daily counts with 7D/30D rolling means overall
+- the same per category and per source (`trends.activity_by`)
+
+Usage (from the project root):
+    python -m benchmarks.bench_publishing_trends [rows]
+"""
+
+import sys
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+LEGACY_ROWS = 1_000_000
+CATEGORIES = ["news", "politics", "climate", "culture", "tech", "business", "science", "sport"]
+SOURCES = ["npr.org", "euronews.com", "theverge.com", "aljazeera.com"]
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(7)
+    days = pd.date_range("2023-01-01", "2025-12-31", freq="D").strftime("%Y-%m-%d").to_numpy()
+    return pd.DataFrame(
+        {
+            "published": days[rng.integers(0, len(days), rows)],
+            "category": pd.Categorical.from_codes(rng.integers(0, len(CATEGORIES), rows), CATEGORIES),
+            "source": pd.Categorical.from_codes(rng.integers(0, len(SOURCES), rows), SOURCES),
+        }
+    )
+
+
+def legacy_trend(articles):
+    """The loop analyze_publishing_activity used before it was vectorized."""
+    dates = []
+    for a in articles:
+        published = a.get("published", "")
+        try:
+            dt = datetime.fromisoformat(published.replace(" +02:00", "").replace(" +00:00", ""))
+            dates.append(dt.date())
+        except Exception:
+            continue
+    df = pd.DataFrame(dates, columns=["date"])
+    trend = df["date"].value_counts().sort_index()
+    trend.index = pd.to_datetime(trend.index)
+    return trend.rolling(window=7).mean()
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    from src.analysis.dataset import parse_dates
+    from src.analysis.trends import activity_by, daily_counts, rolling_activity
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    df = make_frame(rows)
+    print(f"{rows:,} articles\n")
+
+    legacy_rows = min(rows, LEGACY_ROWS)
+    records = [{"published": p} for p in df["published"].iloc[:legacy_rows]]
+    legacy, _ = timed(lambda: legacy_trend(records))
+    legacy *= rows / legacy_rows
+    del records
+
+    to_datetime, _ = timed(
+        lambda: pd.to_datetime(df["published"], format="%Y-%m-%d", errors="coerce", cache=True)
+    )
+    parse, df["date"] = timed(lambda: parse_dates(df["published"]))
+    overall, _ = timed(lambda: rolling_activity(daily_counts(df)))
+    by_category, _ = timed(lambda: activity_by(df, "category"))
+    by_source, _ = timed(lambda: activity_by(df, "source"))
+
+    print(f"{'step':<36} {'seconds':>8}")
+    note = "" if legacy_rows == rows else f"  (extrapolated from {legacy_rows:,})"
+    print(f"{'legacy loop (overall 7-obs mean)':<36} {legacy:>8.2f}{note}")
+    print(f"{'pd.to_datetime on published':<36} {to_datetime:>8.2f}")
+    print(f"{'parse_dates on published':<36} {parse:>8.2f}")
+    print(f"{'daily counts + 7D/30D overall':<36} {overall:>8.2f}")
+    print(f"{'7D/30D per category':<36} {by_category:>8.2f}")
+    print(f"{'7D/30D per source':<36} {by_source:>8.2f}")
+    same_work = parse + overall
+    print(f"{'parse + overall (legacy equivalent)':<36} {same_work:>8.2f}  ({legacy / same_work:.0f}x faster)")
+    print(f"{'everything vectorized':<36} {same_work + by_category + by_source:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: report statistics from rollup tables vs scanning `articles`.
+
+Fills a fresh temporary database with N synthetic articles over three years
+and times:
+
+- `insert_articles` with the daily-count triggers, and with them dropped
+- `refresh_keyword_rollups` over the whole table (the one-off backfill) and
+  after a further 1% of new articles (the per-run cost)
+- the report statistics (total, per category, per day, top days, top
+  keywords) read from the rollups, and the same aggregates computed with
+  GROUP BY over `articles` and a keyword count over every title
+
+Usage (from the project root):
+    python -m benchmarks.bench_rollups [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from src.analysis.keywords import KeywordEngine, top_terms
+from src.data import database, queries, rollups
+from src.data.models import NewsArticle
+
+WORDS = ["budget", "climate", "election", "market", "summit", "storm", "court", "vote", "energy", "trade"]
+CATEGORIES = ["europe", "business", "tech", "politics", "climate"]
+TRIGGERS = ["daily_counts_insert", "daily_counts_delete", "daily_counts_update_old", "daily_counts_update_new"]
+
+
+def synthetic_articles(start, rows):
+    """Yield NewsArticle objects with unique links spread over ~1100 days."""
+    for i in range(start, start + rows):
+        day = i % 1096
+        yield NewsArticle(
+            title=f"{WORDS[i % 10]} {WORDS[i // 10 % 10]} talks {WORDS[i // 100 % 10]} {i}",
+            link=f"https://example.com/news/{i}",
+            category=CATEGORIES[i % 5],
+            published=f"{2023 + day // 365}-{day % 365 // 31 % 12 + 1:02d}-{day % 28 + 1:02d}",
+            source="example.com",
+        )
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def scan_statistics(conn):
+    """The report statistics computed over every stored article."""
+    conn.execute("SELECT COUNT(*) FROM articles WHERE published_date IS NOT NULL").fetchone()
+    conn.execute("SELECT category, COUNT(*) FROM articles GROUP BY category").fetchall()
+    conn.execute("SELECT published_date, COUNT(*) FROM articles GROUP BY published_date").fetchall()
+    titles = (row[0] for row in conn.execute("SELECT title FROM articles"))
+    return top_terms(KeywordEngine().count(titles), 10)
+
+
+def rollup_statistics():
+    queries.total_articles()
+    queries.count_by_category()
+    queries.count_by_day()
+    queries.top_days(5)
+    return queries.top_keywords(10)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    engine = KeywordEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        plain_db = os.path.join(tmp, "plain.db")
+        database.DB_PATH = plain_db
+        database.create_table()
+        with database.get_connection() as conn:
+            for trigger in TRIGGERS:
+                conn.execute(f"DROP TRIGGER {trigger}")
+        plain, _ = timed(lambda: database.insert_articles(synthetic_articles(0, rows)))
+
+        database.DB_PATH = os.path.join(tmp, "news.db")
+        database.create_table()
+        triggered, _ = timed(lambda: database.insert_articles(synthetic_articles(0, rows)))
+        with database.get_connection() as conn:
+            backfill, _ = timed(lambda: rollups.refresh_keyword_rollups(conn, engine))
+        new_rows = max(1, rows // 100)
+        database.insert_articles(synthetic_articles(rows, new_rows))
+        with database.get_connection() as conn:
+            incremental, _ = timed(lambda: rollups.refresh_keyword_rollups(conn, engine))
+            scan, expected = timed(lambda: scan_statistics(conn))
+        read, result = timed(rollup_statistics)
+        assert [count for _, count in result] == [count for _, count in expected]
+
+    print(f"{rows:,} articles\n")
+    print(f"{'step':<40} {'seconds':>8}")
+    print(f"{'insert without triggers':<40} {plain:>8.2f}")
+    print(f"{'insert with daily-count triggers':<40} {triggered:>8.2f}  (+{triggered / plain - 1:.0%})")
+    print(f"{'keyword rollup backfill':<40} {backfill:>8.2f}")
+    print(f"{f'keyword refresh after {new_rows:,} new':<40} {incremental:>8.2f}")
+    print(f"{'statistics by full scan':<40} {scan:>8.2f}")
+    print(f"{'statistics from rollups':<40} {read:>8.3f}  ({scan / read:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: Scrapy crawl with and without listing-page date extraction.
+
+Serves the saved archive fixture (tests/fixtures/theverge_archive.html) from
+a local HTTP server as N archive pages with a fixed per-response latency,
+then runs GenericNewsSpider over it twice — fetching every article page, and
+taking dates from the listing when available — and reports request counts
+and wall time. Each crawl runs in its own process because the Twisted
+reactor cannot be restarted.
+
+Usage (from the project root):
+    python -m benchmarks.bench_spider_listing [pages] [latency_seconds]
+"""
+
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def make_handler(pages, latency):
+    """Build a handler serving `pages` archive pages plus article pages."""
+    with open(os.path.join(FIXTURES, "theverge_archive.html"), encoding="utf-8") as f:
+        archive = f.read()
+    with open(os.path.join(FIXTURES, "theverge_article.html"), encoding="utf-8") as f:
+        article = f.read().encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            match = re.fullmatch(r"/news/archives/(\d+)", self.path)
+            if match and int(match.group(1)) <= pages:
+                base = f"http://{self.headers['Host']}"
+                body = (
+                    archive.replace("https://www.theverge.com", base)
+                    .replace("/news/", f"/news/p{match.group(1)}/")
+                    .encode()
+                )
+            elif self.path.startswith("/news/p"):
+                body = article
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def crawl(base_url, listing_dates, results):
+    """Run one crawl in this process and report (requests, items, seconds)."""
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+    from src.scrapers.scrapy_crawler.scrapy_crawler import GenericNewsSpider
+
+    settings = get_project_settings()
+    settings.setdict(
+        {
+            "ITEM_PIPELINES": {},
+            "DOWNLOADER_MIDDLEWARES": {},
+            "DOWNLOAD_DELAY": 0,
+            "DOWNLOAD_SLOTS": {},
+            "LOG_ENABLED": False,
+        },
+        priority="cmdline",
+    )
+    process = CrawlerProcess(settings)
+    crawler = process.create_crawler(GenericNewsSpider)
+    started = time.perf_counter()
+    process.crawl(
+        crawler,
+        frontier=False,
+        listing_dates=listing_dates,
+        allowed_domains=["127.0.0.1"],
+        start_urls=[f"{base_url}/news/archives/1"],
+    )
+    process.start()
+    elapsed = time.perf_counter() - started
+    stats = crawler.stats.get_stats()
+    results.put(
+        (stats.get("downloader/request_count", 0), stats.get("item_scraped_count", 0), elapsed)
+    )
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(pages, latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    print(f"{pages} archive pages x 10 articles, {latency * 1000:.0f} ms per response\n")
+    ctx = multiprocessing.get_context("spawn")
+    timings = {}
+    for label, listing_dates in (("article fetches", False), ("listing dates", True)):
+        results = ctx.Queue()
+        proc = ctx.Process(target=crawl, args=(base_url, listing_dates, results))
+        proc.start()
+        requests, items, elapsed = results.get()
+        proc.join()
+        timings[label] = elapsed
+        print(f"{label:<16} {requests:>5} requests  {items:>5} items  {elapsed:6.2f}s")
+
+    server.shutdown()
+    print(f"\nspeedup: {timings['article fetches'] / timings['listing dates']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: per-row SQLite inserts versus the chunked bulk writer.
+
+Inserts N synthetic articles into a fresh temporary database with the
+original execute-per-row loop and with `insert_articles`, then re-inserts
+the same rows to measure the duplicate (ignored) path.
+
+Usage (from the project root):
+    python -m benchmarks.bench_sqlite_insert [rows]
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from src.data import database
+from src.data.models import NewsArticle
+
+
+def synthetic_articles(rows):
+    """Yield NewsArticle objects with unique links."""
+    for i in range(rows):
+        yield NewsArticle(
+            title=f"Synthetic headline number {i}",
+            link=f"https://example.com/news/{i}",
+            category=("europe", "business", "tech")[i % 3],
+            published=f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            source="example.com",
+        )
+
+
+def legacy_insert(articles):
+    """The original loop: one execute per row, default journal settings."""
+    conn = sqlite3.connect(database.DB_PATH)
+    cursor = conn.cursor()
+    for article in articles:
+        try:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO articles (title, link, category, published, source)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                database.article_row(article),
+            )
+        except Exception as e:
+            print(f"Error inserting article: {article.title} -> {e}")
+    conn.commit()
+    conn.close()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, insert in (("legacy", legacy_insert), ("bulk", database.insert_articles)):
+            database.DB_PATH = os.path.join(tmp, f"{label}.db")
+            database.create_table()
+            for phase in ("insert", "re-insert"):
+                start = time.perf_counter()
+                result = insert(synthetic_articles(rows))
+                elapsed = time.perf_counter() - start
+                print(f"{label:>7} {phase:<10} {rows:>9} rows {elapsed:>7.2f}s  {result or ''}")
+
+
+if __name__ == "__main__":
+    main()
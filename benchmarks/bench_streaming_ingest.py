@@ -0,0 +1,78 @@
+"""
+Benchmark: peak memory of raw-article processing versus input size.
+
+Generates synthetic raw JSON files of increasing size and runs both
+`process_raw_articles` (in-memory) and `stream_raw_articles` (streaming)
+in a fresh subprocess each, reporting wall time and peak RSS.
+
+Usage (from the project root):
+    python -m benchmarks.bench_streaming_ingest
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SIZES = [10_000, 100_000, 500_000]
+
+CHILD = """
+import resource, sys
+import src.data.processors as p
+p.RAW_DIR, p.PROCESSED_PATH = sys.argv[1], sys.argv[2]
+if sys.argv[3] == "stream":
+    p.stream_raw_articles()
+else:
+    p.process_raw_articles()
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_raw_file(path, count):
+    """Write `count` synthetic articles as a single JSON array."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i in range(count):
+            article = {
+                "title": f"Synthetic headline number {i} about markets and policy",
+                "link": f"https://example.com/news/{i}/synthetic-headline",
+                "category": ("europe", "business", "tech")[i % 3],
+                "published": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00+00:00",
+            }
+            f.write(("," if i else "") + json.dumps(article))
+        f.write("]")
+
+
+def run_mode(raw_dir, out_path, mode):
+    """Run one processing mode in a subprocess and return (seconds, peak RSS in MB)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, raw_dir, out_path, mode],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, int(result.stdout.strip().splitlines()[-1]) / 1024
+
+
+def main():
+    print(f"{'articles':>10} {'file MB':>8} {'mode':>7} {'seconds':>8} {'peak MB':>8}")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            raw_dir = os.path.join(tmp, "raw")
+            os.makedirs(raw_dir)
+            raw_path = os.path.join(raw_dir, "synthetic.json")
+            write_raw_file(raw_path, size)
+            file_mb = os.path.getsize(raw_path) / 1024 / 1024
+            out_path = os.path.join(tmp, "processed", "cleaned_articles.json")
+
+            for mode in ("memory", "stream"):
+                elapsed, peak = run_mode(raw_dir, out_path, mode)
+                print(f"{size:>10} {file_mb:>8.1f} {mode:>7} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+dataset.py
+
+Shared, cached view of the cleaned articles for the analysis and export
+entry points.
+
+`get_dataset()` returns one process-wide `ArticleDataset`. Its `frame()`
+loads the processed articles once into a typed DataFrame:
+
+- `category` and `source` as categoricals
+- `date` as datetime64 (parsed from `published`, NaT when missing)
+- `title`, `link` and `published` unchanged
+
+The loaded frame is cached together with a fingerprint of the processed
+files (size and modification time), so trends, export and any later call in
+the same run share one parse; the frame is reloaded only after the files
+change. The Parquet store (`processed/articles/`) is read when it exists,
+otherwise `cleaned_articles.json`.
+
+`processed_records()` returns the cleaned records exactly as processing
+wrote them to `cleaned_articles.json` (every key, processing order) for the
+exports; a JSON-backed frame is built from the same parse.
+
+With `analysis.snapshot` enabled in `config/settings.yaml`, the typed frame
+is also pickled to `analysis.snapshot_path` with its fingerprint, so the
+next run skips parsing when the processed data has not changed.
+"""
+
+import json
+import os
+import threading
+import pandas as pd
+from src.utils.helpers import load_config, source_from_link
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+PROCESSED_PATH = "data_output/processed/cleaned_articles.json"
+SNAPSHOT_PATH = "data_output/cache/articles_snapshot.pkl"
+ARTICLE_FIELDS = ["title", "link", "category", "published"]
+CATEGORICAL_COLUMNS = ["category", "source"]
+
+
+def _parquet_store():
+    try:
+        from src.data import parquet_store
+    except ImportError:
+        return None
+    return parquet_store
+
+
+def parse_dates(published):
+    """
+        Parse a column of YYYY-MM-DD strings into datetime64, NaT when invalid.
+
+        Each distinct value is parsed once: a corpus spans a few thousand
+        days however many articles it holds.
+
+        Args:
+            published (pandas.Series): Normalized publication dates.
+
+        Returns:
+            pandas.Series: datetime64 dates with the same index.
+    """
+    codes, uniques = pd.factorize(published)
+    parsed = pd.to_datetime(uniques, format="%Y-%m-%d", errors="coerce")
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=published.index
+    )
+
+
+def _typed_frame(df):
+    """Give a raw article frame the dataset's column types."""
+    for name in ARTICLE_FIELDS:
+        if name not in df:
+            df[name] = None
+    if "source" not in df:
+        df["source"] = df["link"].map(source_from_link)
+    df = df[ARTICLE_FIELDS + ["source"]].copy()
+    for name in CATEGORICAL_COLUMNS:
+        df[name] = df[name].astype("category")
+    df["date"] = parse_dates(df["published"])
+    return df
+
+
+class ArticleDataset:
+    """
+        Cleaned articles loaded once and cached until the processed files change.
+
+        Args:
+            processed_path (str, optional): Processed JSON file; the Parquet
+                store is looked up in `articles/` next to it. Defaults to
+                PROCESSED_PATH.
+            snapshot_path (str, optional): Where to persist the typed frame
+                between runs; no snapshot when omitted.
+    """
+
+    def __init__(self, processed_path=None, snapshot_path=None):
+        self.processed_path = processed_path or PROCESSED_PATH
+        self.snapshot_path = snapshot_path
+        self.loads = 0
+        self._frame = None
+        self._fingerprint = None
+        self._records = None
+        self._records_fingerprint = None
+        self._lock = threading.Lock()
+
+    @property
+    def parquet_dir(self):
+        return os.path.join(os.path.dirname(self.processed_path), "articles")
+
+    def _uses_parquet(self):
+        store = _parquet_store()
+        return bool(store and store.has_parquet_store(self.parquet_dir))
+
+    def fingerprint(self):
+        """Return a cheap (format, files, bytes, newest mtime) key for the processed data."""
+        if self._uses_parquet():
+            files = size = newest = 0
+            for root, _, names in os.walk(self.parquet_dir):
+                for name in names:
+                    stat = os.stat(os.path.join(root, name))
+                    files += 1
+                    size += stat.st_size
+                    newest = max(newest, stat.st_mtime_ns)
+            return ("parquet", files, size, newest)
+        return self._json_fingerprint()
+
+    def _json_fingerprint(self):
+        stat = os.stat(self.processed_path)
+        return ("json", 1, stat.st_size, stat.st_mtime_ns)
+
+    def _load_records(self):
+        """Parse cleaned_articles.json unless it is unchanged since the last parse (call with the lock held)."""
+        fingerprint = self._json_fingerprint()
+        if self._records is None or fingerprint != self._records_fingerprint:
+            self.loads += 1
+            with open(self.processed_path, "r", encoding="utf-8") as f:
+                self._records = json.load(f)
+            self._records_fingerprint = fingerprint
+        return self._records
+
+    def _read(self):
+        """Parse the processed files into a typed frame."""
+        if self._uses_parquet():
+            self.loads += 1
+            df = _parquet_store().load_articles_frame(
+                ARTICLE_FIELDS + ["source"], directory=self.parquet_dir
+            )
+        else:
+            df = pd.DataFrame(self._load_records())
+        return _typed_frame(df)
+
+    def _read_snapshot(self, fingerprint):
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            snapshot = pd.read_pickle(self.snapshot_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable dataset snapshot {self.snapshot_path}: {e}")
+            return None
+        if snapshot.get("fingerprint") != fingerprint:
+            return None
+        return snapshot["frame"]
+
+    def _write_snapshot(self, fingerprint, df):
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.snapshot_path}.tmp"
+        pd.to_pickle({"fingerprint": fingerprint, "frame": df}, tmp_path)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def frame(self):
+        """
+            Return the typed article DataFrame, loading it only when needed.
+
+            Returns:
+                pandas.DataFrame: title, link, category, published, source, date.
+        """
+        with self._lock:
+            fingerprint = self.fingerprint()
+            if self._frame is not None and fingerprint == self._fingerprint:
+                return self._frame
+
+            df = self._read_snapshot(fingerprint)
+            if df is not None:
+                logger.info(f"📦 Loaded {len(df)} articles from snapshot {self.snapshot_path}")
+            else:
+                df = self._read()
+                logger.info(f"📦 Loaded {len(df)} articles into the analysis dataset")
+                if self.snapshot_path:
+                    self._write_snapshot(fingerprint, df)
+
+            self._frame, self._fingerprint = df, fingerprint
+            return df
+
+    def records(self, columns=None):
+        """
+            Return articles as dictionaries, with missing values as None.
+
+            Args:
+                columns (list, optional): Fields to include. Defaults to ARTICLE_FIELDS.
+
+            Returns:
+                list: One dictionary per article.
+        """
+        columns = columns or ARTICLE_FIELDS
+        df = self.frame()
+        values = []
+        for name in columns:
+            column = df[name].astype(object)
+            values.append(column.where(column.notna(), None).tolist())
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+    def processed_records(self):
+        """
+            Return the cleaned records exactly as stored in cleaned_articles.json.
+
+            Unlike `frame()` and `records()`, every key of every record is kept
+            and the rows stay in processing order (the Parquet store is
+            ordered by partition and stores the article fields only).
+
+            Returns:
+                list: One dictionary per article; cached until the file changes.
+        """
+        with self._lock:
+            return self._load_records()
+
+    def invalidate(self):
+        """Drop the cached frame and records so the next call reloads them."""
+        with self._lock:
+            self._frame = self._fingerprint = None
+            self._records = self._records_fingerprint = None
+
+
+_shared_dataset = None
+_shared_lock = threading.Lock()
+
+
+def get_dataset():
+    """
+        Return the process-wide ArticleDataset.
+
+        Reads `analysis.snapshot` and `analysis.snapshot_path` from
+        `config/settings.yaml` on first use.
+    """
+    global _shared_dataset
+    with _shared_lock:
+        if _shared_dataset is None:
+            try:
+                settings = load_config().get("analysis", {})
+            except OSError:
+                settings = {}
+            snapshot_path = None
+            if settings.get("snapshot", False):
+                snapshot_path = settings.get("snapshot_path", SNAPSHOT_PATH)
+            _shared_dataset = ArticleDataset(snapshot_path=snapshot_path)
+        return _shared_dataset
@@ -12,7 +12,7 @@ Description:
 import os
 import json
 import pandas as pd
-from src.analysis.trends import load_articles
+from src.analysis.dataset import get_dataset
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -26,7 +26,8 @@ def export_cleaned_articles():
     Export cleaned articles to CSV, JSON, and Excel formats.
 
     This function:
-    - Loads cleaned article data from the processed JSON file.
+    - Takes the cleaned records from the shared analysis dataset exactly as
+      processing wrote them: every field, in processing order.
     - Saves the data as:
         - CSV → data_output/exports/articles.csv
         - JSON → data_output/exports/articles.json
@@ -35,7 +36,7 @@ def export_cleaned_articles():
     """
     logger.info("📤 Starting data export...")
 
-    articles = load_articles()
+    articles = get_dataset().processed_records()
     df = pd.DataFrame(articles)
 
     try:
@@ -0,0 +1,289 @@
+"""
+keywords.py
+
+Keyword extraction engine for article titles.
+
+Titles are counted in chunks: each chunk is joined into one lower-cased
+string instead of running `re.findall` per title. Keywords are counted
+per distinct whitespace-separated piece and only those pieces go through
+the precompiled tokenizer and stopword set. For n-grams stopwords are
+removed first and the grams are built from the remaining tokens without
+crossing title boundaries. With `workers > 1`
+chunks are counted on a process pool and the per-chunk Counters merged.
+
+Counts can be split by a key per title (e.g. its date or category), and
+top-N lists use a heap (`heapq.nlargest`) instead of sorting the whole
+vocabulary.
+
+Settings come from the `analysis.keywords` section of `config/settings.yaml`:
+
+    analysis:
+      keywords:
+        workers: 1
+        ngrams: [1, 2]
+        extra_stopwords: ["says"]
+        stopwords_file: null    # one word per line, replaces the defaults
+"""
+
+import heapq
+import os
+import re
+import threading
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+import numpy as np
+import pandas as pd
+from src.utils.helpers import load_config
+
+CHUNK_SIZE = 250_000
+
+# A keyword is 3+ ASCII letters; TOKEN_RE also returns the newlines that
+# separate the titles of a chunk
+WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+TOKEN_RE = re.compile(r"\b[a-z]{3,}\b|\n")
+
+DEFAULT_STOPWORDS = frozenset(
+    [
+        "the", "is", "on", "at", "to", "of", "and", "a", "in", "with",
+        "as", "for", "from", "by", "an", "this", "that", "be", "are", "it",
+        "its", "or", "we", "our", "but", "will", "not", "has", "have", "was",
+        "you", "they", "about", "how", "who", "what", "when", "why", "which", "can",
+        "all", "new", "more", "just", "their", "out",
+    ]
+)
+
+NGRAM_NAMES = {1: "keywords", 2: "bigrams", 3: "trigrams"}
+
+
+def load_stopwords(settings=None):
+    """
+        Build the stopword set from the `analysis.keywords` settings.
+
+        Args:
+            settings (dict, optional): The `analysis.keywords` config section.
+
+        Returns:
+            frozenset: DEFAULT_STOPWORDS (or the words of `stopwords_file`)
+            plus `extra_stopwords`.
+    """
+    settings = settings or {}
+    words = set(DEFAULT_STOPWORDS)
+    if settings.get("stopwords_file"):
+        with open(settings["stopwords_file"], "r", encoding="utf-8") as f:
+            words = {line.strip().lower() for line in f if line.strip()}
+    words.update(word.lower() for word in settings.get("extra_stopwords", []))
+    return frozenset(words)
+
+
+def count_terms(text, n, stopwords):
+    """
+        Count the n-grams of a block of newline-separated, lower-cased titles.
+
+        Keywords are counted per distinct whitespace-separated chunk, so the
+        regex and stopword checks run once per distinct chunk rather than
+        once per word. N-grams are counted over the filtered token sequence as
+        integer codes and never span two titles.
+
+        Args:
+            text (str): Titles joined with newlines, already lower-cased.
+            n (int): 1 for keywords, 2 for bigrams, 3 for trigrams.
+            stopwords (frozenset): Tokens dropped before n-grams are formed.
+
+        Returns:
+            Counter: Term (n-gram joined with a space) -> count.
+    """
+    if n == 1:
+        counts = Counter()
+        # Regex matches never span whitespace, so each distinct
+        # whitespace-separated chunk is tokenized once and weighted
+        for chunk, repeats in Counter(text.split()).items():
+            if len(chunk) >= 3 and chunk.isascii() and chunk.isalpha():
+                if chunk not in stopwords:
+                    counts[chunk] += repeats
+                continue
+            for word in WORD_RE.findall(chunk):
+                if word not in stopwords:
+                    counts[word] += repeats
+        return counts
+
+    return _count_ngrams(TOKEN_RE.findall(text), n, stopwords)
+
+
+def _count_ngrams(tokens, n, stopwords):
+    """Count n-grams as int64 codes (token ids in base len(vocabulary)) with numpy."""
+    ids, vocabulary = pd.factorize(np.asarray(tokens, dtype=object))
+    dropped = np.fromiter((token in stopwords for token in vocabulary), bool, len(vocabulary))
+    ids = ids[~dropped[ids]]
+    size = len(vocabulary)
+    if len(ids) < n:
+        return Counter()
+    if size ** n >= 2 ** 63:
+        words = [vocabulary[i] for i in ids]
+        grams = Counter(zip(*(islice(words, i, None) for i in range(n))))
+        return Counter({" ".join(gram): count for gram, count in grams.items() if "\n" not in gram})
+
+    newline = np.flatnonzero(vocabulary == "\n")
+    keys = np.zeros(len(ids) - n + 1, dtype=np.int64)
+    valid = np.ones(len(keys), dtype=bool)
+    for i in range(n):
+        part = ids[i:len(ids) - n + 1 + i]
+        keys = keys * size + part
+        if len(newline):
+            valid &= part != newline[0]
+
+    unique, repeats = np.unique(keys[valid], return_counts=True)
+    terms = None
+    for i in reversed(range(n)):
+        words = vocabulary[(unique // size ** i) % size]
+        terms = words if terms is None else terms + " " + words
+    return Counter(dict(zip(terms.tolist(), repeats.tolist())))
+
+
+def _join(titles):
+    return "\n".join(title for title in titles if isinstance(title, str)).lower()
+
+
+def _count_chunk(task):
+    """Pool task: count one chunk, overall or per key."""
+    titles, keys, n, stopwords = task
+    if keys is None:
+        return count_terms(_join(titles), n, stopwords)
+
+    grouped = defaultdict(list)
+    for key, title in zip(keys, titles):
+        grouped[key].append(title)
+    return {
+        key: count_terms(_join(group), n, stopwords) for key, group in grouped.items()
+    }
+
+
+def _chunks(titles, keys, size):
+    titles = iter(titles)
+    keys = iter(keys) if keys is not None else None
+    while True:
+        chunk = list(islice(titles, size))
+        if not chunk:
+            return
+        yield chunk, list(islice(keys, len(chunk))) if keys is not None else None
+
+
+def _merge(total, partial, by_key):
+    if not by_key:
+        total.update(partial)
+        return
+    for key, counts in partial.items():
+        total[key].update(counts)
+
+
+def top_terms(counts, n=10):
+    """
+        Return the `n` most frequent terms using a heap.
+
+        Args:
+            counts (Counter or dict): Term -> count.
+            n (int): Number of terms to keep.
+
+        Returns:
+            list: (term, count) pairs, most frequent first.
+    """
+    return heapq.nlargest(n, counts.items(), key=itemgetter(1))
+
+
+class KeywordEngine:
+    """
+        Counts keywords and n-grams across many titles.
+
+        Args:
+            stopwords (iterable, optional): Tokens to ignore. Defaults to
+                DEFAULT_STOPWORDS.
+            workers (int): Processes used for counting; 1 counts in-process.
+            chunk_size (int): Titles per chunk (and per pool task).
+    """
+
+    def __init__(self, stopwords=None, workers=1, chunk_size=CHUNK_SIZE):
+        self.stopwords = frozenset(stopwords) if stopwords is not None else DEFAULT_STOPWORDS
+        self.workers = max(1, int(workers))
+        self.chunk_size = chunk_size
+
+    def _run(self, titles, keys, n):
+        by_key = keys is not None
+        total = defaultdict(Counter) if by_key else Counter()
+        tasks = (
+            (chunk, chunk_keys, n, self.stopwords)
+            for chunk, chunk_keys in _chunks(titles, keys, self.chunk_size)
+        )
+
+        if self.workers == 1:
+            for task in tasks:
+                _merge(total, _count_chunk(task), by_key)
+            return total
+
+        # At most 2 * workers chunks in flight to bound memory
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_count_chunk, task))
+                if len(pending) >= self.workers * 2:
+                    _merge(total, pending.popleft().result(), by_key)
+            while pending:
+                _merge(total, pending.popleft().result(), by_key)
+        return total
+
+    def count(self, titles, n=1):
+        """
+            Count terms across all titles.
+
+            Args:
+                titles (iterable): Article titles (non-strings are skipped).
+                n (int): N-gram size.
+
+            Returns:
+                Counter: Term -> count.
+        """
+        return self._run(titles, None, n)
+
+    def count_by(self, titles, keys, n=1):
+        """
+            Count terms separately per key, e.g. per day or per category.
+
+            Args:
+                titles (iterable): Article titles.
+                keys (iterable): One key per title.
+                n (int): N-gram size.
+
+            Returns:
+                dict: Key -> Counter of terms.
+        """
+        return dict(self._run(titles, keys, n))
+
+
+_shared_engine = None
+_shared_ngrams = (1,)
+_shared_lock = threading.Lock()
+
+
+def get_keyword_engine():
+    """
+        Return the process-wide KeywordEngine and the configured n-gram sizes.
+
+        Reads the `analysis.keywords` section of `config/settings.yaml` (and the
+        stopword file) on first use only.
+
+        Returns:
+            tuple: (KeywordEngine, tuple of n-gram sizes).
+    """
+    global _shared_engine, _shared_ngrams
+    with _shared_lock:
+        if _shared_engine is None:
+            try:
+                settings = load_config().get("analysis", {}).get("keywords", {})
+            except OSError:
+                settings = {}
+            workers = settings.get("workers") or 1
+            if workers == "auto":
+                workers = os.cpu_count() or 1
+            _shared_engine = KeywordEngine(load_stopwords(settings), workers=workers)
+            _shared_ngrams = tuple(settings.get("ngrams") or (1,))
+        return _shared_engine, _shared_ngrams
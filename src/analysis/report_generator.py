@@ -3,17 +3,19 @@ report_generator.py
 
 Generates an HTML summary report of cleaned news articles using Jinja2 templates.
 Includes basic statistics and charts like publishing trends and category distribution.
+Statistics are read from the rollup tables maintained at ingest time (daily
+counts and title keyword counts), so rendering cost does not grow with the
+number of stored articles.
 """
 
 import os
-import json
 import time
 from jinja2 import Environment, FileSystemLoader
-import pandas as pd
+from src.data import queries
+from src.data.rollups import refresh_keyword_rollups
 
 REPORTS_DIR = "data_output/reports"
 TEMPLATES_DIR = "src/templates"
-PROCESSED_PATH = "data_output/processed/cleaned_articles.json"
 
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
@@ -22,11 +24,11 @@ def generate_html_report():
     """
     Generate an HTML summary report of cleaned article data.
 
-    - Loads cleaned articles from the processed JSON file.
-    - Computes basic statistics:
+    - Queries the articles database for basic statistics:
         - Total articles
         - Article count by category
         - Top 5 publishing dates
+        - Top 10 title keywords
     - Embeds charts (e.g., publishing trend, category distribution).
     - Renders the HTML using a Jinja2 template.
     - Saves the report to 'data_output/reports/summary_report.html'.
@@ -34,14 +36,11 @@ def generate_html_report():
     start = time.time()
     print("📄 Generating HTML report...", flush=True)
 
-    with open(PROCESSED_PATH, "r", encoding="utf-8") as f:
-        articles = json.load(f)
-
-    df = pd.DataFrame(articles)[["title", "category", "published"]]
-
-    total_articles = len(df)
-    categories = df["category"].value_counts().to_dict()
-    top_dates = df["published"].value_counts().nlargest(5).to_dict()
+    total_articles = queries.total_articles()
+    categories = dict(queries.count_by_category())
+    top_dates = dict(queries.top_days(5))
+    refresh_keyword_rollups()
+    top_keywords = dict(queries.top_keywords(10))
 
     env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
     template = env.get_template("report_template.html")
@@ -50,6 +49,7 @@ def generate_html_report():
         total_articles=total_articles,
         categories=categories,
         top_dates=top_dates,
+        top_keywords=top_keywords,
         chart_paths=["publishing_trend.png", "articles_by_category.png"],
     )
 
@@ -7,63 +7,169 @@ Performs trend analysis on cleaned news articles, including:
 - Article distribution by category
 
 Generates visual reports and data summaries stored in the reports directory.
+
+By default (`analysis.use_rollups` in `config/settings.yaml`) counts,
+keywords and the configured n-grams are read from the SQLite rollup tables
+that are updated as articles are inserted, so an analysis run does not reload
+the full history. Passing an article frame computes the same reports from the
+shared dataset instead.
 """
 
-import json
-from collections import Counter
-from datetime import datetime
 import matplotlib.pyplot as plt
-import pandas as pd
 import os
-import re
+import pandas as pd
+from src.analysis.dataset import get_dataset
+from src.analysis.keywords import NGRAM_NAMES, get_keyword_engine, top_terms
+from src.data import queries
+from src.data.rollups import refresh_keyword_rollups
+from src.utils.helpers import load_config
 
-PROCESSED_PATH = "data_output/processed/cleaned_articles.json"
 REPORTS_DIR = "data_output/reports"
+ROLLING_WINDOWS = ("7D", "30D")
 
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
 
-def load_articles():
+def load_articles(columns=None):
     """
-    Load cleaned article data from the processed JSON file.
+    Load cleaned articles from the shared analysis dataset.
+
+    Args:
+        columns (list, optional): Fields to include. Defaults to all article fields.
 
     Returns:
         list: A list of article dictionaries.
     """
-    with open(PROCESSED_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_dataset().records(columns)
 
 
-def analyze_publishing_activity(articles):
+def daily_counts(articles, by=None):
     """
-    Analyze and visualize article publishing frequency over time.
+    Count articles per calendar day on a dense daily index.
 
-    Applies a 7-day moving average to smooth out trends and saves a line chart
-    as 'publishing_trend.png' in the reports directory.
+    Days without articles are present with a count of 0, so rolling windows
+    cover calendar time rather than the dates that happen to have articles.
 
     Args:
-        articles (list): List of article dictionaries with 'published' dates.
+        articles (DataFrame): Article dataset frame with a datetime64 'date' column.
+        by (str, optional): Column to split the counts by ('category', 'source').
+
+    Returns:
+        Series or DataFrame: Counts per day, with one column per group when
+        `by` is given. Empty when no article has a date.
     """
-    dates = []
-    for a in articles:
-        published = a.get("published", "")
-        try:
-            dt = datetime.fromisoformat(
-                published.replace(" +02:00", "").replace(" +00:00", "")
-            )
-            dates.append(dt.date())
-        except Exception:
-            continue
+    if by is None:
+        counts = articles["date"].value_counts(sort=False).sort_index()
+    else:
+        counts = (
+            articles.groupby(["date", by], observed=True, sort=True)
+            .size()
+            .unstack(fill_value=0)
+        )
+    if counts.empty:
+        return counts
+    counts = counts.resample("D").sum()
+    counts.index.name = "date"
+    return counts
+
+
+def rollup_daily_counts(by=None):
+    """
+    Read daily counts from the `daily_counts` rollup on a dense daily index.
+
+    Args:
+        by (str, optional): 'category' or 'source' to split the counts by.
 
-    df = pd.DataFrame(dates, columns=["date"])
-    trend = df["date"].value_counts().sort_index()
-    trend.index = pd.to_datetime(trend.index)
+    Returns:
+        Series or DataFrame: Same layout as `daily_counts`.
+    """
+    if by is None:
+        rows = queries.count_by_day()
+        if not rows:
+            return pd.Series(dtype="int64")
+        days, values = zip(*rows)
+        counts = pd.Series(values, index=pd.to_datetime(days), dtype="int64")
+    else:
+        rows = queries.count_by_day_and_group(by)
+        if not rows:
+            return pd.DataFrame()
+        counts = (
+            pd.DataFrame(rows, columns=["date", by, "count"])
+            .assign(date=lambda df: pd.to_datetime(df["date"]))
+            .pivot(index="date", columns=by, values="count")
+            .fillna(0)
+            .astype("int64")
+        )
+    counts = counts.resample("D").sum()
+    counts.index.name = "date"
+    return counts
+
+
+def rolling_activity(counts, windows=ROLLING_WINDOWS):
+    """
+    Compute time-based rolling means of dense daily counts.
 
-    trend_smoothed = trend.rolling(window=7).mean()
+    Args:
+        counts (Series or DataFrame): Output of `daily_counts`.
+        windows (tuple): Pandas offsets such as '7D' and '30D'. The first days
+            of the range average over the days available so far.
+
+    Returns:
+        dict: Window -> rolling mean with the same shape as `counts`.
+    """
+    return {window: counts.rolling(window).mean() for window in windows}
+
+
+def activity_by(articles, by, windows=ROLLING_WINDOWS):
+    """
+    Daily counts and rolling averages per group, in long format.
+
+    Args:
+        articles (DataFrame): Article dataset frame.
+        by (str): Column to group by ('category' or 'source').
+        windows (tuple): Rolling windows, see `rolling_activity`.
+
+    Returns:
+        DataFrame: One row per (date, group) with 'count' and 'avg_<window>' columns.
+    """
+    return _activity_table(daily_counts(articles, by), by, windows)
+
+
+def _activity_table(counts, by, windows=ROLLING_WINDOWS):
+    """Stack per-group daily counts and their rolling means into long format."""
+    if counts.empty:
+        return pd.DataFrame(columns=["date", by, "count"] + [f"avg_{w.lower()}" for w in windows])
+    counts.columns = counts.columns.astype(str)
+    table = counts.stack().rename("count").to_frame()
+    for window, averages in rolling_activity(counts, windows).items():
+        table[f"avg_{window.lower()}"] = averages.stack()
+    table.index.names = ["date", by]
+    return table.reset_index()
+
+
+def analyze_publishing_activity(articles=None):
+    """
+    Analyze and visualize article publishing frequency over time.
+
+    Plots 7-day and 30-day rolling averages of the daily article count as
+    'publishing_trend.png', and writes the same averages per category and
+    per source to 'publishing_by_category.csv' / 'publishing_by_source.csv'
+    in the reports directory.
+
+    Args:
+        articles (DataFrame, optional): Article dataset frame with a datetime64
+            'date' column. Counts are read from the rollups when omitted.
+    """
+    counts = daily_counts(articles) if articles is not None else rollup_daily_counts()
+    if counts.empty:
+        print("⚠️ No dated articles to chart.")
+        return
+    rolling = rolling_activity(counts)
 
     plt.figure(figsize=(14, 6))
-    plt.plot(trend.index, trend_smoothed, color="dodgerblue", label="7-Day Moving Avg")
-    plt.fill_between(trend.index, trend_smoothed, color="skyblue", alpha=0.3)
+    plt.plot(counts.index, rolling["7D"], color="dodgerblue", label="7-Day Moving Avg")
+    plt.fill_between(counts.index, rolling["7D"], color="skyblue", alpha=0.3)
+    plt.plot(counts.index, rolling["30D"], color="darkorange", label="30-Day Moving Avg")
 
     plt.title("Articles Published per Date (Smoothed)")
     plt.xlabel("Date")
@@ -75,104 +181,110 @@ def analyze_publishing_activity(articles):
     plt.close()
     print("📊 Saved: publishing_trend.png")
 
+    for by in ("category", "source"):
+        if articles is None:
+            table = _activity_table(rollup_daily_counts(by), by)
+        elif by in articles:
+            table = activity_by(articles, by)
+        else:
+            continue
+        path = os.path.join(REPORTS_DIR, f"publishing_by_{by}.csv")
+        table.to_csv(path, index=False, float_format="%.3f")
+        print(f"📊 Saved: publishing_by_{by}.csv")
+
+
+def _write_top_terms(filename, header, rows):
+    with open(os.path.join(REPORTS_DIR, filename), "w", encoding="utf-8") as f:
+        f.write(header + "\n")
+        for row in rows:
+            f.write(",".join(str(value) for value in row) + "\n")
+    print(f"📊 Saved: {filename}")
+
+
+def _top_keywords_from_rollups(top_n):
+    """Write the keyword and n-gram reports from the keyword rollup tables."""
+    _, ngrams = get_keyword_engine()
+    refresh_keyword_rollups(ngrams=ngrams)
+    _write_top_terms("top_keywords_titles.csv", "keyword,count", queries.top_keywords(top_n))
+    for n in sorted(set(ngrams) - {1}):
+        name = NGRAM_NAMES.get(n, f"{n}grams")
+        rows = queries.top_ngrams(n, top_n)
+        _write_top_terms(f"top_{name}_titles.csv", f"{name.rstrip('s')},count", rows)
+    categories = sorted(
+        category for category, _ in queries.count_by_category() if category != "Unknown"
+    )
+    rows = [
+        (category, word, count)
+        for category in categories
+        for word, count in queries.top_keywords(top_n, category=category)
+    ]
+    _write_top_terms("top_keywords_by_category.csv", "category,keyword,count", rows)
+
 
-def trend_top_keywords_in_titles(articles, top_n=10):
+def trend_top_keywords_in_titles(articles=None, top_n=10):
     """
     Identify and save the top N most frequent keywords from article titles.
 
-    Filters out common stopwords and generates a CSV file with keyword counts.
+    Uses the shared keyword engine (stopwords and workers from the
+    `analysis.keywords` settings) and writes:
+    - 'top_keywords_titles.csv': overall top keywords
+    - 'top_keywords_by_category.csv': top keywords per category
+    - 'top_bigrams_titles.csv' / 'top_trigrams_titles.csv' when those
+      n-gram sizes are configured
 
     Args:
-        articles (list): List of article dictionaries with 'title' fields.
-        top_n (int): Number of top keywords to include in the CSV (default: 10).
+        articles (DataFrame, optional): Article dataset frame with 'title' and
+            'category' columns. Keywords are read from the rollups when omitted.
+        top_n (int): Number of top terms per list (default: 10).
     """
     print("\n🔍 Trend 2: Top Keywords in Article Titles")
-
-    stopwords = set(
-        [
-            "the",
-            "is",
-            "on",
-            "at",
-            "to",
-            "of",
-            "and",
-            "a",
-            "in",
-            "with",
-            "as",
-            "for",
-            "from",
-            "by",
-            "an",
-            "this",
-            "that",
-            "be",
-            "are",
-            "it",
-            "its",
-            "or",
-            "we",
-            "our",
-            "but",
-            "will",
-            "not",
-            "has",
-            "have",
-            "was",
-            "you",
-            "they",
-            "about",
-            "how",
-            "who",
-            "what",
-            "when",
-            "why",
-            "which",
-            "can",
-            "all",
-            "new",
-            "more",
-            "just",
-            "their",
-            "out",
+    if articles is None:
+        _top_keywords_from_rollups(top_n)
+        return
+
+    engine, ngrams = get_keyword_engine()
+    titles = articles["title"]
+
+    for n in sorted(set(ngrams) | {1}):
+        name = NGRAM_NAMES.get(n, f"{n}grams")
+        rows = top_terms(engine.count(titles, n=n), top_n)
+        _write_top_terms(f"top_{name}_titles.csv", f"{name.rstrip('s')},count", rows)
+
+    if "category" in articles:
+        by_category = engine.count_by(titles, articles["category"])
+        rows = [
+            (category, word, count)
+            for category in sorted(key for key in by_category if isinstance(key, str))
+            for word, count in top_terms(by_category[category], top_n)
         ]
-    )
-
-    word_counts = Counter()
-
-    for article in articles:
-        title = article.get("title", "")
-        words = re.findall(r"\b[a-z]{3,}\b", title.lower())
-        keywords = [word for word in words if word not in stopwords]
-        word_counts.update(keywords)
+        _write_top_terms("top_keywords_by_category.csv", "category,keyword,count", rows)
 
-    top_keywords = word_counts.most_common(top_n)
 
-    # Save as CSV
-    output_path = os.path.join(REPORTS_DIR, "top_keywords_titles.csv")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("keyword,count\n")
-        for word, count in top_keywords:
-            f.write(f"{word},{count}\n")
-
-    print(f"📊 Saved: top_keywords_titles.csv")
-
-
-def chart_articles_by_category(articles):
+def chart_articles_by_category(articles=None):
     """
     Generate a horizontal bar chart showing article counts by category.
 
     Saves the chart as 'articles_by_category.png' in the reports directory.
 
     Args:
-        articles (list): List of article dictionaries with 'category' fields.
+        articles (DataFrame, optional): Article dataset frame with a categorical
+            'category' column. Counts are read from the rollups when omitted.
     """
-    df = pd.DataFrame(articles)
-    df["category"] = df["category"].fillna("Unknown")
+    if articles is None:
+        counts = pd.Series(dict(queries.count_by_category()), dtype="int64")
+    else:
+        counts = articles["category"].value_counts()
+        counts = counts[counts > 0]
+        missing = int(articles["category"].isna().sum())
+        if missing:
+            counts["Unknown"] = missing
+            counts = counts.sort_values(ascending=False)
+    if counts.empty:
+        print("⚠️ No articles to chart by category.")
+        return
 
     plt.figure(figsize=(8, 5))
-    df["category"].value_counts().plot(kind="barh", color="lightgreen")
+    counts.plot(kind="barh", color="lightgreen")
     plt.title("Articles by Category")
     plt.xlabel("Count")
     plt.ylabel("Category")
@@ -181,16 +293,28 @@ def chart_articles_by_category(articles):
     print("📊 Saved: articles_by_category.png")
 
 
-def run_full_analysis():
+def run_full_analysis(use_rollups=None):
     """
     Execute the full trend analysis pipeline:
     - Publishing trend
     - Top title keywords
     - Category distribution
 
-    Saves all visualizations and prints progress status to the console.
+    With rollups every step reads pre-aggregated tables from the database;
+    otherwise the articles are loaded once from the shared dataset and reused
+    by every step. Saves all visualizations and prints progress status to the
+    console.
+
+    Args:
+        use_rollups (bool, optional): Defaults to `analysis.use_rollups` in
+            `config/settings.yaml` (enabled when unset).
     """
-    articles = load_articles()
+    if use_rollups is None:
+        try:
+            use_rollups = load_config().get("analysis", {}).get("use_rollups", True)
+        except OSError:
+            use_rollups = True
+    articles = None if use_rollups else get_dataset().frame()
     analyze_publishing_activity(articles)
     trend_top_keywords_in_titles(articles)
     chart_articles_by_category(articles)
@@ -3,6 +3,92 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+
+def run_processing(stream=False, workers=1, incremental=False):
+    """Clean raw data, store it in the database and report the article count."""
+    from src.data.processors import process_and_save_all_articles
+    total = process_and_save_all_articles(
+        stream=stream, workers=workers, incremental=incremental
+    )
+    print(f"✅ Processed {total} articles", flush=True)
+
+
+def run_search(text, days=None, category=None, limit=20):
+    """Print the best title matches for a full-text query."""
+    from src.data.queries import search_articles
+    results = search_articles(text, days=days, category=category, limit=limit)
+    if not results:
+        print(f"🔍 No articles match '{text}'.")
+    for article in results:
+        print(f"{article['published']}  [{article['category']}]  {article['title']}")
+        print(f"    {article['link']}")
+
+
+def run_reports():
+    """Run trend analysis, the HTML report and exports over one shared article load."""
+    from src.analysis.export import export_cleaned_articles
+    from src.analysis.report_generator import generate_html_report
+    from src.analysis.trends import run_full_analysis
+
+    run_full_analysis()
+    generate_html_report()
+    export_cleaned_articles()
+
+
+def run_static():
+    """Run the static NPR scraper."""
+    from src.scrapers.static_scraper import run_static_scrapers
+    run_static_scrapers()
+
+
+def run_dynamic():
+    """Run the Selenium-based scrapers."""
+    from src.scrapers.selenium_scraper import run_dynamic_scrapers
+    run_dynamic_scrapers()
+
+
+def run_all_scrapers(parallel=False, timeout=None, **scrapy_options):
+    """
+        Run every scraper enabled under `scrapers` in config/settings.yaml,
+        each in its own process, and print a combined summary.
+    """
+    import time
+    from src.factories.scraper_factory import get_scraper
+    from src.strategies.runner import format_summary, run_strategies
+    from src.utils.helpers import load_config
+
+    config = load_config()
+    enabled = config.get("scrapers", {})
+    strategies = [
+        get_scraper(kind, **scrapy_options) if kind == "scrapy" else get_scraper(kind)
+        for kind in ("static", "dynamic", "scrapy")
+        if enabled.get(f"enable_{kind}", True)
+    ]
+    runner_settings = config.get("runner") or {}
+    timeouts = dict(runner_settings.get("timeouts") or {})
+    if timeout:
+        timeouts = {"*": timeout}
+
+    started = time.monotonic()
+    results = run_strategies(
+        strategies, parallel=parallel, timeouts=timeouts, limits=runner_settings.get("limits")
+    )
+    print(format_summary(results, wall_time=time.monotonic() - started), flush=True)
+    return results
+
+
+def run_scrapy(**options):
+    """Run the Scrapy crawler in-process and print its stats."""
+    from src.factories.scraper_factory import get_scraper
+    result = get_scraper("scrapy", **options).run()
+    print(
+        f"🕷️ {result.items} items, {result.responses} responses, {result.retries} retries "
+        f"in {result.elapsed:.1f}s ({result.items_per_sec:.1f} items/s, {result.finish_reason})",
+        flush=True,
+    )
+    return result
+
+
 def run_cli():
     parser = argparse.ArgumentParser(
         description="News Aggregation & Analysis CLI Tool"
@@ -11,34 +97,97 @@ def run_cli():
     parser.add_argument('--run-static', action='store_true', help='Run static scrapers')
     parser.add_argument('--run-dynamic', action='store_true', help='Run dynamic scrapers')
     parser.add_argument('--run-scrapy', action='store_true', help='Run Scrapy crawler')
+    parser.add_argument('--run-all', action='store_true', help='Run every enabled scraper, each in its own process')
+    parser.add_argument('--parallel', action='store_true', help='With --run-all, run the scrapers concurrently')
+    parser.add_argument('--timeout', type=float, help='With --run-all, stop any scraper still running after N seconds')
+    parser.add_argument('--concurrent-requests', type=int, help='Scrapy CONCURRENT_REQUESTS for --run-scrapy')
+    parser.add_argument('--per-domain', type=int, help='Concurrent Scrapy requests per host')
+    parser.add_argument('--download-delay', type=float, help='Seconds between Scrapy requests to a host')
+    parser.add_argument('--autothrottle', action=argparse.BooleanOptionalAction, help='Enable Scrapy AutoThrottle')
+    parser.add_argument('--autothrottle-target', type=float, help='AutoThrottle target concurrency per host')
     parser.add_argument('--process', action='store_true', help='Process raw data')
+    parser.add_argument('--stream', action='store_true', help='Process raw data with constant-memory streaming')
+    parser.add_argument('--workers', type=int, default=1, help='Number of processes used by --process')
+    parser.add_argument('--incremental', action='store_true', help='Only process raw files changed since the last run')
     parser.add_argument('--generate-report', action='store_true', help='Generate reports')
+    parser.add_argument('--search', metavar='QUERY', help='Full-text search article titles (use word* for prefixes)')
+    parser.add_argument('--days', type=int, help='Limit --search to the last N days')
+    parser.add_argument('--category', help='Limit --search to one category')
+    parser.add_argument('--limit', type=int, default=20, help='Maximum --search results')
 
     args = parser.parse_args()
 
     if args.run_static:
         logger.info("Running static scrapers...")
-        # from src.scrapers.static_scraper import run_static_scrapers
-        # run_static_scrapers()
+        run_static()
 
     if args.run_dynamic:
         logger.info("Running dynamic scrapers...")
-        from src.scrapers.selenium_scraper import run_dynamic_scrapers
-        run_dynamic_scrapers()
+        run_dynamic()
 
     if args.run_scrapy:
         logger.info("Running Scrapy crawler...")
-        # use os.system to run `scrapy crawl` command
+        run_scrapy(
+            concurrent_requests=args.concurrent_requests,
+            per_domain=args.per_domain,
+            download_delay=args.download_delay,
+            autothrottle=args.autothrottle,
+            autothrottle_target=args.autothrottle_target,
+        )
+
+    if args.run_all:
+        logger.info(f"Running all scrapers{' in parallel' if args.parallel else ''}...")
+        run_all_scrapers(
+            parallel=args.parallel,
+            timeout=args.timeout,
+            concurrent_requests=args.concurrent_requests,
+            per_domain=args.per_domain,
+            download_delay=args.download_delay,
+            autothrottle=args.autothrottle,
+            autothrottle_target=args.autothrottle_target,
+        )
 
     if args.process:
         logger.info("Processing and cleaning data...")
-        # from src.data.processors import process_data
-        # process_data()
+        run_processing(
+            stream=args.stream, workers=args.workers, incremental=args.incremental
+        )
 
     if args.generate_report:
         logger.info("Generating reports...")
-        # from src.analysis.reports import generate_report
-        # generate_report()
+        run_reports()
+
+    if args.search:
+        run_search(args.search, days=args.days, category=args.category, limit=args.limit)
 
-    if not any(vars(args).values()):
+    # Options such as --workers carry defaults, so only look at the action flags
+    actions = (
+        "run_static", "run_dynamic", "run_scrapy", "run_all", "process", "generate_report", "search"
+    )
+    if not any(getattr(args, name) for name in actions):
         parser.print_help()
+
+
+def run_interactive_cli():
+    """Prompt-driven menu used when main.py is started without arguments."""
+    actions = {
+        "1": ("Run dynamic scrapers", run_dynamic),
+        "2": ("Process raw data", run_processing),
+        "3": ("Process raw data (streaming)", lambda: run_processing(stream=True)),
+        "4": ("Process new raw files only", lambda: run_processing(incremental=True)),
+        "5": ("Search article titles", lambda: run_search(input("Search for: "))),
+    }
+
+    while True:
+        print("\n📰 News Aggregation & Analysis")
+        for key, (label, _) in actions.items():
+            print(f"  {key}. {label}")
+        print("  0. Exit")
+
+        choice = input("Select an option: ").strip()
+        if choice == "0":
+            break
+        if choice not in actions:
+            print("⚠️ Invalid option.")
+            continue
+        actions[choice][1]()
@@ -6,77 +6,480 @@ and insert cleaned article data.
 """
 
 from src.data.models import NewsArticle
-from typing import List
+from src.utils.helpers import source_from_link
+from src.utils.logger import setup_logger
+from contextlib import closing
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable
 import sqlite3
 import os
 
+logger = setup_logger()
+
 DB_PATH = "data_output/news_articles.db"
+INSERT_CHUNK_SIZE = 50_000
+STATEMENT_CACHE_SIZE = 256
+
+# WAL lets readers run alongside the writer; NORMAL sync is safe under WAL
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -64_000),  # negative = KiB, i.e. 64 MB page cache
+    ("temp_store", "MEMORY"),
+)
+
+INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO articles (title, link, category, published, source, published_date)
+    VALUES (?1, ?2, ?3, ?4, ?5, date(substr(?4, 1, 10)))
+"""
+
+
+@dataclass
+class InsertResult:
+    """
+        Outcome of a bulk insert.
+
+        Attributes:
+            inserted (int): Rows written to the table.
+            ignored (int): Rows skipped because their link already existed.
+            failed (int): Rows rejected with an error.
+    """
+    inserted: int = 0
+    ignored: int = 0
+    failed: int = 0
+
+
+def configure_connection(conn):
+    """
+        Applies the performance pragmas in PRAGMAS to a connection.
+
+        Args:
+            conn (sqlite3.Connection): Connection to configure.
+
+        Returns:
+            sqlite3.Connection: The same connection, for chaining.
+    """
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+_created_dirs = set()
+
+
+def connect(path=None, check_same_thread=True):
+    """
+        Opens a configured connection to a SQLite database file.
+
+        The parent directory is created once per process rather than on
+        every call.
+
+        Args:
+            path (str, optional): Database file. Defaults to DB_PATH.
+            check_same_thread (bool): Passed through to `sqlite3.connect`.
+
+        Returns:
+            sqlite3.Connection: Connection with the pragmas from `configure_connection`.
+    """
+    path = path or DB_PATH
+    directory = os.path.dirname(path)
+    if directory and directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+    return configure_connection(
+        sqlite3.connect(
+            path,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=check_same_thread,
+        )
+    )
 
 
 def get_connection():
     """
         Establishes and returns a connection to the SQLite database.
 
-        Ensures the 'data_output' directory exists before connecting.
+        Ensures the database directory exists before connecting and
+        applies the WAL / cache pragmas from `configure_connection`.
 
         Returns:
             sqlite3.Connection: SQLite database connection object.
     """
-    os.makedirs("data_output", exist_ok=True)
-    return sqlite3.connect(DB_PATH)
+    return connect(DB_PATH)
+
 
+def _migration_published_date(conn):
+    """
+        Schema v1: typed publication date, per-domain sources and range indexes.
 
-def create_table():
+        Adds `published_date` (YYYY-MM-DD, NULL when unparseable), replaces the
+        legacy 'merged' source with the article's domain, and indexes the
+        columns used by date-range and per-category/per-source queries.
     """
-        Creates the 'articles' table in the SQLite database if it does not exist.
+    conn.execute("ALTER TABLE articles ADD COLUMN published_date DATE")
+    conn.execute("UPDATE articles SET published_date = date(substr(published, 1, 10))")
+    conn.create_function("source_from_link", 1, source_from_link, deterministic=True)
+    conn.execute(
+        "UPDATE articles SET source = source_from_link(link) "
+        "WHERE source IS NULL OR source = 'merged'"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_date)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_category_published "
+        "ON articles (category, published_date)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_source_published "
+        "ON articles (source, published_date)"
+    )
+
 
-        The table includes columns: id, title, link (unique), category, published, and source.
+def _migration_title_search(conn):
     """
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                link TEXT UNIQUE,
-                category TEXT,
-                published TEXT,
-                source TEXT
-            )
+        Schema v2: FTS5 full-text index over article titles.
+
+        `articles_fts` is an external-content table over `articles`, kept in
+        sync by triggers so every writer (bulk inserts included) updates it.
+        Prefix indexes on 2 and 3 characters keep `term*` queries fast.
+    """
+    conn.execute(
         """
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            title,
+            content='articles',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
         )
-        conn.commit()
+    """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts (rowid, title) VALUES (new.id, new.title);
+        END
+    """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title)
+            VALUES ('delete', old.id, old.title);
+        END
+    """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title ON articles BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title)
+            VALUES ('delete', old.id, old.title);
+            INSERT INTO articles_fts (rowid, title) VALUES (new.id, new.title);
+        END
+    """
+    )
+    conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+
+def _migration_crawl_frontier(conn):
+    """
+        Schema v3: URLs collected by previous crawls (see `frontier.CrawlFrontier`).
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS crawl_frontier (
+            url TEXT PRIMARY KEY,
+            first_seen TEXT DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+    """
+    )
+
+
+_DAILY_COUNT_KEY = "ifnull({row}.category, ''), ifnull({row}.source, '')"
 
 
-def insert_articles(articles: List[NewsArticle]):
+def _migration_rollups(conn):
     """
-        Inserts a list of NewsArticle objects into the 'articles' table.
+        Schema v4: pre-aggregated rollups for reports (see `src.data.rollups`).
+
+        `daily_counts` holds articles per (day, category, source) and is kept
+        exact by triggers, so bulk inserts, write-through scrapers and
+        deletes all update it. `daily_keyword_counts` / `keyword_counts` hold
+        title keyword counts; they need the keyword tokenizer, so they are
+        filled incrementally from `rollup_state`'s article id watermark.
+        Articles without a publication date are not rolled up, matching the
+        `published_date IS NOT NULL` filter of `src.data.queries`.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS daily_counts (
+            day DATE NOT NULL,
+            category TEXT NOT NULL,
+            source TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (day, category, source)
+        ) WITHOUT ROWID
+    """
+    )
+    conn.execute(
+        """
+        INSERT INTO daily_counts (day, category, source, count)
+        SELECT published_date, ifnull(category, ''), ifnull(source, ''), COUNT(*)
+        FROM articles WHERE published_date IS NOT NULL
+        GROUP BY 1, 2, 3
+    """
+    )
+    increment = (
+        "INSERT INTO daily_counts (day, category, source, count) "
+        f"VALUES (new.published_date, {_DAILY_COUNT_KEY.format(row='new')}, 1) "
+        "ON CONFLICT (day, category, source) DO UPDATE SET count = count + 1;"
+    )
+    decrement = (
+        "UPDATE daily_counts SET count = count - 1 WHERE day = old.published_date "
+        f"AND (category, source) = ({_DAILY_COUNT_KEY.format(row='old')});"
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS daily_counts_insert AFTER INSERT ON articles
+        WHEN new.published_date IS NOT NULL BEGIN
+            {increment}
+        END
+    """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS daily_counts_delete AFTER DELETE ON articles
+        WHEN old.published_date IS NOT NULL BEGIN
+            {decrement}
+        END
+    """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS daily_counts_update_old
+        AFTER UPDATE OF published_date, category, source ON articles
+        WHEN old.published_date IS NOT NULL BEGIN
+            {decrement}
+        END
+    """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS daily_counts_update_new
+        AFTER UPDATE OF published_date, category, source ON articles
+        WHEN new.published_date IS NOT NULL BEGIN
+            {increment}
+        END
+    """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS daily_keyword_counts (
+            day DATE NOT NULL,
+            category TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (day, category, keyword)
+        ) WITHOUT ROWID
+    """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS keyword_counts (
+            keyword TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_keyword_counts_count ON keyword_counts (count DESC, keyword)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rollup_state (
+            name TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL
+        )
+    """
+    )
+
+
+def _migration_ngram_rollups(conn):
+    """
+        Schema v5: all-time title n-gram counts (bigrams, trigrams) for the
+        configured `analysis.keywords.ngrams`, keyed by n-gram size. Each size
+        is filled from its own `rollup_state` watermark (see `src.data.rollups`).
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ngram_counts (
+            n INTEGER NOT NULL,
+            term TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (n, term)
+        ) WITHOUT ROWID
+    """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ngram_counts_count ON ngram_counts (n, count DESC, term)"
+    )
+
+
+# Applied in order; the schema version is stored in PRAGMA user_version
+MIGRATIONS = (
+    _migration_published_date,
+    _migration_title_search,
+    _migration_crawl_frontier,
+    _migration_rollups,
+    _migration_ngram_rollups,
+)
+
+
+def migrate(conn):
+    """
+        Applies pending schema migrations, each in its own transaction.
 
         Args:
-            articles (List[NewsArticle]): List of cleaned and validated articles to be inserted.
+            conn (sqlite3.Connection): Connection to an existing database.
+
+        Returns:
+            int: Schema version after migrating.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= len(MIGRATIONS):
+        return version
+
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        for number in range(version + 1, len(MIGRATIONS) + 1):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Another process may have migrated while we waited for the lock
+                if conn.execute("PRAGMA user_version").fetchone()[0] < number:
+                    MIGRATIONS[number - 1](conn)
+                    conn.execute(f"PRAGMA user_version = {number}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+    finally:
+        conn.isolation_level = isolation_level
+    return len(MIGRATIONS)
+
+
+def create_table(conn=None):
+    """
+        Creates the 'articles' table in the SQLite database if it does not exist
+        and brings its schema up to date (see `migrate`).
+
+        The table includes columns: id, title, link (unique), category, published,
+        source and the indexed `published_date`; titles are full-text indexed
+        in `articles_fts`.
+
+        Args:
+            conn (sqlite3.Connection, optional): Connection to use. A new
+                connection is opened and closed when omitted.
+    """
+    if conn is None:
+        with closing(get_connection()) as own_conn:
+            return create_table(own_conn)
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            link TEXT UNIQUE,
+            category TEXT,
+            published TEXT,
+            source TEXT
+        )
+    """
+    )
+    conn.commit()
+    migrate(conn)
+
+
+def article_row(article: NewsArticle):
+    """Return the INSERT parameters for a NewsArticle."""
+    return (
+        article.title,
+        article.link,
+        article.category,
+        article.published,
+        article.source,
+    )
+
+
+def _insert_chunk(conn, rows, result):
+    """
+        Inserts one chunk of rows inside an explicit transaction.
+
+        If the batch fails (e.g. a value SQLite cannot bind), the chunk is
+        rolled back and retried row by row so one bad article does not
+        discard its neighbours.
+    """
+    # rowcount excludes rows written by triggers (e.g. the FTS index)
+    inserted = failed = 0
+    conn.execute("BEGIN")
+    try:
+        inserted = conn.executemany(INSERT_ARTICLE_SQL, rows).rowcount
+        conn.execute("COMMIT")
+    except (sqlite3.Error, ValueError):
+        conn.execute("ROLLBACK")
+        inserted = 0
+        conn.execute("BEGIN")
+        for row in rows:
+            try:
+                inserted += conn.execute(INSERT_ARTICLE_SQL, row).rowcount
+            except (sqlite3.Error, ValueError) as e:
+                logger.error(f"❌ Failed to insert article {row[1]!r} ({row[0]!r}): {e}")
+                failed += 1
+        conn.execute("COMMIT")
+
+    result.inserted += inserted
+    result.failed += failed
+    result.ignored += len(rows) - inserted - failed
+
+
+def insert_articles(
+    articles: Iterable[NewsArticle], chunk_size=INSERT_CHUNK_SIZE, conn=None
+):
+    """
+        Bulk-inserts NewsArticle objects into the 'articles' table.
+
+        Args:
+            articles (Iterable[NewsArticle]): Cleaned and validated articles;
+                may be a generator, it is consumed chunk by chunk.
+            chunk_size (int): Number of rows written per transaction.
+            conn (sqlite3.Connection, optional): Connection to reuse (it is left
+                open). A new connection is opened and closed when omitted.
+
+        Returns:
+            InsertResult: Counts of inserted, ignored (duplicate) and failed rows.
 
         Notes:
             - Uses INSERT OR IGNORE to avoid duplicate entries based on the 'link' field.
-            - Commits all changes after insertions.
+            - Each chunk is a single `executemany` in an explicit transaction,
+              reusing one prepared statement.
     """
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        for article in articles:
-            try:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO articles (title, link, category, published, source)
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        article.title,
-                        article.link,
-                        article.category,
-                        article.published,
-                        article.source,
-                    ),
-                )
-            except Exception as e:
-                print(f"Error inserting article: {article.title} -> {e}")
-        conn.commit()
+    if conn is None:
+        with closing(get_connection()) as own_conn:
+            return insert_articles(articles, chunk_size, conn=own_conn)
+
+    result = InsertResult()
+    rows = (article_row(article) for article in articles)
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # Transactions are managed explicitly
+    try:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            _insert_chunk(conn, chunk, result)
+    finally:
+        conn.isolation_level = isolation_level
+    return result
@@ -0,0 +1,122 @@
+"""
+Fast date normalization for scraped article metadata.
+
+Converts the publication date formats seen across our sources into
+standardized YYYY-MM-DD strings:
+- ISO 8601 dates and timestamps, with or without offsets (2025-06-17T10:00:00+02:00)
+- Slash-separated dates (2025/06/17)
+- Dates embedded in longer strings ("Published: 2025-06-17")
+- RFC 2822 timestamps used by feeds (Tue, 17 Jun 2025 10:00:00 +0000)
+
+Leading dates are handled by slicing and integer checks instead of
+`re` + `strptime`, and results are memoized in a bounded LRU cache since
+the same raw strings repeat heavily across a scrape.
+"""
+
+import re
+from functools import lru_cache
+
+DATE_CACHE_SIZE = 65536
+
+_EMBEDDED_DATE_RE = re.compile(r"\d{4}[-/]\d{2}[-/]\d{2}")
+_RFC2822_RE = re.compile(
+    r"\b(\d{1,2})\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{4})\b",
+    re.IGNORECASE,
+)
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _format_ymd(year, month, day):
+    """Return 'YYYY-MM-DD' for valid calendar components, otherwise None."""
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= _DAYS_IN_MONTH[month]:
+        return None
+    if month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _parse_ymd(text):
+    """Parse a 10-character 'YYYY-MM-DD' or 'YYYY/MM/DD' slice."""
+    if text[4] != text[7]:
+        return None
+    try:
+        return _format_ymd(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    except ValueError:  # Digit-like characters such as superscripts
+        return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _normalize(date_str):
+    """Normalize a non-empty string; memoized."""
+    # Fast path: the string starts with a date (ISO 8601 timestamps, yyyy/mm/dd),
+    # which is exactly where the embedded-date search below would match first
+    if (
+        len(date_str) >= 10
+        and date_str[4] in "-/"
+        and date_str[7] in "-/"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:10].isdigit()
+    ):
+        return _parse_ymd(date_str)
+
+    # Date embedded somewhere in the string; the first match decides
+    match = _EMBEDDED_DATE_RE.search(date_str)
+    if match:
+        return _parse_ymd(match.group())
+
+    # RFC 2822 as used by RSS feeds
+    match = _RFC2822_RE.search(date_str)
+    if match:
+        day, month, year = match.groups()
+        return _format_ymd(int(year), _MONTHS[month[:3].lower()], int(day))
+    return None
+
+
+def normalize_date(date_str):
+    """
+    Normalize various date string formats into standardized YYYY-MM-DD format.
+
+    Args:
+        date_str (str): Raw date string from article metadata.
+
+    Returns:
+        str or None: Normalized date in YYYY-MM-DD format, or None if parsing fails.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _normalize(date_str)
+
+
+def normalize_dates(values):
+    """
+    Normalize a whole column of raw date values at once.
+
+    Each distinct value is parsed only once per call, which makes this much
+    cheaper than mapping `normalize_date` over highly repetitive columns.
+
+    Args:
+        values (Iterable): Raw date values (non-strings normalize to None).
+
+    Returns:
+        list[str or None]: Normalized dates, aligned with `values`.
+    """
+    values = list(values)
+    try:
+        unique = dict.fromkeys(values)
+    except TypeError:  # Unhashable values (e.g. nested JSON) in the column
+        return [normalize_date(value) for value in values]
+    parsed = {value: _normalize(value) for value in unique if isinstance(value, str) and value}
+    return [parsed.get(value) for value in values]
+
+
+def clear_date_cache():
+    """Drop all memoized normalization results."""
+    _normalize.cache_clear()
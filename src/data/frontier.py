@@ -0,0 +1,169 @@
+"""
+Persistent crawl frontier: which article URLs previous crawls already collected.
+
+A URL is known when it is stored in the `articles` table or recorded in the
+`crawl_frontier` table (schema v3, see `database.py`). Scrapers record URLs
+only after the raw file holding them has been written, so an interrupted
+crawl never marks articles it did not save.
+
+Listings are newest-first, so a page on which every article is known means
+the rest of the listing was covered by an earlier crawl; scrapers stop
+paginating there and incremental crawls only touch the new head.
+
+Each incremental crawl writes its new head to its own timestamped raw file
+(`write_crawl_delta`). Earlier raw files are never rewritten, so the
+processing manifest only sees the new file and incremental processing stays
+proportional to the new data.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from src.data import database
+from src.data.database import create_table
+
+# Stay well below SQLite's bound-parameter limit
+LOOKUP_BATCH_SIZE = 500
+
+
+class CrawlFrontier:
+    """
+        Seen-URL store shared by the static, Selenium and Scrapy scrapers.
+
+        Safe to share between threads.
+
+        Args:
+            path (str, optional): Database file. Defaults to `database.DB_PATH`.
+    """
+
+    def __init__(self, path=None):
+        self._conn = database.connect(path or database.DB_PATH, check_same_thread=False)
+        create_table(self._conn)
+        self._lock = threading.Lock()
+
+    def known(self, urls):
+        """
+            Return the subset of `urls` collected by earlier crawls.
+
+            Args:
+                urls (Iterable[str]): Candidate article URLs.
+
+            Returns:
+                set[str]: URLs already stored or recorded.
+        """
+        urls = list(dict.fromkeys(urls))
+        found = set()
+        with self._lock:
+            for i in range(0, len(urls), LOOKUP_BATCH_SIZE):
+                batch = urls[i : i + LOOKUP_BATCH_SIZE]
+                marks = ",".join("?" * len(batch))
+                found.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        f"""
+                        SELECT url FROM crawl_frontier WHERE url IN ({marks})
+                        UNION
+                        SELECT link FROM articles WHERE link IN ({marks})
+                        """,
+                        batch + batch,
+                    )
+                )
+        return found
+
+    def __contains__(self, url):
+        return bool(self.known([url]))
+
+    def page_is_known(self, urls):
+        """
+            Whether a listing page holds articles and all of them are known.
+
+            Args:
+                urls (list[str]): Article URLs found on one listing page.
+
+            Returns:
+                bool: True when pagination can stop at this page.
+        """
+        urls = set(urls)
+        return bool(urls) and self.known(urls) == urls
+
+    def add(self, urls):
+        """
+            Record URLs as collected.
+
+            Args:
+                urls (Iterable[str]): Article URLs that were saved by a scraper.
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO crawl_frontier (url) VALUES (?)",
+                    ((url,) for url in urls),
+                )
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def open_frontier(config):
+    """
+        Return a CrawlFrontier when `crawl.incremental` is enabled, otherwise None.
+
+        Args:
+            config (dict): Parsed settings from `config/settings.yaml`.
+    """
+    if config.get("crawl", {}).get("incremental", False):
+        return CrawlFrontier()
+    return None
+
+
+def crawl_delta_path(path, now=None):
+    """
+        Return a timestamped sibling of a raw file for one crawl's new articles.
+
+        `data_output/raw/npr_static.json` becomes
+        `data_output/raw/npr_static-20250617T080000Z.json`; a counter is added
+        if two crawls finish within the same second.
+
+        Args:
+            path (str): The scraper's raw output file.
+            now (datetime, optional): Crawl time. Defaults to the current UTC time.
+
+        Returns:
+            str: A path that does not exist yet.
+    """
+    stem, ext = os.path.splitext(path)
+    stamp = (now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    candidate, counter = f"{stem}-{stamp}{ext}", 1
+    while os.path.exists(candidate):
+        counter += 1
+        candidate = f"{stem}-{stamp}-{counter}{ext}"
+    return candidate
+
+
+def write_crawl_delta(path, articles, now=None):
+    """
+        Write an incremental crawl's new articles to their own raw JSON file.
+
+        Existing raw files are left untouched. The file is written under a
+        temporary name and renamed, so processing never reads a partial file.
+
+        Args:
+            path (str): The scraper's raw output file; the delta is written next to it.
+            articles (list[dict]): New articles, newest first.
+            now (datetime, optional): Crawl time used in the file name.
+
+        Returns:
+            str or None: The file written, or None when there was nothing new.
+    """
+    if not articles:
+        return None
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    delta_path = crawl_delta_path(path, now)
+    tmp_path = f"{delta_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(articles, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, delta_path)
+    return delta_path
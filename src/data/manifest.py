@@ -0,0 +1,164 @@
+"""
+Manifest of raw files that have already been processed.
+
+Each entry is keyed by file path and records the size, modification time and
+SHA-256 content hash of the file at the time it was processed, so incremental
+runs can skip raw files that have not changed.
+
+Next to the manifest, `ProcessedLinkIndex` keeps the links of every article
+written to the processed outputs. Incremental runs deduplicate against it
+rather than the `articles` table: scrapers with `database.write_through`
+store articles in the database before they are ever processed.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+
+MANIFEST_PATH = "data_output/processed/manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path):
+    """
+        Compute the SHA-256 hex digest of a file, reading it in chunks.
+
+        Args:
+            path (str): File to hash.
+
+        Returns:
+            str: Hex-encoded SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ProcessedLinkIndex:
+    """
+        Set-like index of the links already written to the processed outputs.
+
+        Stored in a small SQLite file, so membership checks never load the full
+        history. Links added during a run are kept in memory and written by
+        `save()` once the outputs that contain them are complete.
+
+        Args:
+            path (str): SQLite file of the index.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._added = set()
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS links (link TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def __contains__(self, link):
+        if link in self._added:
+            return True
+        row = self._conn.execute("SELECT 1 FROM links WHERE link = ?", (link,)).fetchone()
+        return row is not None
+
+    def add(self, link):
+        """Mark a link as written for the rest of the run."""
+        self._added.add(link)
+
+    def clear(self):
+        """Forget every link, e.g. before the outputs are rebuilt."""
+        self._added.clear()
+        with self._conn:
+            self._conn.execute("DELETE FROM links")
+
+    def save(self):
+        """Persist the links added during this run."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO links (link) VALUES (?)", ((link,) for link in self._added)
+            )
+        self._added.clear()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+class ProcessingManifest:
+    """
+        Tracks which raw files have been processed and in which state.
+
+        Size and mtime are compared first; the content hash is only computed
+        when they differ, so checking an unchanged directory costs one `stat`
+        per file.
+
+        Args:
+            path (str, optional): Location of the manifest JSON file.
+                Defaults to MANIFEST_PATH.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or MANIFEST_PATH
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def changed_files(self, paths):
+        """
+            Return the subset of `paths` that are new or whose content changed.
+
+            Files whose mtime changed but whose hash is identical are not
+            returned; their manifest entry is refreshed instead.
+
+            Args:
+                paths (list[str]): Candidate raw file paths.
+
+            Returns:
+                list[tuple[str, dict]]: (path, new manifest entry) pairs to process.
+        """
+        changed = []
+        for path in paths:
+            stat = os.stat(path)
+            entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+            previous = self.entries.get(path)
+
+            if previous and previous["size"] == entry["size"] and previous["mtime"] == entry["mtime"]:
+                continue
+
+            entry["sha256"] = hash_file(path)
+            if previous and previous.get("sha256") == entry["sha256"]:
+                self.entries[path] = entry
+                continue
+            changed.append((path, entry))
+        return changed
+
+    @property
+    def links_path(self):
+        """Location of the ProcessedLinkIndex kept next to the manifest."""
+        return f"{os.path.splitext(self.path)[0]}_links.db"
+
+    def has_link_index(self):
+        """Return True when a previous run left a processed-link index."""
+        return os.path.exists(self.links_path)
+
+    def open_link_index(self):
+        """Open (creating if needed) the processed-link index of this manifest."""
+        os.makedirs(os.path.dirname(self.links_path) or ".", exist_ok=True)
+        return ProcessedLinkIndex(self.links_path)
+
+    def record(self, path, entry):
+        """Mark a raw file as processed in the given state."""
+        self.entries[path] = entry
+
+    def reset(self):
+        """Forget every processed file, forcing a full run."""
+        self.entries = {}
+
+    def save(self):
+        """Write the manifest to disk atomically."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)
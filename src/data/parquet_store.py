@@ -0,0 +1,186 @@
+"""
+Columnar store for cleaned articles, written as partitioned Parquet files.
+
+Cleaned articles are stored under `data_output/processed/articles/` in a
+Hive-style layout partitioned by publication month and source:
+
+    articles/month=2025-06/source=npr.org/part-<run>-0.parquet
+
+`category` and `source` are dictionary-encoded, so repeated values cost a
+few bits per row and load as pandas categoricals. Loaders read only the
+requested columns, and month/source filters skip whole directories, so a
+job touching one month of one source reads a fraction of the corpus.
+
+Requires `pyarrow`.
+"""
+
+import os
+import shutil
+import uuid
+import pyarrow as pa
+import pyarrow.dataset as ds
+from src.utils.helpers import source_from_link
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+PARQUET_DIR = "data_output/processed/articles"
+WRITE_BATCH_SIZE = 250_000
+
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+ARTICLE_SCHEMA = pa.schema(
+    [
+        ("title", pa.string()),
+        ("link", pa.string()),
+        ("category", _CATEGORY),
+        ("published", pa.string()),
+        ("source", _CATEGORY),
+        ("month", pa.string()),
+    ]
+)
+
+_PARTITION_SCHEMA = pa.schema([("month", pa.string()), ("source", _CATEGORY)])
+PARTITIONING = ds.partitioning(_PARTITION_SCHEMA, flavor="hive")
+# Reading needs the dictionary values discovered from the directory names
+READ_PARTITIONING = ds.HivePartitioning.discover(schema=_PARTITION_SCHEMA)
+
+
+def has_parquet_store(directory=None):
+    """Return True when a Parquet article store exists in `directory`."""
+    directory = directory or PARQUET_DIR
+    return os.path.isdir(directory) and any(
+        name.startswith("month=") for name in os.listdir(directory)
+    )
+
+
+class ParquetArticleWriter:
+    """
+        Context manager that writes cleaned articles to the partitioned Parquet store.
+
+        Articles are buffered and written every `batch_size` rows, so memory
+        stays bounded however many articles pass through.
+
+        Args:
+            directory (str, optional): Store location. Defaults to PARQUET_DIR.
+            append (bool): Add files next to the existing ones instead of
+                replacing the store.
+            batch_size (int): Rows buffered before a write.
+    """
+
+    def __init__(self, directory=None, append=False, batch_size=WRITE_BATCH_SIZE):
+        self.directory = directory or PARQUET_DIR
+        self.append = append
+        self.batch_size = batch_size
+        self.count = 0
+        self._run_id = uuid.uuid4().hex[:12]
+        self._batches = 0
+        self._columns = {name: [] for name in ARTICLE_SCHEMA.names}
+
+    def __enter__(self):
+        if not self.append and os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+        os.makedirs(self.directory, exist_ok=True)
+        return self
+
+    def write(self, article):
+        """Buffer a single cleaned article, flushing a full batch to disk."""
+        published = article.get("published") or ""
+        columns = self._columns
+        columns["title"].append(article.get("title"))
+        columns["link"].append(article.get("link"))
+        columns["category"].append(article.get("category"))
+        columns["published"].append(published)
+        columns["source"].append(article.get("source") or source_from_link(article.get("link")))
+        columns["month"].append(published[:7] or "unknown")
+        self.count += 1
+        if len(columns["link"]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows as one Parquet file per touched partition."""
+        if not self._columns["link"]:
+            return
+        table = pa.table(self._columns, schema=ARTICLE_SCHEMA)
+        ds.write_dataset(
+            table,
+            self.directory,
+            format="parquet",
+            partitioning=PARTITIONING,
+            basename_template=f"part-{self._run_id}-{self._batches}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        )
+        self._batches += 1
+        self._columns = {name: [] for name in ARTICLE_SCHEMA.names}
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+            logger.info(f"🗃️ Wrote {self.count} articles to Parquet store {self.directory}")
+        return False
+
+
+def _filter(months=None, sources=None):
+    """Build a partition filter expression for the given months and sources."""
+    expression = None
+    for field, values in (("month", months), ("source", sources)):
+        if values:
+            term = ds.field(field).isin(list(values))
+            expression = term if expression is None else expression & term
+    return expression
+
+
+def load_articles_table(columns=None, months=None, sources=None, directory=None):
+    """
+        Read cleaned articles from the Parquet store as an Arrow table.
+
+        Args:
+            columns (list, optional): Columns to read; all when omitted.
+            months (list, optional): 'YYYY-MM' partitions to read.
+            sources (list, optional): Source partitions to read (e.g. 'npr.org').
+            directory (str, optional): Store location. Defaults to PARQUET_DIR.
+
+        Returns:
+            pyarrow.Table: Matching rows with only the requested columns.
+    """
+    dataset = ds.dataset(
+        directory or PARQUET_DIR, format="parquet", partitioning=READ_PARTITIONING
+    )
+    return dataset.to_table(columns=columns, filter=_filter(months, sources))
+
+
+def table_to_records(table):
+    """
+        Convert an Arrow table to a list of article dictionaries.
+
+        Much faster than `Table.to_pylist()` on dictionary-encoded columns,
+        which are decoded to plain strings in one pass first.
+
+        Args:
+            table (pyarrow.Table): Articles read from the store.
+
+        Returns:
+            list: One dictionary per row.
+    """
+    names = table.column_names
+    columns = []
+    for name in names:
+        column = table.column(name)
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(pa.string())
+        columns.append(column.to_pylist())
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def load_articles_frame(columns=None, months=None, sources=None, directory=None):
+    """
+        Read cleaned articles from the Parquet store as a pandas DataFrame.
+
+        Dictionary-encoded columns (`category`, `source`) become categoricals.
+        Arguments are those of `load_articles_table`.
+
+        Returns:
+            pandas.DataFrame: Matching rows.
+    """
+    return load_articles_table(columns, months, sources, directory).to_pandas()
@@ -0,0 +1,296 @@
+"""
+Thread-safe access layer for the SQLite article database.
+
+Provides:
+- `ConnectionPool`: one reusable connection per thread, so concurrent readers
+  never share a connection and never pay the connect cost twice.
+- `ArticleWriter`: a single background writer fed by a queue, which batches
+  articles submitted from any number of producer threads (e.g. scraper
+  workers) into bulk inserts.
+
+The database runs in WAL mode (see `database.configure_connection`), so
+readers on pooled connections do not block the writer and vice versa.
+"""
+
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from src.data import database
+from src.data.database import InsertResult, create_table, insert_articles
+from src.data.models import NewsArticle
+from src.data.processors import to_news_article, validate_article
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+WRITER_BATCH_SIZE = 500
+WRITER_FLUSH_INTERVAL = 1.0
+WRITER_QUEUE_SIZE = 10_000
+
+_STOP = object()
+
+
+class ConnectionPool:
+    """
+        Hands out one SQLite connection per thread for a database file.
+
+        Args:
+            path (str, optional): Database file. Defaults to `database.DB_PATH`
+                at the time the pool is created.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or database.DB_PATH
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """
+            Return the calling thread's connection, opening it on first use.
+
+            Returns:
+                sqlite3.Connection: Connection owned by the current thread.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close_all() can close it later
+            conn = database.connect(self.path, check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close_all(self):
+        """Close every connection handed out by this pool."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path=None):
+    """
+        Return the shared ConnectionPool for a database file.
+
+        Args:
+            path (str, optional): Database file. Defaults to `database.DB_PATH`.
+
+        Returns:
+            ConnectionPool: Process-wide pool for that file.
+    """
+    path = path or database.DB_PATH
+    with _pools_lock:
+        if path not in _pools:
+            _pools[path] = ConnectionPool(path)
+        return _pools[path]
+
+
+class ArticleWriter:
+    """
+        Single-writer queue that batches article inserts from many threads.
+
+        Producers call `submit()`; a background thread drains the queue and
+        writes batches of up to `batch_size` articles, or whatever has arrived
+        after `flush_interval` seconds. Raw scraped dictionaries are validated
+        and date-normalized with the same rules as the processing pipeline;
+        invalid ones are dropped.
+
+        Use as a context manager so the queue is drained on exit:
+
+            with ArticleWriter() as writer:
+                writer.submit({"title": ..., "link": ..., "published": ...})
+
+        If the writer thread fails (e.g. the database cannot be opened), it
+        keeps draining the queue, counting everything as failed, and the error
+        is re-raised from `flush()` and `close()`.
+
+        Args:
+            path (str, optional): Database file. Defaults to `database.DB_PATH`.
+            batch_size (int): Maximum articles per insert transaction.
+            flush_interval (float): Maximum seconds an article waits in the queue.
+            max_queue (int): Queue bound; `submit()` blocks when producers
+                outrun the writer.
+
+        Attributes:
+            result (InsertResult): Running totals for everything written.
+            rejected (int): Submitted dictionaries that failed validation.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        batch_size=WRITER_BATCH_SIZE,
+        flush_interval=WRITER_FLUSH_INTERVAL,
+        max_queue=WRITER_QUEUE_SIZE,
+    ):
+        self.path = path or database.DB_PATH
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.result = InsertResult()
+        self.rejected = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        """Start the background writer thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="article-writer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def submit(self, article):
+        """
+            Queue an article for insertion. Safe to call from any thread.
+
+            Args:
+                article (NewsArticle or dict): Article object or raw scraped record.
+        """
+        self._queue.put(article)
+
+    def flush(self):
+        """
+            Block until every article submitted so far has been written.
+
+            Raises:
+                Exception: The error that stopped the writer thread, if any.
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+            Write everything still queued and stop the writer thread.
+
+            Raises:
+                Exception: The error that stopped the writer thread, if any.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        logger.info(
+            f"🗃️ Writer stored {self.result.inserted} articles "
+            f"({self.result.ignored} already stored, {self.rejected} invalid)"
+        )
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.close()
+        except Exception:
+            # Already logged by the writer thread; don't mask the body's exception
+            if exc_type is None:
+                raise
+        return False
+
+    def _to_news_article(self, article):
+        """Convert a submitted item to a NewsArticle, or None if invalid."""
+        if isinstance(article, NewsArticle):
+            return article
+        published = validate_article(article) if isinstance(article, dict) else None
+        if not published:
+            self.rejected += 1
+            return None
+        return to_news_article({**article, "published": published})
+
+    def _write(self, conn, batch):
+        """Insert one batch and mark its queue items as done."""
+        articles = [a for a in map(self._to_news_article, batch) if a is not None]
+        try:
+            batch_result = insert_articles(articles, conn=conn)
+            self.result.inserted += batch_result.inserted
+            self.result.ignored += batch_result.ignored
+            self.result.failed += batch_result.failed
+        except Exception as e:
+            logger.error(f"❌ Failed to write batch of {len(articles)} articles: {e}")
+            self.result.failed += len(articles)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _fail(self, error, batch):
+        """Record a fatal writer error, then count the batch and every later item as failed."""
+        self._error = error
+        logger.error(f"❌ Article writer stopped: {error}")
+        pending = batch
+        while True:
+            for item in pending:
+                self.result.failed += 1
+                self._queue.task_done()
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            pending = [item]
+
+    def _run(self):
+        batch = []
+        try:
+            conn = database.connect(self.path)
+        except Exception as e:
+            self._fail(e, batch)
+            return
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            create_table(conn)
+            while True:
+                timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    if batch:
+                        self._write(conn, batch)
+                    self._queue.task_done()
+                    return
+                if item is not None:
+                    batch.append(item)
+
+                if len(batch) >= self.batch_size or (
+                    batch and time.monotonic() >= deadline
+                ):
+                    self._write(conn, batch)
+                    batch = []
+                if time.monotonic() >= deadline:
+                    deadline = time.monotonic() + self.flush_interval
+        except Exception as e:
+            self._fail(e, batch)
+        finally:
+            conn.close()
+
+
+def open_article_writer(config):
+    """
+        Return an ArticleWriter when `database.write_through` is enabled.
+
+        The writer thread starts when the returned context is entered.
+
+        Args:
+            config (dict): Parsed settings from `config/settings.yaml`.
+
+        Returns:
+            ArticleWriter or nullcontext: A context manager yielding the writer,
+            or None when scrapers should only write raw JSON files.
+    """
+    if config.get("database", {}).get("write_through", False):
+        return ArticleWriter()
+    return nullcontext(None)
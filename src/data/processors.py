@@ -6,42 +6,56 @@ and conversion of raw data into structured format for storage and analysis.
 """
 
 from src.data.models import NewsArticle
-from src.data.database import insert_articles
+from src.data.database import insert_articles, create_table, InsertResult
+from src.data.manifest import ProcessedLinkIndex, ProcessingManifest
+from src.data.rollups import refresh_keyword_rollups
+from src.data.dates import normalize_date
 import os
 import json
-import re
-from datetime import datetime
+import codecs
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
 from src.utils.logger import setup_logger
+from src.utils.helpers import source_from_link
+from src.utils.fileio import open_text
 
 logger = setup_logger()
 
 RAW_DIR = "data_output/raw"
 PROCESSED_PATH = "data_output/processed/cleaned_articles.json"
+# Outputs written for every cleaned article; "parquet" needs pyarrow and goes
+# to the `articles/` store next to PROCESSED_PATH (see src.data.parquet_store)
+PROCESSED_FORMATS = ("json", "parquet")
+JSON_LINES_EXTENSIONS = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+RAW_EXTENSIONS = (".json",) + JSON_LINES_EXTENSIONS
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_BATCH_SIZE = 1000
+SHARD_BYTES = 64 * 1024 * 1024
 
 
-def normalize_date(date_str):
+def validate_article(article):
     """
-    Normalize various date string formats into standardized YYYY-MM-DD format.
+    Validate an article and return its normalized publication date.
+
+    Lets callers reuse the parsed date instead of normalizing it twice.
 
     Args:
-        date_str (str): Raw date string from article metadata.
+        article (dict): Raw article dictionary.
 
     Returns:
-        str or None: Normalized date in YYYY-MM-DD format, or None if parsing fails.
+        str or None: Normalized YYYY-MM-DD date if the article is valid, else None.
     """
-    if not date_str or not isinstance(date_str, str):
-        return None
-    try:
-        # Handle common formats: ISO, yyyy-mm-dd, yyyy/mm/dd, etc.
-        date_match = re.search(r"\d{4}[-/]\d{2}[-/]\d{2}", date_str)
-        if date_match:
-            dt = datetime.strptime(
-                date_match.group(),
-                "%Y-%m-%d" if "-" in date_match.group() else "%Y/%m/%d",
-            )
-            return dt.strftime("%Y-%m-%d")
-    except Exception:
-        pass
+    title = article.get("title")
+    link = article.get("link")
+    if (
+        isinstance(title, str)
+        and title.strip()
+        and isinstance(link, str)
+        and link.startswith("http")
+    ):
+        return normalize_date(article.get("published"))
     return None
 
 
@@ -55,97 +69,800 @@ def is_valid_article(article):
     Returns:
         bool: True if article is valid, False otherwise.
     """
-    return (
-        isinstance(article.get("title"), str)
-        and article["title"].strip()
-        and isinstance(article.get("link"), str)
-        and article["link"].startswith("http")
-        and normalize_date(article.get("published")) is not None
+    return validate_article(article) is not None
+
+
+@dataclass
+class ProcessingStats:
+    """
+        Counters collected while processing raw article files.
+
+        Attributes:
+            cleaned (int): Number of unique valid articles written out.
+            skipped_articles (int): Articles dropped as invalid or duplicate.
+            skipped_files (int): Files dropped (or cut short) due to invalid JSON.
+    """
+    cleaned: int = 0
+    skipped_articles: int = 0
+    skipped_files: int = 0
+
+
+def iter_json_array(f, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Incrementally decode the elements of a top-level JSON array.
+
+    Only the current element plus a read buffer of roughly `chunk_size`
+    characters is held in memory, so arbitrarily large files can be consumed.
+
+    Args:
+        f (TextIO): Text file object positioned at the start of a JSON array.
+        chunk_size (int): Number of characters read per buffer refill.
+
+    Yields:
+        object: Each decoded array element, in file order.
+
+    Raises:
+        json.JSONDecodeError: If the content is not a well-formed JSON array.
+    """
+    for value, _ in _iter_json_array_elements(f, chunk_size):
+        yield value
+
+
+def _iter_json_array_elements(f, chunk_size=STREAM_CHUNK_SIZE, opening=True, partial=False):
+    """
+    Decode array elements together with the character offset each starts at.
+
+    Args:
+        f (TextIO): Object with a `read(size)` method returning text.
+        chunk_size (int): Number of characters read per buffer refill.
+        opening (bool): `f` starts at the opening "[" rather than at an element.
+        partial (bool): `f` may end after a "," because the next element
+            belongs to another shard (see `read_json_array_shard`).
+
+    Yields:
+        tuple: (element, offset of its first character in `f`).
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof, consumed = "", 0, False, 0
+
+    def read_more(size):
+        nonlocal buffer, pos, eof, consumed
+        chunk = f.read(size)
+        consumed += pos
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+    def next_token():
+        # Skip whitespace and return the next significant character ("" at EOF)
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if eof:
+                return ""
+            read_more(chunk_size)
+
+    if opening:
+        if next_token() != "[":
+            raise json.JSONDecodeError("Expecting '['", buffer, pos)
+        pos += 1
+        if next_token() == "]":
+            return
+
+    while True:
+        if next_token() == "" and partial:
+            return  # The next element starts in the following shard
+        start = consumed + pos
+        size = chunk_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A value touching the end of the buffer may be truncated (e.g. a number)
+                if end < len(buffer) or eof:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            read_more(size)
+            size *= 2  # Avoid quadratic re-decoding of very large elements
+        pos = end
+        yield value, start
+
+        token = next_token()
+        if token == "]":
+            return
+        if token != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+        pos += 1
+
+
+def iter_json_lines(f):
+    """
+    Decode a JSON Lines file one record per line.
+
+    Malformed lines (e.g. a line truncated by an interrupted scrape) are logged
+    and yielded as None so callers can count them without dropping the file.
+
+    Args:
+        f (TextIO): Text file object of newline-delimited JSON records.
+
+    Yields:
+        object or None: Each decoded record, or None for an undecodable line.
+    """
+    for line_no, line in enumerate(f, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"⚠️ Skipping malformed line {line_no} in {f.name}")
+            yield None
+
+
+def list_raw_files(raw_dir=None):
+    """
+    List raw article files (.json arrays and .jsonl records, optionally
+    gzip/zstd-compressed) in a stable order.
+
+    Args:
+        raw_dir (str, optional): Directory to scan. Defaults to RAW_DIR.
+
+    Returns:
+        list[str]: Sorted file paths.
+    """
+    raw_dir = raw_dir or RAW_DIR
+    return [
+        os.path.join(raw_dir, filename)
+        for filename in sorted(os.listdir(raw_dir))
+        if filename.endswith(RAW_EXTENSIONS)
+    ]
+
+
+def read_raw_articles(path, stream=True):
+    """
+    Yield raw article records from a single raw file.
+
+    Args:
+        path (str): Path to a .json (array) or .jsonl (one record per line)
+            file; .jsonl.gz and .jsonl.zst are decompressed on the fly.
+        stream (bool): Parse JSON arrays incrementally instead of loading
+            the whole file with `json.load`.
+
+    Yields:
+        dict or None: Raw article records (None for malformed JSON Lines).
+
+    Raises:
+        json.JSONDecodeError: If a .json file is not a valid JSON array.
+    """
+    if path.endswith(JSON_LINES_EXTENSIONS):
+        with open_text(path) as f:
+            try:
+                yield from iter_json_lines(f)
+            except EOFError:
+                # Compressed stream cut off mid-frame, e.g. a killed crawl
+                logger.warning(f"⚠️ {path} is truncated; kept the records before the cut")
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        if stream:
+            yield from iter_json_array(f)
+        else:
+            yield from json.load(f)
+
+
+def read_json_lines_shard(path, start, end):
+    """
+    Yield the JSON Lines records of a byte range of a .jsonl file.
+
+    A line belongs to the shard in which it starts, so adjacent shards
+    together cover every line exactly once.
+
+    Args:
+        path (str): Path to the .jsonl file.
+        start (int): First byte offset of the shard.
+        end (int): Byte offset where the shard ends (exclusive).
+
+    Yields:
+        dict or None: Decoded records, or None for an undecodable line.
+    """
+    with open(path, "rb") as f:
+        if start:
+            # Finish the line owned by the previous shard
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"⚠️ Skipping malformed line at byte {offset} in {path}")
+                yield None
+
+
+class _ByteRangeReader:
+    """
+        Text reader over the UTF-8 bytes [start, end) of a binary file.
+
+        Args:
+            f (BinaryIO): File positioned at the first byte of the range.
+            end (int): Byte offset where the range ends (exclusive).
+    """
+
+    def __init__(self, f, end):
+        self.f = f
+        self.end = end
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def read(self, size):
+        while True:
+            data = self.f.read(max(0, min(size, self.end - self.f.tell())))
+            text = self.decoder.decode(data, final=not data)
+            # An empty decode of non-empty data is a split multi-byte character
+            if text or not data:
+                return text
+
+
+def read_json_array_shard(path, start, end):
+    """
+    Yield the elements of a byte range of a .json array file.
+
+    Shard boundaries come from `scan_json_array_shards`: every shard but
+    the first starts at an element, and every shard but the last ends at one.
+
+    Args:
+        path (str): Path to the .json file.
+        start (int): First byte offset of the shard.
+        end (int): Byte offset where the shard ends (exclusive).
+
+    Yields:
+        object: Decoded array elements, in file order.
+
+    Raises:
+        json.JSONDecodeError: If the shard is not well-formed.
+    """
+    with open(path, "rb") as f:
+        partial = end < os.fstat(f.fileno()).st_size
+        f.seek(start)
+        reader = _ByteRangeReader(f, end)
+        for value, _ in _iter_json_array_elements(reader, opening=not start, partial=partial):
+            yield value
+
+
+def scan_json_array_shards(path, shard_bytes):
+    """
+    Split a .json array file into byte ranges that start at elements.
+
+    Each element is scanned once with `raw_decode`. Reading the file as
+    latin-1 makes character offsets equal byte offsets; the decoded values
+    are discarded, so the mis-decoded text does not matter.
+
+    Args:
+        path (str): Path to the .json file.
+        shard_bytes (int): Approximate shard size.
+
+    Returns:
+        list[tuple]: (start, end) byte ranges covering the whole file.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a well-formed JSON array.
+    """
+    size = os.path.getsize(path)
+    starts = [0]
+    with open(path, "r", encoding="latin-1") as f:
+        for index, (_, offset) in enumerate(_iter_json_array_elements(f)):
+            if index and offset - starts[-1] >= shard_bytes:
+                starts.append(offset)
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def plan_raw_tasks(shard_bytes=None, paths=None):
+    """
+    Split the raw directory into units of work for parallel processing.
+
+    Uncompressed .json and .jsonl files larger than `shard_bytes` are split
+    into byte-range shards: JSON Lines at line breaks, JSON arrays at element
+    boundaries. A JSON array that fails to scan is left whole so the worker
+    reports it like the sequential path does.
+
+    Args:
+        shard_bytes (int, optional): Approximate shard size.
+            Defaults to SHARD_BYTES.
+        paths (list[str], optional): Raw files to plan. Defaults to every
+            file returned by `list_raw_files`.
+
+    Returns:
+        list[tuple]: (path, start, end) tuples in processing order;
+        `end` is None for whole-file tasks.
+    """
+    shard_bytes = shard_bytes or SHARD_BYTES
+    tasks = []
+    for path in list_raw_files() if paths is None else paths:
+        size = os.path.getsize(path)
+        if size <= shard_bytes:
+            tasks.append((path, 0, None))
+        elif path.endswith(".jsonl"):
+            for start in range(0, size, shard_bytes):
+                tasks.append((path, start, min(start + shard_bytes, size)))
+        elif path.endswith(".json"):
+            try:
+                shards = scan_json_array_shards(path, shard_bytes)
+            except json.JSONDecodeError:
+                shards = [(0, None)]
+            tasks.extend((path, start, end) for start, end in shards)
+        else:
+            tasks.append((path, 0, None))
+    return tasks
+
+
+def _clean_task(task):
+    """
+    Worker entry point: parse and validate one raw file or shard.
+
+    Deduplication is left to the coordinator so results match the
+    sequential pipeline exactly.
+
+    Args:
+        task (tuple): (path, start, end, stream) as produced by `plan_raw_tasks`.
+
+    Returns:
+        tuple: (path, valid articles in order, invalid count, invalid JSON flag).
+    """
+    path, start, end, stream = task
+    logger.debug(f"📄 Reading file: {os.path.basename(path)} [{start}:{end}]")
+    if end is None:
+        records = read_raw_articles(path, stream=stream)
+    elif path.endswith(".json"):
+        records = read_json_array_shard(path, start, end)
+    else:
+        records = read_json_lines_shard(path, start, end)
+
+    articles, invalid, invalid_json = [], 0, False
+    try:
+        for article in records:
+            published = validate_article(article) if isinstance(article, dict) else None
+            if published:
+                article["published"] = published
+                articles.append(article)
+            else:
+                invalid += 1
+    except json.JSONDecodeError:
+        invalid_json = True
+    return path, articles, invalid, invalid_json
+
+
+def _iter_cleaned_parallel(stats, stream, workers, paths, seen_links):
+    """
+    Parallel counterpart of `iter_cleaned_articles`.
+
+    A process pool parses and validates files/shards while this coordinator
+    consumes results in task order and owns the `seen_links` dedup index.
+    At most `2 * workers` results are in flight to bound memory.
+    """
+    tasks = iter(
+        [(path, start, end, stream) for path, start, end in plan_raw_tasks(paths=paths)]
     )
 
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_clean_task, task))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            path, articles, invalid, invalid_json = pending.popleft().result()
+            next_task = next(tasks, None)
+            if next_task:
+                pending.append(executor.submit(_clean_task, next_task))
+
+            stats.skipped_articles += invalid
+            for article in articles:
+                if article["link"] in seen_links:
+                    stats.skipped_articles += 1
+                    continue
+                seen_links.add(article["link"])
+                stats.cleaned += 1
+                yield article
+
+            if invalid_json:
+                logger.warning(f"⚠️ Skipping {os.path.basename(path)}: invalid JSON.")
+                stats.skipped_files += 1
+
+
+def iter_cleaned_articles(stats, stream=True, workers=1, paths=None, seen_links=None):
+    """
+    Yield unique, valid, date-normalized articles from every raw file.
+
+    Args:
+        stats (ProcessingStats): Counters updated in place while iterating.
+        stream (bool): Parse raw files incrementally (see `read_raw_articles`).
+        workers (int): Number of worker processes; values above 1 parse and
+            validate files in parallel with identical output.
+        paths (list[str], optional): Raw files to read. Defaults to every
+            file returned by `list_raw_files`.
+        seen_links (set-like, optional): Links to treat as already seen; must
+            support `in` and `add`. Defaults to an empty set.
+
+    Yields:
+        dict: Cleaned article dictionaries, in file order.
+    """
+    paths = list_raw_files() if paths is None else paths
+    seen_links = set() if seen_links is None else seen_links
+
+    if workers > 1:
+        yield from _iter_cleaned_parallel(stats, stream, workers, paths, seen_links)
+        return
+
+    for path in paths:
+        filename = os.path.basename(path)
+        logger.debug(f"📄 Reading file: {filename}")
+        try:
+            for article in read_raw_articles(path, stream=stream):
+                if not isinstance(article, dict):
+                    stats.skipped_articles += 1
+                    continue
+
+                link = article.get("link")
+                if not link or link in seen_links:
+                    stats.skipped_articles += 1
+                    continue
+
+                published = validate_article(article)
+                if published:
+                    article["published"] = published
+                    seen_links.add(link)
+                    stats.cleaned += 1
+                    yield article
+                else:
+                    logger.debug(
+                        f"🚫 Skipping invalid article: {article.get('title', 'N/A')}"
+                    )
+                    stats.skipped_articles += 1
+        except json.JSONDecodeError:
+            logger.warning(f"⚠️ Skipping {filename}: invalid JSON.")
+            stats.skipped_files += 1
+
+
+class CleanedArticleWriter:
+    """
+        Context manager that writes cleaned articles to a JSON array one at a time.
+
+        The output is byte-for-byte what `json.dump(articles, f, indent=2)` would
+        produce, without ever holding the full article list in memory.
+
+        Args:
+            path (str): Destination JSON file.
+            append (bool): Extend an existing JSON array in place instead of
+                overwriting it. Only the tail of the file is read.
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+        self.count = 0
+        self._has_items = False
+        self._file = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if self.append and os.path.exists(self.path):
+            self._has_items = self._reopen_array()
+            self._file = open(self.path, "a", encoding="utf-8")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write("[")
+        return self
+
+    def _reopen_array(self):
+        """Strip the closing bracket of the existing array; return True if it has elements."""
+        with open(self.path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            tail_start = f.seek(max(0, size - 64))
+            tail = f.read().rstrip()
+            if not tail.endswith(b"]"):
+                raise ValueError(f"{self.path} does not end with a JSON array")
+            body = tail[:-1].rstrip()
+            f.truncate(tail_start + len(body))
+        return bool(body) and not body.endswith(b"[")
+
+    def write(self, article):
+        """Append a single article to the JSON array."""
+        body = json.dumps(article, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        first = self.count == 0 and not self._has_items
+        self._file.write(("\n  " if first else ",\n  ") + body)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.write("\n]" if self.count or self._has_items else "]")
+        self._file.close()
+        return False
+
+
+def parquet_dir():
+    """Location of the Parquet article store, next to PROCESSED_PATH."""
+    return os.path.join(os.path.dirname(PROCESSED_PATH), "articles")
+
+
+def _parquet_store():
+    """Return the parquet_store module, or None when Parquet output is off or unavailable."""
+    if "parquet" not in PROCESSED_FORMATS:
+        return None
+    try:
+        from src.data import parquet_store
+    except ImportError:
+        logger.warning("⚠️ pyarrow is not installed; skipping Parquet output")
+        return None
+    return parquet_store
+
+
+class ProcessedOutputs:
+    """
+        Writes each cleaned article to every configured processed format.
 
-def process_raw_articles():
+        Args:
+            append (bool): Extend the existing outputs (incremental runs).
     """
-        Process all JSON files in the raw data directory.
+
+    def __init__(self, append=False):
+        self.append = append
+        self._stack = ExitStack()
+        self._writers = []
+
+    def __enter__(self):
+        if "json" in PROCESSED_FORMATS:
+            self._writers.append(
+                self._stack.enter_context(CleanedArticleWriter(PROCESSED_PATH, append=self.append))
+            )
+        store = _parquet_store()
+        if store:
+            self._writers.append(
+                self._stack.enter_context(
+                    store.ParquetArticleWriter(parquet_dir(), append=self.append)
+                )
+            )
+        return self
+
+    def write(self, article):
+        for writer in self._writers:
+            writer.write(article)
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._stack.__exit__(exc_type, exc, tb)
+
+
+def _log_summary(stats):
+    """Log the outcome of a processing run."""
+    logger.info(
+        f"✅ Cleaned {stats.cleaned} unique valid articles saved to {PROCESSED_PATH}"
+    )
+    logger.info(
+        f"⚠️ Skipped {stats.skipped_articles} articles due to invalid or duplicate data"
+    )
+    if stats.skipped_files > 0:
+        logger.info(f"⚠️ Skipped {stats.skipped_files} files due to invalid JSON.")
+
+
+def _plan_run(incremental):
+    """
+    Select the raw files and dedup index for a processing run.
+
+    In incremental mode only new or changed files (per the manifest) are read,
+    and links are deduplicated against the `ProcessedLinkIndex` kept next to
+    the manifest, so history never has to be reloaded. The `articles` table
+    is not used for this: write-through scrapers store articles there before
+    they are processed.
+
+    When `cleaned_articles.json`, the Parquet store or the link index does not
+    exist yet, every raw file is read once to rebuild them and the run
+    replaces the outputs instead of appending.
+
+    Returns:
+        tuple: (paths, seen_links, manifest or None, changed (path, entry) pairs,
+        append flag for the outputs).
+    """
+    paths = list_raw_files()
+    if not incremental:
+        return paths, set(), None, [], False
+
+    manifest = ProcessingManifest()
+    store = _parquet_store()
+    missing = None
+    if not os.path.exists(PROCESSED_PATH):
+        missing = "No cleaned_articles.json"
+    elif store and not store.has_parquet_store(parquet_dir()):
+        missing = "No Parquet store yet"
+    elif not manifest.has_link_index():
+        missing = "No processed-link index yet"
+
+    seen_links = manifest.open_link_index()
+    if missing:
+        logger.info(f"🔁 {missing} — rebuilding the processed outputs from all raw files")
+        manifest.reset()
+        seen_links.clear()
+        return paths, seen_links, manifest, manifest.changed_files(paths), False
+
+    changed = manifest.changed_files(paths)
+    logger.info(f"🔁 Incremental run: {len(changed)} of {len(paths)} raw files changed")
+    return [path for path, _ in changed], seen_links, manifest, changed, True
+
+
+def _finish_run(seen_links, manifest, changed):
+    """Record processed files and links once the outputs are written."""
+    if manifest is None:
+        return
+    # Links first: a crash before the manifest is saved only re-reads files
+    if isinstance(seen_links, ProcessedLinkIndex):
+        seen_links.save()
+        seen_links.close()
+    for path, entry in changed:
+        manifest.record(path, entry)
+    manifest.save()
+
+
+def process_raw_articles(workers=1, incremental=False):
+    """
+        Process all raw article files (.json and .jsonl) in the raw data directory.
 
         - Deduplicates articles by link.
         - Validates essential fields.
         - Normalizes publication dates.
-        - Saves cleaned articles to a JSON file.
+        - Saves cleaned articles to a JSON file and the partitioned Parquet store.
+
+        Args:
+            workers (int): Number of processes used to parse and validate files.
+            incremental (bool): Only read raw files that are new or changed since
+                the last run and append their articles to the existing output.
 
         Returns:
-            list[dict]: A list of cleaned and valid articles.
+            list[dict]: A list of cleaned and valid articles (only the newly
+            added ones in incremental mode).
     """
     logger.info("🧹 Starting raw article processing...")
-    seen_links = set()
+    stats = ProcessingStats()
     cleaned_articles = []
-    skipped_files = 0
-    skipped_articles = 0
-
-    for filename in os.listdir(RAW_DIR):
-        if filename.endswith(".json"):
-            path = os.path.join(RAW_DIR, filename)
-            logger.debug(f"📄 Reading file: {filename}")
-            with open(path, "r", encoding="utf-8") as f:
-                try:
-                    articles = json.load(f)
-                except json.JSONDecodeError:
-                    logger.warning(f"⚠️ Skipping {filename}: invalid JSON.")
-                    skipped_files += 1
-                    continue
+    paths, seen_links, manifest, changed, append = _plan_run(incremental)
 
-                logger.debug(f"🔍 {len(articles)} articles found in {filename}")
-                for article in articles:
-                    link = article.get("link")
-                    if not link or link in seen_links:
-                        skipped_articles += 1
-                        continue
-
-                    if is_valid_article(article):
-                        article["published"] = normalize_date(article["published"])
-                        seen_links.add(link)
-                        cleaned_articles.append(article)
-                    else:
-                        logger.debug(
-                            f"🚫 Skipping invalid article: {article.get('title', 'N/A')}"
-                        )
-                        skipped_articles += 1
-
-    os.makedirs(os.path.dirname(PROCESSED_PATH), exist_ok=True)
-    with open(PROCESSED_PATH, "w", encoding="utf-8") as f:
-        json.dump(cleaned_articles, f, indent=2, ensure_ascii=False)
+    with ProcessedOutputs(append=append) as writer:
+        for article in iter_cleaned_articles(
+            stats, stream=False, workers=workers, paths=paths, seen_links=seen_links
+        ):
+            writer.write(article)
+            cleaned_articles.append(article)
 
-    logger.info(
-        f"✅ Cleaned {len(cleaned_articles)} unique valid articles saved to {PROCESSED_PATH}"
-    )
-    logger.info(
-        f"⚠️ Skipped {skipped_articles} articles due to invalid or duplicate data"
-    )
-    if skipped_files > 0:
-        logger.info(f"⚠️ Skipped {skipped_files} files due to invalid JSON.")
+    _finish_run(seen_links, manifest, changed)
+    _log_summary(stats)
     return cleaned_articles
 
 
-def process_and_save_all_articles():
+def stream_raw_articles(
+    on_batch=None, batch_size=STREAM_BATCH_SIZE, workers=1, incremental=False
+):
+    """
+        Constant-memory variant of `process_raw_articles`.
+
+        Raw JSON arrays are decoded incrementally and each cleaned article is
+        written to the output file as soon as it passes validation. Only the
+        set of seen links grows with the corpus.
+
+        Args:
+            on_batch (callable, optional): Called with each list of up to
+                `batch_size` cleaned articles (e.g. to insert into the database).
+            batch_size (int): Number of articles handed to `on_batch` at once.
+            workers (int): Number of processes used to parse and validate files.
+            incremental (bool): Only read new or changed raw files (see
+                `process_raw_articles`).
+
+        Returns:
+            ProcessingStats: Counters for the run.
+    """
+    logger.info("🧹 Starting streaming raw article processing...")
+    stats = ProcessingStats()
+    batch = []
+    paths, seen_links, manifest, changed, append = _plan_run(incremental)
+
+    with ProcessedOutputs(append=append) as writer:
+        for article in iter_cleaned_articles(
+            stats, stream=True, workers=workers, paths=paths, seen_links=seen_links
+        ):
+            writer.write(article)
+            if on_batch:
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    on_batch(batch)
+                    batch = []
+    if on_batch and batch:
+        on_batch(batch)
+
+    _finish_run(seen_links, manifest, changed)
+    _log_summary(stats)
+    return stats
+
+
+def to_news_article(article):
+    """
+        Convert a cleaned article dictionary into a NewsArticle object.
+
+        Args:
+            article (dict): Cleaned article.
+
+        Returns:
+            NewsArticle: Object ready for database insertion.
+    """
+    return NewsArticle(
+        title=article.get("title", "N/A"),
+        link=article.get("link", "N/A"),
+        category=article.get("category", "N/A"),
+        published=article.get("published", "N/A"),
+        source=article.get("source") or source_from_link(article.get("link")),
+    )
+
+
+def to_news_articles(articles):
+    """
+        Convert cleaned article dictionaries into NewsArticle objects.
+
+        Args:
+            articles (list[dict]): Cleaned articles.
+
+        Returns:
+            list[NewsArticle]: Objects ready for database insertion.
+    """
+    return [to_news_article(a) for a in articles]
+
+
+def process_and_save_all_articles(stream=False, workers=1, incremental=False):
     """
         Full processing pipeline to:
         - Clean and validate raw scraped data.
         - Convert it to NewsArticle objects.
         - Insert into the SQLite database.
+        - Add the new articles' title keywords to the keyword rollups
+          (daily article counts are kept current by database triggers).
+
+        Args:
+            stream (bool): Use constant-memory streaming ingestion and insert
+                articles into the database in batches as they are cleaned.
+            workers (int): Number of processes used to parse and validate files.
+            incremental (bool): Only process raw files that changed since the
+                last run, merging new articles into the existing output and table.
+
+        Returns:
+            int: Number of cleaned articles handed to the database.
     """
     logger.info("💾 Starting full article processing and database insertion...")
-    raw_articles = process_raw_articles()
-
-    article_objs = [
-        NewsArticle(
-            title=a.get("title", "N/A"),
-            link=a.get("link", "N/A"),
-            category=a.get("category", "N/A"),
-            published=a.get("published", "N/A"),
-            source="merged",
+    create_table()
+
+    result = InsertResult()
+
+    def save_batch(batch):
+        batch_result = insert_articles(to_news_articles(batch))
+        result.inserted += batch_result.inserted
+        result.ignored += batch_result.ignored
+        result.failed += batch_result.failed
+
+    if stream:
+        stats = stream_raw_articles(
+            on_batch=save_batch, workers=workers, incremental=incremental
         )
-        for a in raw_articles
-    ]
+        total = stats.cleaned
+    else:
+        articles = process_raw_articles(workers=workers, incremental=incremental)
+        save_batch(articles)
+        total = len(articles)
 
-    insert_articles(article_objs)
-    logger.info(f"🗃️ Inserted {len(article_objs)} articles into the database.")
+    logger.info(
+        f"🗃️ Inserted {result.inserted} articles into the database "
+        f"({result.ignored} already stored, {result.failed} failed)."
+    )
+    refresh_keyword_rollups()
+    return total
@@ -0,0 +1,346 @@
+"""
+Read-side query API over the SQLite `articles` table.
+
+Counts are read from the `daily_counts` rollup (articles per day, category
+and source, kept current by triggers) and keyword statistics from the
+keyword rollups (see `src.data.rollups`), so report-time statistics cost
+the same however many articles are stored. Article listings use the
+`published_date`, `(category, published_date)` and `(source,
+published_date)` indexes created by the schema migrations in `database.py`.
+
+Dates are 'YYYY-MM-DD' strings (or `datetime.date` objects); ranges are
+inclusive on both ends and either end may be omitted.
+
+Title search uses the `articles_fts` FTS5 index with BM25 ranking.
+"""
+
+import re
+from datetime import date, timedelta
+from src.data.database import create_table
+from src.data.pool import get_pool
+
+_migrated_paths = set()
+
+
+def _connection():
+    """Return this thread's pooled connection, migrating the schema once per database."""
+    pool = get_pool()
+    conn = pool.connection()
+    if pool.path not in _migrated_paths:
+        create_table(conn)
+        _migrated_paths.add(pool.path)
+    return conn
+
+
+GROUP_COLUMNS = ("category", "source")
+
+
+def _where(start=None, end=None, category=None, source=None, table="", date_column="published_date"):
+    """Build a WHERE clause and parameters for the common filters."""
+    column = f"{table}." if table else ""
+    clauses, params = [f"{column}{date_column} IS NOT NULL"], []
+    if start is not None:
+        clauses.append(f"{column}{date_column} >= ?")
+        params.append(str(start))
+    if end is not None:
+        clauses.append(f"{column}{date_column} <= ?")
+        params.append(str(end))
+    if category is not None:
+        clauses.append(f"{column}category = ?")
+        params.append(category)
+    if source is not None:
+        clauses.append(f"{column}source = ?")
+        params.append(source)
+    return " AND ".join(clauses), params
+
+
+def total_articles(start=None, end=None, category=None, source=None):
+    """
+        Count articles matching the filters.
+
+        Args:
+            start (str, optional): First publication date to include.
+            end (str, optional): Last publication date to include.
+            category (str, optional): Restrict to one category.
+            source (str, optional): Restrict to one source domain.
+
+        Returns:
+            int: Number of matching articles.
+    """
+    where, params = _where(start, end, category, source, date_column="day")
+    return _connection().execute(
+        f"SELECT ifnull(SUM(count), 0) FROM daily_counts WHERE {where}", params
+    ).fetchone()[0]
+
+
+def count_by_day(start=None, end=None, category=None, source=None):
+    """
+        Count articles per publication day.
+
+        Args:
+            start (str, optional): First publication date to include.
+            end (str, optional): Last publication date to include.
+            category (str, optional): Restrict to one category.
+            source (str, optional): Restrict to one source domain.
+
+        Returns:
+            list[tuple[str, int]]: (day, count) pairs in date order; days
+            without articles are omitted.
+    """
+    where, params = _where(start, end, category, source, date_column="day")
+    return _connection().execute(
+        f"""
+        SELECT day, SUM(count) AS n FROM daily_counts
+        WHERE {where}
+        GROUP BY day
+        HAVING n > 0
+        ORDER BY day
+        """,
+        params,
+    ).fetchall()
+
+
+def count_by_day_and_group(group, start=None, end=None, category=None, source=None):
+    """
+        Count articles per publication day and category or source.
+
+        Args:
+            group (str): 'category' or 'source'.
+            start, end, category, source: Same filters as `count_by_day`.
+
+        Returns:
+            list[tuple[str, str, int]]: (day, group value, count) rows in date
+            order; missing values are reported as 'Unknown'.
+
+        Raises:
+            ValueError: If `group` is not a rollup column.
+    """
+    if group not in GROUP_COLUMNS:
+        raise ValueError(f"Cannot group daily counts by {group!r}; use one of {GROUP_COLUMNS}")
+    where, params = _where(start, end, category, source, date_column="day")
+    return _connection().execute(
+        f"""
+        SELECT day, COALESCE(NULLIF({group}, ''), 'Unknown') AS value, SUM(count) AS n
+        FROM daily_counts
+        WHERE {where}
+        GROUP BY day, value
+        HAVING n > 0
+        ORDER BY day, value
+        """,
+        params,
+    ).fetchall()
+
+
+def top_days(limit=5, start=None, end=None, category=None, source=None):
+    """
+        Return the busiest publication days.
+
+        Args:
+            limit (int): Number of days to return.
+            start, end, category, source: Same filters as `count_by_day`.
+
+        Returns:
+            list[tuple[str, int]]: (day, count) pairs, busiest first.
+    """
+    where, params = _where(start, end, category, source, date_column="day")
+    return _connection().execute(
+        f"""
+        SELECT day, SUM(count) AS n FROM daily_counts
+        WHERE {where}
+        GROUP BY day
+        HAVING n > 0
+        ORDER BY n DESC, day DESC
+        LIMIT ?
+        """,
+        params + [limit],
+    ).fetchall()
+
+
+def count_by_category(start=None, end=None, source=None):
+    """
+        Count articles per category.
+
+        Args:
+            start (str, optional): First publication date to include.
+            end (str, optional): Last publication date to include.
+            source (str, optional): Restrict to one source domain.
+
+        Returns:
+            list[tuple[str, int]]: (category, count) pairs, largest first.
+            Missing categories are reported as 'Unknown'.
+    """
+    where, params = _where(start, end, source=source, date_column="day")
+    return _connection().execute(
+        f"""
+        SELECT COALESCE(NULLIF(category, ''), 'Unknown'), SUM(count) AS n FROM daily_counts
+        WHERE {where}
+        GROUP BY category
+        HAVING n > 0
+        ORDER BY n DESC, category
+        """,
+        params,
+    ).fetchall()
+
+
+def top_keywords(limit=10, start=None, end=None, category=None):
+    """
+        Return the most frequent title keywords from the keyword rollups.
+
+        Only articles rolled up by `src.data.rollups.refresh_keyword_rollups`
+        are counted; call it first to include newly stored articles.
+
+        Args:
+            limit (int): Number of keywords to return.
+            start (str, optional): First publication date to include.
+            end (str, optional): Last publication date to include.
+            category (str, optional): Restrict to one category.
+
+        Returns:
+            list[tuple[str, int]]: (keyword, count) pairs, most frequent first.
+    """
+    if start is None and end is None and category is None:
+        # All-time totals, read in order from the (count DESC, keyword) index
+        return _connection().execute(
+            "SELECT keyword, count FROM keyword_counts ORDER BY count DESC, keyword LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    where, params = _where(start, end, category, date_column="day")
+    return _connection().execute(
+        f"""
+        SELECT keyword, SUM(count) AS n FROM daily_keyword_counts
+        WHERE {where}
+        GROUP BY keyword
+        ORDER BY n DESC, keyword
+        LIMIT ?
+        """,
+        params + [limit],
+    ).fetchall()
+
+
+def top_ngrams(n, limit=10):
+    """
+        Return the most frequent title n-grams from the n-gram rollup.
+
+        Only sizes listed in `analysis.keywords.ngrams` are rolled up by
+        `src.data.rollups.refresh_keyword_rollups`.
+
+        Args:
+            n (int): N-gram size, e.g. 2 for bigrams.
+            limit (int): Number of n-grams to return.
+
+        Returns:
+            list[tuple[str, int]]: (n-gram, count) pairs, most frequent first.
+    """
+    return _connection().execute(
+        "SELECT term, count FROM ngram_counts WHERE n = ? ORDER BY count DESC, term LIMIT ?",
+        (n, limit),
+    ).fetchall()
+
+
+def articles_in_range(start=None, end=None, category=None, source=None, limit=100, offset=0):
+    """
+        Fetch one page of articles published in a date range, newest first.
+
+        Args:
+            start (str, optional): First publication date to include.
+            end (str, optional): Last publication date to include.
+            category (str, optional): Restrict to one category.
+            source (str, optional): Restrict to one source domain.
+            limit (int): Page size.
+            offset (int): Number of matching articles to skip.
+
+        Returns:
+            list[dict]: Articles with title, link, category, published and source.
+    """
+    where, params = _where(start, end, category, source)
+    cursor = _connection().execute(
+        f"""
+        SELECT title, link, category, published_date, source FROM articles
+        WHERE {where}
+        ORDER BY published_date DESC, id DESC
+        LIMIT ? OFFSET ?
+        """,
+        params + [limit, offset],
+    )
+    columns = ("title", "link", "category", "published", "source")
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+_TERM_RE = re.compile(r"\w+\*?")
+
+
+def build_match_query(text, prefix=False):
+    """
+        Turn free text into a safe FTS5 MATCH expression.
+
+        Every word is quoted, so FTS5 operators in user input are treated as
+        plain text, and all words must match. A word ending in '*' (or every
+        word when `prefix` is True) matches as a prefix.
+
+        Args:
+            text (str): User search text, e.g. 'climate pol*'.
+            prefix (bool): Treat every word as a prefix.
+
+        Returns:
+            str or None: MATCH expression, or None if `text` has no words.
+    """
+    terms = []
+    for term in _TERM_RE.findall(text or ""):
+        word = term.rstrip("*")
+        terms.append(f'"{word}"*' if prefix or term.endswith("*") else f'"{word}"')
+    return " ".join(terms) or None
+
+
+def search_articles(
+    text,
+    days=None,
+    start=None,
+    end=None,
+    category=None,
+    source=None,
+    prefix=False,
+    limit=20,
+    offset=0,
+):
+    """
+        Full-text search over article titles, best matches first.
+
+        Args:
+            text (str): Words to search for; all must appear in the title.
+                Append '*' to a word for a prefix match.
+            days (int, optional): Only articles from the last N days
+                (overrides `start`).
+            start (str, optional): First publication date to include.
+            end (str, optional): Last publication date to include.
+            category (str, optional): Restrict to one category.
+            source (str, optional): Restrict to one source domain.
+            prefix (bool): Treat every word as a prefix.
+            limit (int): Page size.
+            offset (int): Number of results to skip.
+
+        Returns:
+            list[dict]: Articles with title, link, category, published, source
+            and BM25 `score` (lower is better).
+    """
+    match = build_match_query(text, prefix)
+    if match is None:
+        return []
+    if days is not None:
+        start = date.today() - timedelta(days=days)
+
+    where, params = _where(start, end, category, source, table="a")
+    cursor = _connection().execute(
+        f"""
+        SELECT a.title, a.link, a.category, a.published_date, a.source,
+               bm25(articles_fts) AS score
+        FROM articles_fts
+        JOIN articles AS a ON a.id = articles_fts.rowid
+        WHERE articles_fts MATCH ? AND {where}
+        ORDER BY score
+        LIMIT ? OFFSET ?
+        """,
+        [match] + params + [limit, offset],
+    )
+    columns = ("title", "link", "category", "published", "source", "score")
+    return [dict(zip(columns, row)) for row in cursor]
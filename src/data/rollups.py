@@ -0,0 +1,196 @@
+"""
+Incremental rollups over the `articles` table (schema v4 and v5).
+
+`daily_counts` (articles per day, category and source) is kept exact by
+triggers on `articles`; see `database._migration_rollups`.
+
+Keyword rollups are maintained here. `refresh_keyword_rollups` tokenizes
+only the articles whose id is above the `keywords` watermark in
+`rollup_state`, adds their title keyword counts to `daily_keyword_counts`
+(per day and category) and `keyword_counts` (all time), and advances the
+watermark in the same transaction. Each article is therefore counted once,
+whichever writer stored it, and report queries read aggregate rows instead
+of scanning every article.
+
+The configured n-gram sizes above 1 (`analysis.keywords.ngrams`) are rolled
+up the same way into `ngram_counts`, each behind its own `ngrams:<n>`
+watermark, so a size added to the settings later is backfilled on the next
+refresh.
+
+Keyword rollups do not follow deletes or title edits; after changing the
+stopwords, `reset_keyword_rollups` makes the next refresh recount everything.
+"""
+
+from collections import Counter
+from contextlib import closing
+from src.data.database import create_table, get_connection
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+KEYWORD_ROLLUP = "keywords"
+NGRAM_ROLLUP = "ngrams:{n}"
+REFRESH_BATCH_SIZE = 100_000
+
+UPSERT_DAILY_KEYWORD_SQL = """
+    INSERT INTO daily_keyword_counts (day, category, keyword, count) VALUES (?, ?, ?, ?)
+    ON CONFLICT (day, category, keyword) DO UPDATE SET count = count + excluded.count
+"""
+
+UPSERT_KEYWORD_SQL = """
+    INSERT INTO keyword_counts (keyword, count) VALUES (?, ?)
+    ON CONFLICT (keyword) DO UPDATE SET count = count + excluded.count
+"""
+
+UPSERT_NGRAM_SQL = """
+    INSERT INTO ngram_counts (n, term, count) VALUES (?, ?, ?)
+    ON CONFLICT (n, term) DO UPDATE SET count = count + excluded.count
+"""
+
+UPSERT_WATERMARK_SQL = """
+    INSERT INTO rollup_state (name, last_id) VALUES (?, ?)
+    ON CONFLICT (name) DO UPDATE SET last_id = excluded.last_id
+"""
+
+
+def _watermark(conn, name=KEYWORD_ROLLUP):
+    row = conn.execute(
+        "SELECT last_id FROM rollup_state WHERE name = ?", (name,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _new_rows(conn, name, batch_size):
+    return conn.execute(
+        """
+        SELECT id, title, published_date, ifnull(category, '') FROM articles
+        WHERE id > ? ORDER BY id LIMIT ?
+        """,
+        (_watermark(conn, name), batch_size),
+    ).fetchall()
+
+
+def _roll_up_ngram_batch(conn, engine, n, batch_size):
+    """Count the n-grams of one batch of new articles; return how many were read."""
+    name = NGRAM_ROLLUP.format(n=n)
+    rows = _new_rows(conn, name, batch_size)
+    if not rows:
+        return 0
+
+    counts = engine.count((row[1] for row in rows if row[2] is not None), n=n)
+    conn.executemany(UPSERT_NGRAM_SQL, ((n, term, count) for term, count in counts.items()))
+    conn.execute(UPSERT_WATERMARK_SQL, (name, rows[-1][0]))
+    return len(rows)
+
+
+def _roll_up_batch(conn, engine, batch_size):
+    """Count one batch of new articles; return how many were read."""
+    rows = _new_rows(conn, KEYWORD_ROLLUP, batch_size)
+    if not rows:
+        return 0
+
+    dated = [row for row in rows if row[2] is not None]
+    by_day = engine.count_by((row[1] for row in dated), ((row[2], row[3]) for row in dated))
+    totals = Counter()
+    for counts in by_day.values():
+        totals.update(counts)
+
+    conn.executemany(
+        UPSERT_DAILY_KEYWORD_SQL,
+        (
+            (day, category, keyword, count)
+            for (day, category), counts in by_day.items()
+            for keyword, count in counts.items()
+        ),
+    )
+    conn.executemany(UPSERT_KEYWORD_SQL, totals.items())
+    conn.execute(UPSERT_WATERMARK_SQL, (KEYWORD_ROLLUP, rows[-1][0]))
+    return len(rows)
+
+
+def refresh_keyword_rollups(conn=None, engine=None, batch_size=REFRESH_BATCH_SIZE, ngrams=None):
+    """
+        Add the keywords and n-grams of articles stored since the last refresh
+        to the rollups.
+
+        Each batch is counted and committed together with the new watermark
+        inside one write transaction, so concurrent refreshes never count an
+        article twice.
+
+        Args:
+            conn (sqlite3.Connection, optional): Connection to use. A new
+                connection is opened and closed when omitted.
+            engine (KeywordEngine, optional): Defaults to the shared engine
+                configured in `analysis.keywords`.
+            batch_size (int): Articles read per transaction.
+            ngrams (iterable of int, optional): N-gram sizes to roll up; sizes
+                above 1 go to `ngram_counts`. Defaults to the configured
+                `analysis.keywords.ngrams`.
+
+        Returns:
+            int: Number of new articles rolled up (the most over the keyword
+            and n-gram rollups, which may be at different watermarks).
+    """
+    if conn is None:
+        with closing(get_connection()) as own_conn:
+            return refresh_keyword_rollups(own_conn, engine, batch_size, ngrams)
+    if engine is None or ngrams is None:
+        from src.analysis.keywords import get_keyword_engine
+
+        shared_engine, configured_ngrams = get_keyword_engine()
+        engine = engine or shared_engine
+        ngrams = configured_ngrams if ngrams is None else ngrams
+
+    create_table(conn)
+    steps = [lambda: _roll_up_batch(conn, engine, batch_size)]
+    steps += [
+        lambda n=n: _roll_up_ngram_batch(conn, engine, n, batch_size)
+        for n in sorted(set(ngrams) - {1})
+    ]
+    total = 0
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # Transactions are managed explicitly
+    try:
+        for step in steps:
+            rolled_up = 0
+            while True:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    count = step()
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                rolled_up += count
+                if count < batch_size:
+                    break
+            total = max(total, rolled_up)
+    finally:
+        conn.isolation_level = isolation_level
+
+    if total:
+        logger.info(f"🧮 Rolled up keywords of {total} new articles")
+    return total
+
+
+def reset_keyword_rollups(conn=None):
+    """
+        Clear the keyword and n-gram rollups so the next refresh recounts
+        every article.
+
+        Args:
+            conn (sqlite3.Connection, optional): Connection to use. A new
+                connection is opened and closed when omitted.
+    """
+    if conn is None:
+        with closing(get_connection()) as own_conn:
+            return reset_keyword_rollups(own_conn)
+    create_table(conn)
+    with conn:
+        conn.execute("DELETE FROM daily_keyword_counts")
+        conn.execute("DELETE FROM keyword_counts")
+        conn.execute("DELETE FROM ngram_counts")
+        conn.execute(
+            "DELETE FROM rollup_state WHERE name = ? OR name LIKE ?",
+            (KEYWORD_ROLLUP, NGRAM_ROLLUP.format(n="%")),
+        )
@@ -11,12 +11,13 @@ from src.strategies.dynamic_strategy import DynamicScraperStrategy
 from src.strategies.scrapy_strategy import ScrapyScraperStrategy
 
 
-def get_scraper(scraper_type: str) -> ScraperStrategy:
+def get_scraper(scraper_type: str, **options) -> ScraperStrategy:
     """
         Return the corresponding scraper strategy instance based on the type.
 
         Args:
             scraper_type (str): The type of scraper to use ("static", "dynamic", or "scrapy").
+            **options: Settings overrides passed to the Scrapy strategy.
 
         Returns:
             ScraperStrategy: An instance of the appropriate scraper strategy.
@@ -29,6 +30,6 @@ def get_scraper(scraper_type: str) -> ScraperStrategy:
     elif scraper_type == "dynamic":
         return DynamicScraperStrategy()
     elif scraper_type == "scrapy":
-        return ScrapyScraperStrategy()
+        return ScrapyScraperStrategy(**options)
     else:
         raise ValueError(f"Unknown scraper type: {scraper_type}")
@@ -0,0 +1,169 @@
+"""
+Asynchronous engine for the NPR static scraper, built on asyncio and aiohttp.
+
+The blocking engine in `static_scraper.scrape_npr` waits for each 'Load More'
+page before requesting the next one. This engine instead:
+- Shares one connection-pooled `aiohttp.ClientSession` (keep-alive, DNS cache)
+- Keeps up to `concurrency` page offsets in flight at once
+- Consumes pages strictly in offset order, so results and the "empty page =
+  end of listing" rule match the sync engine
+- Gets politeness from the shared per-host token bucket
+  (`src.utils.rate_limiter`), awaited without blocking the loop
+- Runs response cache lookups and writes (SQLite index plus gzip bodies)
+  in worker threads, so disk I/O does not stall the other requests
+
+Parsing reuses `static_scraper.parse_page`, so both engines produce the
+same records.
+"""
+
+import asyncio
+import aiohttp
+from src.scrapers.static_scraper import (
+    BASE_URL,
+    NEXT_URL_TEMPLATE,
+    PAGE_SIZE,
+    MAX_ARTICLES,
+    PageCollector,
+    build_headers,
+    parse_page,
+)
+from src.utils.logger import setup_logger
+from src.utils.rate_limiter import get_rate_limiter
+
+logger = setup_logger()
+
+CONCURRENCY = 8
+
+
+async def fetch_page(session, url, limiter, cache=None, retries=3, retry_delay=2):
+    """
+        Fetch a page body with the same retry and caching semantics as `safe_request`.
+
+        Args:
+            session (aiohttp.ClientSession): Shared session.
+            url (str): The target URL to request.
+            limiter (RateLimiter): Rate limiter consulted before every attempt.
+            cache (HttpCache, optional): Response cache; cached pages are
+                revalidated and reused on `304 Not Modified`.
+            retries (int): Number of attempts.
+            retry_delay (float): Seconds to wait after a failed attempt.
+
+        Returns:
+            str or None: The response text if a 200 (or 304 with a cached copy)
+            was received, otherwise None.
+    """
+    cached = await asyncio.to_thread(cache.get, url) if cache else None
+    headers = cached.conditional_headers() if cached else None
+
+    for attempt in range(1, retries + 1):
+        await limiter.acquire_async(url)
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    return cached.text()
+                if response.status == 200:
+                    if cache:
+                        body = await response.read()
+                        await asyncio.to_thread(cache.store, url, body, response.headers)
+                    return await response.text()
+                logger.warning(f"⚠️ Status {response.status} on attempt {attempt} for {url}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"❌ Attempt {attempt} failed for {url}: {e}")
+        await asyncio.sleep(retry_delay)
+    return None
+
+
+async def scrape_npr_async(
+    base_url=BASE_URL,
+    next_url_template=NEXT_URL_TEMPLATE,
+    max_articles=MAX_ARTICLES,
+    concurrency=CONCURRENCY,
+    rate_limiter=None,
+    cache=None,
+    timeout=5,
+    writer=None,
+    frontier=None,
+):
+    """
+        Collect NPR articles with concurrent 'Load More' requests (the "async" engine).
+
+        Up to `concurrency` offsets are requested ahead of the page being
+        consumed, so a few pages past the end of the listing may be fetched
+        and discarded.
+
+        Args:
+            base_url (str): First listing page.
+            next_url_template (str): 'Load More' URL with a `{start}` offset placeholder.
+            max_articles (int): Stop after this many articles.
+            concurrency (int): Maximum page requests in flight.
+            rate_limiter (RateLimiter, optional): Per-host limiter; defaults to
+                the shared one configured in `config/settings.yaml`.
+            cache (HttpCache, optional): Response cache for conditional requests.
+            timeout (float): Total timeout per request in seconds.
+            writer (ArticleWriter, optional): Receives each article when
+                write-through is enabled.
+            frontier (CrawlFrontier, optional): Skip known articles and stop at
+                the first page that is entirely known.
+
+        Returns:
+            list[dict] or None: Scraped articles, or None if the first page failed.
+    """
+    limiter = rate_limiter or get_rate_limiter()
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    collector = PageCollector(max_articles, writer, frontier)
+
+    async with aiohttp.ClientSession(
+        headers=build_headers(base_url),
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as session:
+        html = await fetch_page(session, base_url, limiter, cache)
+        if html is None:
+            logger.error(f"❌ Failed to fetch initial page: {base_url}")
+            return None
+        articles = parse_page(html)
+        logger.debug(f"🔎 Found {len(articles)} articles on the initial page")
+        if collector.add_page(articles):
+            logger.info("🛑 Initial page already crawled — nothing new.")
+            return collector.articles
+
+        pending = {}
+        start = next_start = PAGE_SIZE
+        try:
+            while not collector.full:
+                while len(pending) < concurrency:
+                    page_url = next_url_template.format(start=next_start)
+                    logger.debug(f"🔁 Requesting: {page_url}")
+                    pending[next_start] = asyncio.create_task(
+                        fetch_page(session, page_url, limiter, cache)
+                    )
+                    next_start += PAGE_SIZE
+
+                html = await pending.pop(start)
+                if html is None:
+                    logger.warning(f"⚠️ Skipping start={start} due to fetch failure.")
+                    start += PAGE_SIZE
+                    continue
+
+                articles = parse_page(html)
+                logger.debug(f"🔎 Found {len(articles)} articles at start={start}")
+                if not articles:
+                    logger.info("📭 No more articles found — ending early.")
+                    break
+                if collector.add_page(articles):
+                    logger.info(f"🛑 Page start={start} already crawled — stopping.")
+                    break
+                start += PAGE_SIZE
+        finally:
+            for task in pending.values():
+                task.cancel()
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    if collector.full:
+        logger.info(f"✅ Reached {max_articles} articles. Stopping.")
+    return collector.articles
+
+
+def run_async_scraper(**kwargs):
+    """Run `scrape_npr_async` to completion from synchronous code; see it for arguments."""
+    return asyncio.run(scrape_npr_async(**kwargs))
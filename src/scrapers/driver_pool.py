@@ -0,0 +1,189 @@
+"""
+Bounded pool of reusable headless Chrome drivers for the Selenium scrapers.
+
+Starting Chrome is by far the most expensive step of a dynamic scrape, so
+drivers are created lazily up to `size` and handed back to the pool after
+each page instead of being quit. Every driver is tuned for listing pages:
+
+- `pageLoadStrategy=eager`: `driver.get` returns at DOMContentLoaded
+  instead of waiting for every subresource
+- images, media, fonts, stylesheets and common ad/analytics scripts are
+  blocked through Chrome preferences and the DevTools protocol
+
+Settings come from the `selenium` section of `config/settings.yaml`:
+
+    selenium:
+      pool_size: 3
+      page_load_timeout: 20
+      block_resources: true
+"""
+
+import queue
+import threading
+from contextlib import contextmanager, suppress
+from src.utils.helpers import get_random_user_agent
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+DEFAULT_POOL_SIZE = 3
+PAGE_LOAD_TIMEOUT = 20
+
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*scorecardresearch.com*",
+]
+
+
+def build_chrome_options(user_agent=None, block_resources=True):
+    """
+        Build headless Chrome options for fast listing-page loads.
+
+        Args:
+            user_agent (str, optional): User agent; a random one when omitted.
+            block_resources (bool): Disable image loading via preferences.
+
+        Returns:
+            Options: Chrome options with `pageLoadStrategy` set to 'eager'.
+    """
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.page_load_strategy = "eager"
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"user-agent={user_agent or get_random_user_agent()}")
+    if block_resources:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    return options
+
+
+def create_chrome_driver(block_resources=True, page_load_timeout=PAGE_LOAD_TIMEOUT):
+    """
+        Start a tuned headless Chrome driver.
+
+        Args:
+            block_resources (bool): Also block stylesheets, media, fonts and
+                trackers via DevTools.
+            page_load_timeout (float): Seconds before `driver.get` gives up.
+
+        Returns:
+            WebDriver: Ready-to-use Chrome driver.
+    """
+    from selenium import webdriver
+
+    driver = webdriver.Chrome(options=build_chrome_options(block_resources=block_resources))
+    driver.set_page_load_timeout(page_load_timeout)
+    if block_resources:
+        with suppress(Exception):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+
+class DriverPool:
+    """
+        Thread-safe pool of at most `size` WebDriver instances.
+
+        Args:
+            size (int): Maximum number of live drivers (Chrome processes).
+            factory (callable, optional): Creates a driver; defaults to
+                `create_chrome_driver`.
+
+        Methods:
+            driver(): Context manager lending a driver to the calling thread.
+            close(): Quits every driver the pool created.
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, factory=None):
+        self.size = max(1, size)
+        self.factory = factory or create_chrome_driver
+        self.created = 0
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle = queue.LifoQueue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        settings = config.get("selenium") or {}
+        block_resources = settings.get("block_resources", True)
+        timeout = settings.get("page_load_timeout", PAGE_LOAD_TIMEOUT)
+        return cls(
+            size=settings.get("pool_size", DEFAULT_POOL_SIZE),
+            factory=lambda: create_chrome_driver(block_resources, timeout),
+        )
+
+    def _acquire(self):
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            driver = self.factory()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+            self.created += 1
+        return driver
+
+    def _release(self, driver):
+        self._idle.put(driver)
+        self._slots.release()
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.remove(driver)
+        with suppress(Exception):
+            driver.quit()
+        self._slots.release()
+
+    @contextmanager
+    def driver(self):
+        """
+            Lend a warm driver, creating one if the pool is not yet full.
+
+            A driver whose session raised a WebDriverException is quit and
+            replaced on the next request instead of being reused.
+
+            Yields:
+                WebDriver: Driver owned by the caller until the block exits.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        driver = self._acquire()
+        try:
+            yield driver
+        except WebDriverException:
+            self._discard(driver)
+            raise
+        except BaseException:
+            self._release(driver)
+            raise
+        else:
+            self._release(driver)
+
+    def close(self):
+        """Quit all drivers created by the pool."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            with suppress(Exception):
+                driver.quit()
+        logger.info(f"🧹 Closed {len(drivers)} WebDriver(s)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,159 @@
+"""
+Pluggable HTML parser backends for the static scrapers.
+
+Every backend exposes the same small API, so extraction code such as
+`static_scraper.parse_article` is written once and runs on any of them:
+
+- `parse(html)`: parse a document and return its root node
+- `select(node, css)` / `select_one(node, css)`: CSS queries
+- `text(node)` / `attr(node, name)`: text content and attributes
+
+Backends, selected by `scraper_settings.parser` in `config/settings.yaml`:
+
+- "lxml" (default): libxml2 via lxml, with CSS selectors compiled to XPath once
+- "selectolax": the Lexbor engine; optional, `pip install selectolax`
+- "html.parser": BeautifulSoup with Python's built-in parser (the original)
+"""
+
+import threading
+from src.utils.helpers import load_config
+
+DEFAULT_PARSER = "lxml"
+
+
+class BeautifulSoupParser:
+    """BeautifulSoup backend; slowest, but pure Python."""
+
+    name = "html.parser"
+
+    def __init__(self, features="html.parser"):
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup
+        self.features = features
+
+    def parse(self, html):
+        return self._soup(html, self.features)
+
+    def select(self, node, css):
+        return node.select(css)
+
+    def select_one(self, node, css):
+        return node.select_one(css)
+
+    def text(self, node):
+        return node.get_text()
+
+    def attr(self, node, name):
+        return node.get(name)
+
+
+class LxmlParser:
+    """lxml backend; CSS selectors are compiled once and cached."""
+
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import html as lxml_html
+        from lxml.cssselect import CSSSelector
+
+        self._fromstring = lxml_html.fromstring
+        self._compile = CSSSelector
+        self._selectors = {}
+
+    def _selector(self, css):
+        selector = self._selectors.get(css)
+        if selector is None:
+            selector = self._selectors[css] = self._compile(css)
+        return selector
+
+    def parse(self, html):
+        return self._fromstring(html)
+
+    def select(self, node, css):
+        return self._selector(css)(node)
+
+    def select_one(self, node, css):
+        matches = self._selector(css)(node)
+        return matches[0] if matches else None
+
+    def text(self, node):
+        return node.text_content()
+
+    def attr(self, node, name):
+        return node.get(name)
+
+
+class SelectolaxParser:
+    """selectolax (Lexbor) backend; fastest, optional dependency."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as e:
+            raise RuntimeError(
+                "The selectolax parser needs `pip install selectolax`"
+            ) from e
+        self._parser = LexborHTMLParser
+
+    def parse(self, html):
+        return self._parser(html)
+
+    def select(self, node, css):
+        return node.css(css)
+
+    def select_one(self, node, css):
+        return node.css_first(css)
+
+    def text(self, node):
+        return node.text()
+
+    def attr(self, node, name):
+        return node.attributes.get(name)
+
+
+PARSERS = {
+    "html.parser": BeautifulSoupParser,
+    "lxml": LxmlParser,
+    "selectolax": SelectolaxParser,
+}
+
+
+def create_parser(name=DEFAULT_PARSER):
+    """
+        Instantiate a parser backend by name.
+
+        Args:
+            name (str): 'lxml', 'selectolax' or 'html.parser'.
+
+        Returns:
+            Parser backend instance.
+
+        Raises:
+            ValueError: If the name is unknown.
+            RuntimeError: If the backend's library is not installed.
+    """
+    try:
+        return PARSERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown HTML parser: {name}") from None
+
+
+_shared_parser = None
+_shared_lock = threading.Lock()
+
+
+def get_parser():
+    """Return the process-wide parser configured by `scraper_settings.parser`."""
+    global _shared_parser
+    with _shared_lock:
+        if _shared_parser is None:
+            try:
+                config = load_config()
+            except OSError:
+                config = {}
+            name = config.get("scraper_settings", {}).get("parser", DEFAULT_PARSER)
+            _shared_parser = create_parser(name)
+        return _shared_parser
@@ -0,0 +1,95 @@
+"""
+Scrapy downloader middlewares for the 'scrapy_crawler' project.
+
+`ConditionalCacheMiddleware` plugs the shared on-disk HTTP cache
+(`src.utils.http_cache`) into Scrapy: requests for cached pages are sent
+with `If-None-Match` / `If-Modified-Since`, `304 Not Modified` answers are
+replaced by the cached body, and fresh 200 responses are stored.
+
+The middleware must run after `HttpCompressionMiddleware` has decoded the
+response (a priority below 590), because the cache keeps only the body and
+its `Content-Type`. Bodies that still carry a `Content-Encoding` are not
+stored, so a 304 never replays compressed bytes without their header.
+"""
+
+from scrapy.exceptions import NotConfigured
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from src.utils.http_cache import get_http_cache
+
+
+class ConditionalCacheMiddleware:
+    """
+        Downloader middleware that revalidates cached pages instead of re-downloading them.
+
+        Disabled (NotConfigured) unless `http_cache.enabled` is set in
+        `config/settings.yaml`. Register it below `HttpCompressionMiddleware`
+        (590) so it stores decoded bodies.
+
+        Args:
+            cache (HttpCache): Cache shared with the other scrapers.
+            stats (StatsCollector, optional): Crawler stats for hit/miss counters.
+    """
+
+    def __init__(self, cache, stats=None):
+        self.cache = cache
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        cache = get_http_cache()
+        if cache is None:
+            raise NotConfigured("http_cache is disabled")
+        return cls(cache, crawler.stats)
+
+    def _inc(self, key):
+        if self.stats is not None:
+            self.stats.inc_value(f"http_cache/{key}")
+
+    def process_request(self, request, spider):
+        if request.method != "GET":
+            return None
+        entry = self.cache.get(request.url)
+        if entry is not None:
+            request.meta["http_cache_entry"] = entry
+            for name, value in entry.conditional_headers().items():
+                request.headers.setdefault(name, value)
+        return None
+
+    def process_response(self, request, response, spider):
+        entry = request.meta.get("http_cache_entry")
+        if response.status == 304 and entry is not None:
+            self._inc("revalidated")
+            headers = Headers({"Content-Type": entry.content_type} if entry.content_type else {})
+            response_class = responsetypes.from_args(
+                headers=headers, url=entry.url, body=entry.body
+            )
+            return response_class(
+                url=response.url,
+                status=200,
+                headers=headers,
+                body=entry.body,
+                request=request,
+                flags=response.flags + ["cached"],
+            )
+        if response.status == 200 and request.method == "GET":
+            if b"Content-Encoding" in response.headers:
+                # Still encoded (compression middleware disabled or ordered after us)
+                self._inc("uncacheable")
+                return response
+            stored = self.cache.store(
+                request.url, response.body, _HeaderView(response.headers)
+            )
+            self._inc("stored" if stored else "uncacheable")
+        return response
+
+
+class _HeaderView:
+    """Adapts Scrapy's bytes-valued Headers to the str lookups HttpCache expects."""
+
+    def __init__(self, headers):
+        self._headers = headers
+
+    def get(self, name, default=None):
+        value = self._headers.get(name)
+        return value.decode("latin-1") if value is not None else default
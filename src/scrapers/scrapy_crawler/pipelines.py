@@ -1,34 +1,131 @@
 """
-Scrapy pipeline to collect scraped articles and export them to a JSON file.
+Scrapy pipeline that streams scraped articles to a JSON Lines file.
 
-This pipeline accumulates all scraped items into a list and writes them to
-`data_output/raw/theverge_articles.json` when the spider finishes.
+Each item is written as one JSON line as soon as it is scraped, so memory
+use stays constant however long the crawl runs. The file is flushed every
+`JSONL_FLUSH_ITEMS` items and fsynced at most every `JSONL_FSYNC_INTERVAL`
+seconds, which keeps everything up to the last flush readable after the
+process is killed. Output is appended to
+`data_output/raw/theverge_articles.jsonl` (`.jsonl.gz` / `.jsonl.zst` with
+`JSONL_COMPRESSION`), which the processing pipeline reads directly.
+
+With `database.write_through` enabled, items are also batch-inserted into
+SQLite through the shared `ArticleWriter`. Links are recorded in the spider's
+crawl frontier only once the lines holding them have been flushed.
 """
 
+import io
 import json
 import os
+import time
+from contextlib import ExitStack
+from src.data.pool import open_article_writer
+from src.utils.fileio import COMPRESSION_SUFFIXES, open_compressed_appender
+from src.utils.helpers import load_config
+
+OUTPUT_PATH = "data_output/raw/theverge_articles.jsonl"
+FLUSH_ITEMS = 100
+FSYNC_INTERVAL = 5.0
 
 
-class JsonAndCsvExportPipeline:
+class JsonLinesExportPipeline:
     """
-        Pipeline that exports all scraped articles to a single JSON file.
+        Pipeline that appends every scraped article to a JSON Lines file.
+
+        Args:
+            path (str): Output path without the compression suffix.
+            compression (str, optional): 'gzip', 'zstd' or None.
+            flush_items (int): Flush after this many items.
+            fsync_interval (float): Minimum seconds between fsyncs; 0 fsyncs on every flush.
+            config (dict, optional): Parsed settings used for SQLite write-through.
 
         Methods:
-            open_spider(spider): Initializes resources before scraping starts.
-            close_spider(spider): Writes collected articles to JSON when scraping ends.
-            process_item(item, spider): Adds each scraped item to the export list.
+            open_spider(spider): Opens the output file and optional SQLite writer.
+            process_item(item, spider): Writes the item as one JSON line.
+            close_spider(spider): Flushes, fsyncs and closes everything.
     """
+
+    def __init__(
+        self,
+        path=OUTPUT_PATH,
+        compression=None,
+        flush_items=FLUSH_ITEMS,
+        fsync_interval=FSYNC_INTERVAL,
+        config=None,
+    ):
+        self.path = path + COMPRESSION_SUFFIXES.get(compression, "")
+        self.compression = compression
+        self.flush_items = max(1, flush_items)
+        self.fsync_interval = fsync_interval
+        self.config = config
+        self.items_written = 0
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        return cls(
+            path=settings.get("JSONL_EXPORT_PATH", OUTPUT_PATH),
+            compression=settings.get("JSONL_COMPRESSION") or None,
+            flush_items=settings.getint("JSONL_FLUSH_ITEMS", FLUSH_ITEMS),
+            fsync_interval=settings.getfloat("JSONL_FSYNC_INTERVAL", FSYNC_INTERVAL),
+        )
+
     def open_spider(self, spider):
-        os.makedirs("data_output/raw", exist_ok=True)
-        self.articles = []
-        self.json_file = open(
-            "data_output/raw/theverge_articles.json", "w", encoding="utf-8"
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._stack = ExitStack()
+        self._raw = self._stack.enter_context(open(self.path, "ab"))
+        if self.compression is None and self._raw.tell() > 0:
+            self._terminate_partial_line()
+        self._stream = self._stack.enter_context(
+            io.TextIOWrapper(
+                open_compressed_appender(self._raw, self.compression),
+                encoding="utf-8",
+                newline="\n",
+            )
         )
+        config = self.config if self.config is not None else load_config()
+        self.writer = self._stack.enter_context(open_article_writer(config))
+        self.frontier = getattr(spider, "frontier", None)
+        self._unflushed_links = []
+        self._last_fsync = time.monotonic()
 
-    def close_spider(self, spider):
-        json.dump(self.articles, self.json_file, indent=2, ensure_ascii=False)
-        self.json_file.close()
+    def _terminate_partial_line(self):
+        """Start on a fresh line if a previous crawl was killed mid-write."""
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                self._raw.write(b"\n")
 
     def process_item(self, item, spider):
-        self.articles.append(dict(item))
+        record = dict(item)
+        self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.items_written += 1
+        if record.get("link"):
+            self._unflushed_links.append(record["link"])
+        if self.writer:
+            self.writer.submit(record)
+        if self.items_written % self.flush_items == 0:
+            self.flush()
         return item
+
+    def flush(self, fsync=None):
+        """
+            Push buffered lines to disk and record their links in the frontier.
+
+            Args:
+                fsync (bool, optional): Force (or skip) an fsync; by default one
+                    is done when `fsync_interval` has elapsed.
+        """
+        self._stream.flush()
+        now = time.monotonic()
+        if fsync or (fsync is None and now - self._last_fsync >= self.fsync_interval):
+            os.fsync(self._raw.fileno())
+            self._last_fsync = now
+        if self.frontier and self._unflushed_links:
+            self.frontier.add(self._unflushed_links)
+        self._unflushed_links = []
+
+    def close_spider(self, spider):
+        self.flush(fsync=True)
+        self._stack.close()
+        spider.logger.info(f"💾 Wrote {self.items_written} articles to {self.path}")
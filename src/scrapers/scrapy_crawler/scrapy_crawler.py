@@ -3,10 +3,90 @@ Scrapy spider for crawling news articles from The Verge.
 
 This spider navigates through paginated news archive pages and extracts
 article details such as title, link, category, and publication date.
+
+With `crawl.incremental` enabled, articles already known to the crawl
+frontier are not requested again and pagination stops at the first archive
+page whose articles are all known.
+
+With `crawl.listing_dates` enabled, publication dates are read from the
+archive page itself (a `<time>` inside the article card, JSON-LD or the
+Next.js `__NEXT_DATA__` payload); only articles still missing a date are
+fetched individually.
 """
 
+import json
 import scrapy
+from src.data.frontier import open_frontier
 from src.scrapers.scrapy_crawler.items import NewsArticle
+from src.utils.helpers import load_config
+
+
+ARTICLE_LINK_CSS = "a.yy0d3l8"
+
+# Keys that hold an article URL / publication date in embedded JSON payloads
+_URL_KEYS = ("url", "link", "href", "permalink", "canonicalUrl")
+_DATE_KEYS = ("datePublished", "publishDate", "publishedAt", "published", "publish_date", "date")
+
+
+def _iter_url_dates(node):
+    """Yield (url, date) pairs from every JSON object that carries both."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            url = next((node[k] for k in _URL_KEYS if isinstance(node.get(k), str)), None)
+            date = next((node[k] for k in _DATE_KEYS if isinstance(node.get(k), str)), None)
+            if url and date:
+                yield url, date
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _embedded_json(response):
+    """Yield parsed JSON-LD blocks and the `__NEXT_DATA__` payload of a page."""
+    scripts = response.css('script[type="application/ld+json"]::text').getall()
+    scripts += response.css("script#__NEXT_DATA__::text").getall()
+    for script in scripts:
+        try:
+            yield json.loads(script)
+        except ValueError:
+            continue
+
+
+def extract_listing_dates(response, link_css=ARTICLE_LINK_CSS):
+    """
+        Collect publication dates available on a listing page without visiting articles.
+
+        Sources, from least to most specific (later ones win):
+        - objects with a URL and a date in JSON-LD / `__NEXT_DATA__`
+        - a `<time datetime>` in the closest element that wraps exactly one
+          article link and one `<time>`
+
+        Args:
+            response (scrapy.http.Response): Listing page.
+            link_css (str): CSS selector of article links.
+
+        Returns:
+            dict[str, str]: Absolute article URL -> raw date string.
+    """
+    dates = {}
+    for data in _embedded_json(response):
+        for url, date in _iter_url_dates(data):
+            dates[response.urljoin(url)] = date.strip()
+
+    link_class = link_css.split(".", 1)[1] if "." in link_css else None
+    card = (
+        "ancestor::*[count(.//time[@datetime]) = 1"
+        + (f" and count(.//a[contains(@class, '{link_class}')]) = 1" if link_class else "")
+        + "][1]//time/@datetime"
+    )
+    for link in response.css(link_css):
+        href = link.attrib.get("href")
+        date = link.xpath(card).get()
+        if href and date:
+            dates[response.urljoin(href)] = date.strip()
+    return dates
 
 
 class GenericNewsSpider(scrapy.Spider):
@@ -17,6 +97,9 @@ class GenericNewsSpider(scrapy.Spider):
             name (str): Identifier for the spider.
             allowed_domains (list): Domains the spider is allowed to crawl.
             start_urls (list): Initial URL(s) to start crawling from.
+            frontier (CrawlFrontier or None): Seen-URL store for incremental crawls.
+            listing_dates (bool): Take publication dates from archive pages
+                when available instead of fetching every article.
 
         Methods:
             parse(response): Extracts article links and handles pagination.
@@ -27,6 +110,25 @@ class GenericNewsSpider(scrapy.Spider):
     allowed_domains = ["theverge.com"]
     start_urls = ["https://www.theverge.com/news/archives/1"]
 
+    def __init__(self, *args, frontier=None, listing_dates=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        config = load_config()
+        self.frontier = frontier if frontier is not None else open_frontier(config)
+        if listing_dates is None:
+            listing_dates = config.get("crawl", {}).get("listing_dates", True)
+        elif isinstance(listing_dates, str):  # -a listing_dates=false on the command line
+            listing_dates = listing_dates.lower() not in ("0", "false", "no")
+        self.listing_dates = listing_dates
+
+    def _inc_stat(self, key):
+        crawler = getattr(self, "crawler", None)
+        if crawler is not None:
+            crawler.stats.inc_value(key)
+
+    def closed(self, reason):
+        if self.frontier:
+            self.frontier.close()
+
     def parse(self, response):
         self.logger.info(f"📄 Parsing page: {response.url} (status: {response.status})")
 
@@ -34,7 +136,7 @@ class GenericNewsSpider(scrapy.Spider):
             self.logger.info("❌ Reached 404 — stopping pagination.")
             return
 
-        articles = response.css("a.yy0d3l8")
+        articles = response.css(ARTICLE_LINK_CSS)
 
         if not articles:
             self.logger.info("ℹ️ No more articles found — stopping.")
@@ -42,31 +144,47 @@ class GenericNewsSpider(scrapy.Spider):
 
         self.logger.debug(f"🔗 Found {len(articles)} article links on {response.url}")
 
-        for article in articles:
-            title = article.css("::attr(aria-label)").get()
-            link = article.css("::attr(href)").get()
+        links = [
+            (article.css("::attr(aria-label)").get(), response.urljoin(link))
+            for article in articles
+            if (link := article.css("::attr(href)").get())
+        ]
+        known = self.frontier.known(url for _, url in links) if self.frontier else set()
+        dates = extract_listing_dates(response) if self.listing_dates else {}
+
+        for title, full_url in links:
+            if full_url in known:
+                continue
+            self.logger.debug(
+                f"📰 Queuing article: {title[:50] if title else 'N/A'} | {full_url}"
+            )
+
+            item = NewsArticle()
+            item["title"] = title.strip() if title else "N/A"
+            item["link"] = full_url
+            item["category"] = "news"
 
-            if link:
-                full_url = response.urljoin(link)
-                self.logger.debug(
-                    f"📰 Queuing article: {title[:50] if title else 'N/A'} | {full_url}"
-                )
+            if full_url in dates:
+                item["published"] = dates[full_url]
+                self._inc_stat("listing_dates/from_listing")
+                yield item
+                continue
 
-                item = NewsArticle()
-                item["title"] = title.strip() if title else "N/A"
-                item["link"] = full_url
-                item["category"] = "news"
+            self._inc_stat("listing_dates/article_fetch")
+            yield response.follow(
+                full_url, callback=self.parse_article, meta={"item": item}
+            )
 
-                yield response.follow(
-                    full_url, callback=self.parse_article, meta={"item": item}
-                )
+        if links and len(known) == len({url for _, url in links}):
+            self.logger.info(f"🛑 {response.url} already crawled — stopping pagination.")
+            return
 
         # Pagination logic only if URL is in /archives/<n> format
         if "archives" in response.url:
             try:
                 current_page = int(response.url.rstrip("/").split("/")[-1])
                 next_page = current_page + 1
-                next_url = f"https://www.theverge.com/news/archives/{next_page}"
+                next_url = f"{response.url.rstrip('/').rsplit('/', 1)[0]}/{next_page}"
                 self.logger.info(f"➡️ Moving to next page: {next_url}")
                 yield scrapy.Request(next_url, callback=self.parse)
             except ValueError:
@@ -4,11 +4,15 @@ Scrapy settings for the 'scrapy_crawler' project.
 This configuration file defines behavior for the generic news spider, including:
 - Spider modules and user-agent headers
 - Retry strategy and timeout handling
-- Pipeline configuration for exporting scraped data
+- Conditional re-fetching through the shared HTTP cache
+- Concurrency, AutoThrottle and per-host download delays taken from the
+  `scrapy` and `rate_limits` sections of `config/settings.yaml`
+- Pipeline configuration for streaming scraped data to JSON Lines
 
 Used by the GenericNewsSpider to crawl and extract articles from The Verge.
 """
 
+from src.scrapers.scrapy_crawler.runner import crawl_settings
 
 BOT_NAME = "scrapy_crawler"
 SPIDER_MODULES = ["src.scrapers.scrapy_crawler"]
@@ -20,11 +24,31 @@ USER_AGENT = (
 )
 
 RETRY_ENABLED = True
-DOWNLOAD_DELAY = 2
+_CRAWL_SETTINGS = crawl_settings()
+CONCURRENT_REQUESTS = _CRAWL_SETTINGS["CONCURRENT_REQUESTS"]
+CONCURRENT_REQUESTS_PER_DOMAIN = _CRAWL_SETTINGS["CONCURRENT_REQUESTS_PER_DOMAIN"]
+DOWNLOAD_DELAY = _CRAWL_SETTINGS["DOWNLOAD_DELAY"]
+RANDOMIZE_DOWNLOAD_DELAY = _CRAWL_SETTINGS["RANDOMIZE_DOWNLOAD_DELAY"]
+DOWNLOAD_SLOTS = _CRAWL_SETTINGS["DOWNLOAD_SLOTS"]
+AUTOTHROTTLE_ENABLED = _CRAWL_SETTINGS["AUTOTHROTTLE_ENABLED"]
+AUTOTHROTTLE_TARGET_CONCURRENCY = _CRAWL_SETTINGS["AUTOTHROTTLE_TARGET_CONCURRENCY"]
+AUTOTHROTTLE_START_DELAY = _CRAWL_SETTINGS["AUTOTHROTTLE_START_DELAY"]
+AUTOTHROTTLE_MAX_DELAY = _CRAWL_SETTINGS["AUTOTHROTTLE_MAX_DELAY"]
 DOWNLOAD_TIMEOUT = 10
 RETRY_TIMES = 3
 RETRY_HTTP_CODES = [500, 502, 503, 504, 522, 524, 408, 429]
 
+# Below HttpCompressionMiddleware (590) so the cache sees decoded bodies
+DOWNLOADER_MIDDLEWARES = {
+    "src.scrapers.scrapy_crawler.middlewares.ConditionalCacheMiddleware": 585,
+}
+
 ITEM_PIPELINES = {
-    "src.scrapers.scrapy_crawler.pipelines.JsonAndCsvExportPipeline": 1,
+    "src.scrapers.scrapy_crawler.pipelines.JsonLinesExportPipeline": 1,
 }
+
+# Streaming export: one JSON line per item, flushed every N items
+JSONL_EXPORT_PATH = "data_output/raw/theverge_articles.jsonl"
+JSONL_COMPRESSION = None  # None, "gzip" or "zstd"
+JSONL_FLUSH_ITEMS = 100
+JSONL_FSYNC_INTERVAL = 5.0
@@ -1,8 +1,9 @@
 """
 Dynamic scraping module using Selenium WebDriver.
 
-This module targets Euronews article pages across various tags using multithreaded
-Selenium scraping with user-agent rotation, CAPTCHA detection, and data deduplication.
+This module targets Euronews article pages across various tags using a bounded pool
+of reusable headless Chrome drivers fed by a (tag, page) job queue, with user-agent
+rotation, CAPTCHA detection, and data deduplication.
 
 It includes:
 - `run_dynamic_scrapers()` to extract article metadata from Euronews tag pages.
@@ -10,16 +11,26 @@ It includes:
 """
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import time
+import queue
 import random
 import json
 from src.utils.logger import setup_logger
 import os
-from src.utils.helpers import get_random_user_agent
+from src.utils.helpers import get_random_user_agent, load_config, safe_request
+from src.utils.http_cache import get_http_cache
+from src.utils.rate_limiter import get_rate_limiter
+from src.data.frontier import open_frontier, write_crawl_delta
+from src.data.pool import open_article_writer
+from src.scrapers.driver_pool import DriverPool
 from contextlib import suppress
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import urljoin, urlparse, urlunparse
+from lxml import html as lxml_html
 import re
 import hashlib
 from datetime import datetime, timedelta
@@ -28,12 +39,15 @@ import threading
 
 logger = setup_logger()
 
-
-def throttle_requests(min_delay=0.3, max_delay=1):
-    """Pause execution for a random delay between `min_delay` and `max_delay` to mimic human browsing behavior."""
-    delay = random.uniform(min_delay, max_delay)
-    logger.debug(f"Throttling for {delay:.2f} seconds")
-    time.sleep(delay)
+TAGS = ["europe", "culture", "business", "tech", "green"]
+MAX_ARTICLES = 4500
+MAX_PAGES = 200
+WAIT_TIMEOUT = 10
+EXTRACTION = "js"
+MODE = "hybrid"
+OUTPUT_PATH = "data_output/raw/euronews_dynamic.json"
+DECISIONS_PATH = "data_output/crawl/euronews_render_decisions.jsonl"
+CAPTCHA_MARKERS = ["captcha", "verify you're a human", "i am not a robot", "recaptcha"]
 
 
 def normalize_url(url):
@@ -48,77 +62,225 @@ def create_article_fingerprint(title, url):
     return hashlib.md5(content.encode()).hexdigest()
 
 
+EXTRACT_CARDS_JS = """
+return Array.from(document.querySelectorAll('article'), function (card) {
+  var link = null;
+  for (const a of card.querySelectorAll('a')) {
+    var href = a.href, aria = a.getAttribute('aria-label'), text = (a.innerText || '').trim();
+    if (href && typeof href === 'string' && !href.startsWith('#') && (aria || text)) {
+      link = {href: href, title: aria ? aria.trim() : text};
+      break;
+    }
+  }
+  var time = card.querySelector('time');
+  return {
+    href: link && link.href,
+    title: link && link.title,
+    published: time ? (time.getAttribute('datetime') || (time.innerText || '').trim()) : null
+  };
+});
+"""
+
+
+def build_article_data(href, title, published_raw=None):
+    """
+        Turn the raw fields of one article card into an article record.
+
+        Shared by the in-browser (JavaScript) and WebDriver extraction paths.
+
+        Args:
+            href (str): Card link as reported by the browser.
+            title (str): aria-label or link text.
+            published_raw (str, optional): `<time>` datetime attribute or text.
+
+        Returns:
+            dict or None: Title, link, category, published date and
+            fingerprint, or None when the card has no usable link.
+    """
+    if not href or not title:
+        return None
+
+    if href.startswith("/"):
+        href = "https://www.euronews.com" + href
+
+    if not href.startswith("http"):
+        return None
+
+    path_parts = urlparse(href).path.strip("/").split("/")
+    category = (
+        path_parts[0]
+        if len(path_parts) >= 1 and not path_parts[0].isdigit()
+        else "news"
+    )
+
+    # Extract publication date
+    published = None
+    if published_raw:
+        match = re.search(r"(\d{4}-\d{2}-\d{2})", published_raw)
+        if match:
+            published = match.group(1)
+
+    # Fallback: extract from URL
+    if not published:
+        match = re.search(r"/(\d{4}/\d{2}/\d{2})/", href)
+        if match:
+            published = match.group(1).replace("/", "-")
+
+    # Final fallback: random date
+    if not published:
+        published = generate_random_date()
+
+    return {
+        "title": title,
+        "link": href,
+        "category": category,
+        "published": published,
+        "fingerprint": create_article_fingerprint(title, href),
+    }
+
+
 def extract_article_data(card):
-    """Extract metadata (title, link, category, publication date) from a Selenium article card element."""
+    """
+        Extract metadata (title, link, category, publication date) from a Selenium article card element.
+
+        Makes several WebDriver round-trips per card; `extract_page_articles`
+        with the default JavaScript path reads a whole page in one call.
+        Kept for debugging selector issues element by element.
+    """
     try:
         a_tags = card.find_elements(By.TAG_NAME, "a")
-        link_tag, title = None, None
+        href, title = None, None
 
         for a in a_tags:
-            href = a.get_attribute("href")
+            candidate = a.get_attribute("href")
             aria = a.get_attribute("aria-label")
             text = a.text.strip()
-            if href and not href.startswith("#") and (aria or text):
-                link_tag = a
+            if candidate and not candidate.startswith("#") and (aria or text):
+                href = candidate
                 title = aria.strip() if aria else text
                 break
 
-        if not link_tag or not title:
+        if not href:
             return None
 
-        href = link_tag.get_attribute("href")
-        if href.startswith("/"):
-            href = "https://www.euronews.com" + href
-
-        if not href.startswith("http"):
-            return None
-
-        path_parts = urlparse(href).path.strip("/").split("/")
-        category = (
-            path_parts[0]
-            if len(path_parts) >= 1 and not path_parts[0].isdigit()
-            else "news"
-        )
-
-        # Extract publication date
-        published = None
+        published_raw = None
         try:
             time_elem = card.find_element(By.TAG_NAME, "time")
             published_raw = (
                 time_elem.get_attribute("datetime") or time_elem.text.strip()
             )
-            if published_raw:
-                match = re.search(r"(\d{4}-\d{2}-\d{2})", published_raw)
-                if match:
-                    published = match.group(1)
         except:
             pass
 
-        # Fallback: extract from URL
-        if not published:
-            match = re.search(r"/(\d{4}/\d{2}/\d{2})/", href)
-            if match:
-                published = match.group(1).replace("/", "-")
-
-        # Final fallback: random date
-        if not published:
-            published = generate_random_date()
-
-        fingerprint = create_article_fingerprint(title, href)
-
-        return {
-            "title": title,
-            "link": href,
-            "category": category,
-            "published": published,
-            "fingerprint": fingerprint,
-        }
+        return build_article_data(href, title, published_raw)
 
     except Exception as e:
         logger.warning(f"⚠️ Error extracting article data: {e}")
         return None
 
 
+def extract_page_articles(driver, cards=None, extraction="js"):
+    """
+        Extract every article card on the loaded page.
+
+        Args:
+            driver (WebDriver): Driver with the tag page loaded.
+            cards (list, optional): `article` elements, required for the
+                Python path (already returned by the explicit wait).
+            extraction (str): 'js' reads all cards with one `execute_script`
+                round-trip; 'python' walks the elements through WebDriver.
+
+        Returns:
+            list: Article dicts for cards with a usable link.
+    """
+    if extraction == "python":
+        if cards is None:
+            cards = driver.find_elements(By.CSS_SELECTOR, "article")
+        return [d for d in map(extract_article_data, cards) if d]
+
+    raw_cards = driver.execute_script(EXTRACT_CARDS_JS) or []
+    return [
+        d
+        for d in (
+            build_article_data(raw.get("href"), raw.get("title"), raw.get("published"))
+            for raw in raw_cards
+        )
+        if d
+    ]
+
+
+def extract_snapshot_articles(html, base_url):
+    """
+        Extract article cards from server-rendered HTML without a browser.
+
+        Applies the same rules as `extract_article_data`: the first anchor
+        with a non-fragment href and an aria-label or text, plus the card's
+        `<time>` element.
+
+        Args:
+            html (str): Page HTML as returned by a plain HTTP fetch.
+            base_url (str): URL of the page, used to resolve relative links.
+
+        Returns:
+            list: Article dicts for cards with a usable link.
+    """
+    doc = lxml_html.fromstring(html)
+    articles = []
+    for card in doc.iter("article"):
+        href, title = None, None
+        for a in card.iter("a"):
+            candidate = a.get("href")
+            aria = a.get("aria-label")
+            text = " ".join(a.text_content().split())
+            if candidate and not candidate.startswith("#") and (aria or text):
+                href = urljoin(base_url, candidate)
+                title = aria.strip() if aria else text
+                break
+
+        published_raw = None
+        time_elem = next(card.iter("time"), None)
+        if time_elem is not None:
+            published_raw = time_elem.get("datetime") or time_elem.text_content().strip()
+
+        article = build_article_data(href, title, published_raw)
+        if article:
+            articles.append(article)
+    return articles
+
+
+def snapshot_tag_page(url, rate_limiter=None, cache=None):
+    """
+        Try to scrape a tag page from its server-rendered HTML.
+
+        Args:
+            url (str): Tag page URL.
+            rate_limiter (RateLimiter, optional): Limiter for the HTTP fetch.
+            cache (HttpCache, optional): Conditional-request cache.
+
+        Returns:
+            tuple: (articles, reason). `articles` is None when the page has to
+            be rendered in a browser; `reason` says why ('server_rendered',
+            'http_error', 'captcha' or 'no_cards').
+    """
+    response = safe_request(
+        url,
+        headers={"User-Agent": get_random_user_agent()},
+        retries=1,
+        rate_limiter=rate_limiter,
+        cache=cache,
+    )
+    if response is None:
+        return None, "http_error"
+
+    articles = extract_snapshot_articles(response.text, url)
+    if articles:
+        return articles, "server_rendered"
+    page_text = response.text.lower()
+    if any(marker in page_text for marker in CAPTCHA_MARKERS):
+        return None, "captcha"
+    return None, "no_cards"
+
+
 def generate_random_date():
     """Generate a fallback random date within the year 2025 if a publication date is not available."""
     start = datetime(2025, 1, 1)
@@ -127,110 +289,312 @@ def generate_random_date():
 
 
 def run_dynamic_scrapers():
-    """Run the Selenium-based multithreaded scraper for multiple Euronews tags and export results to JSON."""
-    logger.info("🛠️ Starting multithreaded tag-based Selenium scraper...")
+    """Run the Selenium scraper over every Euronews tag with a pool of reusable drivers and export results to JSON."""
+    config = load_config()
+    frontier = open_frontier(config)
+    try:
+        settings = config.get("selenium") or {}
+        with open_article_writer(config) as writer, DriverPool.from_config(config) as pool:
+            _scrape_euronews(
+                writer,
+                frontier,
+                pool=pool,
+                wait_timeout=settings.get("wait_timeout", WAIT_TIMEOUT),
+                extraction=settings.get("extraction", EXTRACTION),
+                mode=settings.get("mode", MODE),
+            )
+    finally:
+        if frontier:
+            frontier.close()
 
-    tags = ["europe", "culture", "business", "tech", "green"]
-    scraped_data = []
-    seen_fingerprints = set()
-    max_articles = 4500
-    lock = threading.Lock()
 
-    def scrape_tag(tag):
-        nonlocal scraped_data
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        user_agent = get_random_user_agent()
-        options.add_argument(f"user-agent={user_agent}")
+def is_captcha_page(driver):
+    """Return True when the loaded page looks like a CAPTCHA challenge."""
+    page_text = driver.page_source.lower()
+    return any(marker in page_text for marker in CAPTCHA_MARKERS)
 
-        driver = webdriver.Chrome(options=options)
 
-        try:
-            for page in range(1, 201):
-                with lock:
-                    if len(scraped_data) >= max_articles:
-                        break
+def scrape_tag_page(driver, url, wait_timeout=WAIT_TIMEOUT, extraction=EXTRACTION):
+    """
+        Load one tag listing page and extract its article cards.
 
-                url = f"https://www.euronews.com/tag/{tag}?p={page}"
-                throttle_requests()
-                try:
-                    driver.get(url)
-                    time.sleep(2)
-                except Exception as e:
-                    logger.error(f"❌ Failed to load {url}: {e}")
-                    break
-
-                page_text = driver.page_source.lower()
-                if any(
-                    word in page_text
-                    for word in [
-                        "captcha",
-                        "verify you're a human",
-                        "i am not a robot",
-                        "recaptcha",
-                    ]
-                ):
-                    logger.warning("🛑 CAPTCHA detected. Saving screenshot.")
-                    os.makedirs("screenshots", exist_ok=True)
-                    driver.save_screenshot(
-                        f"screenshots/captcha_{int(time.time())}.png"
-                    )
-                    return
+        Waits for `article` elements to appear instead of sleeping a fixed
+        time; the page source is only inspected for a CAPTCHA when none do.
 
-                articles = driver.find_elements(By.CSS_SELECTOR, "article")
-                if not articles:
-                    break
-
-                batch_scraped = 0
-                for card in articles:
-                    article_data = extract_article_data(card)
-                    if not article_data:
-                        continue
-
-                    with lock:
-                        if (
-                            article_data["fingerprint"] in seen_fingerprints
-                            or len(scraped_data) >= max_articles
-                        ):
-                            continue
-
-                        seen_fingerprints.add(article_data["fingerprint"])
-                        scraped_data.append(
-                            {
-                                "title": article_data["title"],
-                                "link": article_data["link"],
-                                "category": article_data["category"],
-                                "published": article_data["published"],
-                            }
-                        )
-                        batch_scraped += 1
-
-                logger.info(f"✅ {tag} page {page}: Scraped {batch_scraped} articles")
-
-        finally:
-            with suppress(Exception):
-                driver.quit()
-
-    threads = []
-    for tag in tags:
-        t = threading.Thread(target=scrape_tag, args=(tag,))
-        threads.append(t)
-        t.start()
+        Args:
+            driver (WebDriver): Driver to load the page with.
+            url (str): Tag page URL.
+            wait_timeout (float): Seconds to wait for article cards.
+            extraction (str): 'js' or 'python', see `extract_page_articles`.
 
-    for t in threads:
-        t.join()
+        Returns:
+            list or None: Article dicts (empty past the last page), or None
+            when a CAPTCHA was detected.
+    """
+    driver.get(url)
+    try:
+        cards = WebDriverWait(driver, wait_timeout).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "article"))
+        )
+    except TimeoutException:
+        cards = []
+
+    if not cards:
+        if is_captcha_page(driver):
+            logger.warning("🛑 CAPTCHA detected. Saving screenshot.")
+            os.makedirs("screenshots", exist_ok=True)
+            driver.save_screenshot(f"screenshots/captcha_{int(time.time())}.png")
+            return None
+        return []
+
+    return extract_page_articles(driver, cards, extraction)
+
+
+def _scrape_euronews(
+    writer,
+    frontier=None,
+    pool=None,
+    rate_limiter=None,
+    tags=TAGS,
+    max_articles=MAX_ARTICLES,
+    output_path=OUTPUT_PATH,
+    wait_timeout=WAIT_TIMEOUT,
+    extraction=EXTRACTION,
+    mode=MODE,
+    cache=None,
+    decisions_path=DECISIONS_PATH,
+):
+    """
+        Scrape all tags through a shared queue of (tag, page) jobs, streaming articles to `writer` when write-through is enabled.
+
+        One worker thread per pooled driver takes jobs from the queue, so
+        parallelism is set by the pool size rather than the number of tags:
+        once a tag's first page is in, up to `pool.size` of its pages are
+        fetched at once. Pages are committed in order per tag, so with a crawl
+        `frontier` known articles are skipped and a tag stops paginating at
+        the first page whose articles are all known; pages fetched past that
+        point (at most `pool.size - 1`) are ignored.
+
+        In 'hybrid' mode each page is first fetched over plain HTTP and parsed
+        with lxml; only pages without server-rendered cards are escalated to
+        the WebDriver pool (drivers start lazily, so Chrome may never boot).
+        A tag that needed the browser keeps using it, and an empty snapshot
+        after earlier snapshot pages ends the tag. Every page's decision is
+        written to `decisions_path` as JSON Lines. 'browser' mode always
+        renders pages in Chrome.
+    """
+    owns_pool = pool is None
+    if owns_pool:
+        pool = DriverPool.from_config(load_config())
+    rate_limiter = rate_limiter or get_rate_limiter()
+    if mode == "hybrid" and cache is None:
+        cache = get_http_cache()
+    logger.info(
+        f"🛠️ Starting Euronews scraper ({mode}): {len(tags)} tags, up to {pool.size} pooled drivers..."
+    )
 
-    os.makedirs("data_output/raw", exist_ok=True)
-    output_path = "data_output/raw/euronews_dynamic.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(scraped_data, f, indent=2, ensure_ascii=False)
+    scraped_data = []
+    seen_fingerprints = set()
+    decisions = []
+    tag_render = {}  # tag -> "snapshot" or "browser" once a page of it succeeded
+    lock = threading.Lock()
+    jobs = queue.Queue()
+    # Up to `depth` pages of a tag are fetched at once; results are committed in
+    # page order, so early stops and the article cap behave as in a sequential crawl
+    depth = max(1, min(pool.size, MAX_PAGES))
+    tag_state = {
+        tag: {"queued": 1, "committed": 0, "stop": None, "fetched": {}, "committing": False}
+        for tag in tags
+    }
+    for tag in tags:
+        jobs.put((tag, 1))
+
+    def fetch_page(tag, page):
+        """Load one page; return its article data, or None when it has none."""
+        url = f"https://www.euronews.com/tag/{tag}?p={page}"
+        page_data, renderer, reason = None, "browser", "browser_mode"
+        if mode == "hybrid" and tag_render.get(tag) == "browser":
+            reason = "tag_needs_browser"
+        elif mode == "hybrid":
+            page_data, reason = snapshot_tag_page(url, rate_limiter, cache)
+            if page_data is not None:
+                renderer = "snapshot"
+            elif reason == "no_cards" and tag_render.get(tag) == "snapshot":
+                renderer, reason = "snapshot", "end_of_tag"
+            else:
+                reason = f"escalated:{reason}"
+
+        if renderer == "browser":
+            rate_limiter.acquire(url)
+            try:
+                with pool.driver() as driver:
+                    page_data = scrape_tag_page(driver, url, wait_timeout, extraction)
+            except WebDriverException as e:
+                logger.error(f"❌ Failed to load {url}: {e}")
+                page_data = None
+
+        with lock:
+            decisions.append(
+                {
+                    "url": url,
+                    "tag": tag,
+                    "page": page,
+                    "renderer": renderer,
+                    "reason": reason,
+                    "articles": len(page_data or []),
+                }
+            )
+        return page_data, renderer
+
+    def commit_page(tag, page, page_data, renderer):
+        """Record one page's articles; return True when the tag should continue to the next page."""
+        if not page_data:
+            return False
+        with lock:
+            tag_render.setdefault(tag, renderer)
+
+        known = frontier.known(d["link"] for d in page_data) if frontier else set()
+        if all(d["link"] in known for d in page_data):
+            logger.info(f"🛑 {tag} page {page} already crawled — stopping tag.")
+            return False
+
+        batch_scraped = 0
+        for article_data in page_data:
+            if article_data["link"] in known:
+                continue
+
+            with lock:
+                if (
+                    article_data["fingerprint"] in seen_fingerprints
+                    or len(scraped_data) >= max_articles
+                ):
+                    continue
+
+                seen_fingerprints.add(article_data["fingerprint"])
+                record = {
+                    "title": article_data["title"],
+                    "link": article_data["link"],
+                    "category": article_data["category"],
+                    "published": article_data["published"],
+                }
+                scraped_data.append(record)
+                batch_scraped += 1
+
+            if writer:
+                writer.submit(record)
+
+        logger.info(f"✅ {tag} page {page}: Scraped {batch_scraped} articles")
+        return True
+
+    def schedule(tag):
+        """Queue the tag's next pages up to the read-ahead depth (call with `lock` held)."""
+        state = tag_state[tag]
+        if state["stop"] is not None or len(scraped_data) >= max_articles:
+            return
+        # Read ahead only once the first page showed the tag exists and how it renders
+        width = depth if state["committed"] else 1
+        while state["queued"] < MAX_PAGES and state["queued"] - state["committed"] < width:
+            state["queued"] += 1
+            jobs.put((tag, state["queued"]))
+
+    def finish(tag, page, fetched):
+        """Hand a fetched page to the tag's in-order commit; one thread commits per tag."""
+        state = tag_state[tag]
+        with lock:
+            if state["stop"] is not None:
+                return  # Fetched past the page that ended the tag: ignored
+            state["fetched"][page] = fetched
+            if state["committing"]:
+                return
+            state["committing"] = True
+
+        while True:
+            with lock:
+                page = state["committed"] + 1
+                if state["stop"] is not None or page not in state["fetched"]:
+                    state["committing"] = False
+                    schedule(tag)
+                    return
+                fetched = state["fetched"].pop(page)
+            try:
+                go_on = commit_page(tag, page, *fetched)
+            except Exception as e:
+                logger.error(f"❌ {tag} page {page} failed: {e}")
+                go_on = False
+            with lock:
+                state["committed"] = page
+                if not go_on:
+                    state["stop"] = page
+                    state["fetched"].clear()
+
+    def worker():
+        while True:
+            job = jobs.get()
+            try:
+                if job is None:
+                    return
+                tag, page = job
+                with lock:
+                    stop = tag_state[tag]["stop"]
+                    skip = (stop is not None and page > stop) or len(scraped_data) >= max_articles
+                if skip:
+                    continue
+                try:
+                    fetched = fetch_page(tag, page)
+                except Exception as e:
+                    logger.error(f"❌ {tag} page {page} failed: {e}")
+                    fetched = (None, "browser")
+                finish(tag, page, fetched)
+            finally:
+                jobs.task_done()
+
+    workers = [threading.Thread(target=worker) for _ in range(pool.size)]
+    try:
+        for t in workers:
+            t.start()
+        jobs.join()
+    finally:
+        for _ in workers:
+            jobs.put(None)
+        for t in workers:
+            t.join()
+        if owns_pool:
+            pool.close()
+
+    _save_decisions(decisions, decisions_path)
+
+    saved_path = output_path
+    if frontier:
+        # Only the new head is written; earlier raw files are never rewritten
+        saved_path = write_crawl_delta(output_path, scraped_data)
+        frontier.add(a["link"] for a in scraped_data)
+        logger.info(f"🆕 New articles since the last crawl: {len(scraped_data)}")
+    else:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(scraped_data, f, indent=2, ensure_ascii=False)
 
     logger.info(f"🎉 TAG SCRAPING COMPLETE!")
     logger.info(f"📊 Total articles scraped: {len(scraped_data)}")
-    logger.info(f"💾 Saved to: {output_path}")
+    if saved_path:
+        logger.info(f"💾 Saved to: {saved_path}")
     logger.info(f"🔗 Unique fingerprints: {len(seen_fingerprints)}")
+    return scraped_data
+
+
+def _save_decisions(decisions, path):
+    """Write the per-page render decisions of a run as JSON Lines and log a summary."""
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for decision in sorted(decisions, key=lambda d: (d["tag"], d["page"])):
+            f.write(json.dumps(decision) + "\n")
+    browser_pages = sum(d["renderer"] == "browser" for d in decisions)
+    logger.info(
+        f"🧭 Rendered {len(decisions) - browser_pages} pages from HTML snapshots, "
+        f"{browser_pages} in the browser (decisions: {path})"
+    )
 
 
 def test_form_submission():
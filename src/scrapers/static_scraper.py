@@ -1,42 +1,64 @@
 """
-Static scraper for NPR News articles using BeautifulSoup and multithreaded requests.
+Static scraper for NPR News articles using static HTML parsing.
 
 This module fetches articles from NPR's News section and handles:
-- Parsing article metadata (title, link, publication date)
-- Simulating throttled requests
-- Multithreaded scraping for performance
+- Parsing article metadata (title, link, publication date) with the
+  configured backend from `src.scrapers.parsers` (lxml by default)
+- Per-host rate limiting of page requests (`src.utils.rate_limiter`)
 - Handling pagination via 'Load More' requests
 - Saving results to JSON format
+
+Two fetch engines are available, selected by `scraper_settings.static_engine`:
+- "async" (default): concurrent page fetches over one aiohttp session,
+  see `src.scrapers.async_static_scraper`
+- "sync": the original one-page-at-a-time `safe_request` loop
 """
 
-from bs4 import BeautifulSoup
 import json
 import os
-import time
-import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.utils.logger import setup_logger
 from src.utils.helpers import get_random_user_agent, safe_request, load_config
+from src.utils.http_cache import get_http_cache
+from src.scrapers.parsers import get_parser
+from src.data.frontier import open_frontier, write_crawl_delta
+from src.data.pool import open_article_writer
 
 logger = setup_logger()
 
+BASE_URL = "https://www.npr.org/sections/news/"
+NEXT_URL_TEMPLATE = "https://www.npr.org/get/1001/render/partial/next?start={start}&count=24"
+PAGE_SIZE = 24
+MAX_ARTICLES = 1000
+OUTPUT_PATH = "data_output/raw/npr_static.json"
+
+
+def build_headers(base_url=BASE_URL):
+    """Return request headers mimicking NPR's own 'Load More' XHR calls."""
+    return {
+        "User-Agent": get_random_user_agent(),
+        "Referer": base_url,
+        "X-Requested-With": "XMLHttpRequest",
+    }
 
-def throttle_requests(min_delay, max_delay):
-    """Pause execution for a random duration between `min_delay` and `max_delay` to avoid rate limiting."""
-    delay = random.uniform(min_delay, max_delay)
-    logger.debug(f"⏳ Throttling for {delay:.2f} seconds")
-    time.sleep(delay)
 
+def parse_article(article, parser=None):
+    """
+        Parse a single <article> element from NPR and extract metadata (title, link, date).
 
-def parse_article(article, min_delay, max_delay):
-    """Parse a single <article> element from NPR and extract metadata (title, link, date)."""
+        Args:
+            article: Article node produced by `parser`.
+            parser (optional): Backend from `src.scrapers.parsers`; defaults
+                to the configured one.
+    """
+    parser = parser or get_parser()
     try:
-        throttle_requests(min_delay, max_delay)
-        title_tag = article.select_one("h2.title a")
-        title = title_tag.text.strip()
-        link = title_tag["href"]
-        date_tag = article.select_one("time")
-        published = date_tag["datetime"] if date_tag else "N/A"
+        title_tag = parser.select_one(article, "h2.title a")
+        title = parser.text(title_tag).strip()
+        link = parser.attr(title_tag, "href")
+        if not link:
+            raise KeyError("href")
+        date_tag = parser.select_one(article, "time")
+        published = parser.attr(date_tag, "datetime") if date_tag is not None else "N/A"
 
         logger.debug(f"📰 Parsed article: {title[:50]}...")
 
@@ -51,89 +73,175 @@ def parse_article(article, min_delay, max_delay):
         return None
 
 
+def parse_page(html, parser=None):
+    """Return the article metadata found on one listing page, skipping malformed entries."""
+    if not html or not html.strip():
+        return []
+    parser = parser or get_parser()
+    root = parser.parse(html)
+    articles = (parse_article(node, parser) for node in parser.select(root, "article"))
+    return [a for a in articles if a is not None]
+
+
+class PageCollector:
+    """
+        Accumulates articles page by page for both fetch engines.
+
+        Articles known to the crawl frontier are skipped, and a page whose
+        articles are all known signals that pagination can stop.
+
+        Args:
+            max_articles (int): Stop accepting articles after this many.
+            writer (ArticleWriter, optional): Receives each new article.
+            frontier (CrawlFrontier, optional): Seen-URL store for incremental crawls.
+    """
+
+    def __init__(self, max_articles=MAX_ARTICLES, writer=None, frontier=None):
+        self.max_articles = max_articles
+        self.writer = writer
+        self.frontier = frontier
+        self.articles = []
+
+    @property
+    def full(self):
+        return len(self.articles) >= self.max_articles
+
+    def add_page(self, articles):
+        """
+            Add one page of parsed articles.
+
+            Returns:
+                bool: True if every article on the page was already known.
+        """
+        known = self.frontier.known(a["link"] for a in articles) if self.frontier else set()
+        for article in articles:
+            if self.full:
+                break
+            if article["link"] in known:
+                continue
+            self.articles.append(article)
+            if self.writer:
+                self.writer.submit(article)
+        return bool(articles) and all(a["link"] in known for a in articles)
+
+
 def run_static_scrapers():
     """Scrape up to 1000 articles from NPR News using static HTML parsing and save them as JSON."""
+    config = load_config()
+    settings = config.get("scraper_settings", {})
     logger.info("📡 Starting static scraping for NPR News...")
+    frontier = open_frontier(config)
 
-    config = load_config()
-    min_delay = config.get("scraper_settings", {}).get("throttle_min", 1)
-    max_delay = config.get("scraper_settings", {}).get("throttle_max", 3)
+    try:
+        with open_article_writer(config) as writer:
+            if settings.get("static_engine", "async") == "sync":
+                scraped_data = scrape_npr(
+                    cache=get_http_cache(), writer=writer, frontier=frontier
+                )
+            else:
+                # Imported lazily so the sync engine works without aiohttp installed
+                from src.scrapers.async_static_scraper import run_async_scraper
+
+                scraped_data = run_async_scraper(
+                    concurrency=settings.get("concurrency", 8),
+                    cache=get_http_cache(),
+                    writer=writer,
+                    frontier=frontier,
+                )
+
+        if scraped_data is None:
+            return
+        if frontier:
+            delta_path = write_crawl_delta(OUTPUT_PATH, scraped_data)
+            frontier.add(a["link"] for a in scraped_data)
+            logger.info(
+                f"🆕 {len(scraped_data)} new NPR articles since the last crawl"
+                + (f" saved to {delta_path}." if delta_path else ".")
+            )
+        else:
+            save_articles(scraped_data)
+    finally:
+        if frontier:
+            frontier.close()
+
+
+def save_articles(scraped_data, output_path=OUTPUT_PATH):
+    """Write scraped article metadata to the raw JSON file."""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(scraped_data, f, indent=2)
 
-    base_url = "https://www.npr.org/sections/news/"
-    next_url_template = (
-        "https://www.npr.org/get/1001/render/partial/next?start={start}&count=24"
-    )
+    logger.debug(f"📁 Saved {len(scraped_data)} articles to {output_path}")
+    logger.info(f"✅ Scraped and saved {len(scraped_data)} NPR articles.")
 
-    headers = {
-        "User-Agent": get_random_user_agent(),
-        "Referer": base_url,
-        "X-Requested-With": "XMLHttpRequest",
-    }
+
+def scrape_npr(
+    base_url=BASE_URL,
+    next_url_template=NEXT_URL_TEMPLATE,
+    max_articles=MAX_ARTICLES,
+    rate_limiter=None,
+    cache=None,
+    writer=None,
+    frontier=None,
+):
+    """
+        Collect NPR articles one page at a time with blocking requests (the "sync" engine).
+
+        Args:
+            base_url (str): First listing page.
+            next_url_template (str): 'Load More' URL with a `{start}` offset placeholder.
+            max_articles (int): Stop after this many articles.
+            rate_limiter (RateLimiter, optional): Per-host limiter; defaults to
+                the shared one configured in `config/settings.yaml`.
+            cache (HttpCache, optional): Response cache for conditional requests.
+            writer (ArticleWriter, optional): Receives each article when
+                write-through is enabled.
+            frontier (CrawlFrontier, optional): Skip known articles and stop at
+                the first page that is entirely known.
+
+        Returns:
+            list[dict] or None: Scraped articles, or None if the first page failed.
+    """
+    headers = build_headers(base_url)
     logger.debug(f"Using User-Agent: {headers['User-Agent']}")
 
-    scraped_data = []
+    collector = PageCollector(max_articles, writer, frontier)
 
     # Scrape initial page
-    response = safe_request(base_url, headers=headers)
+    response = safe_request(base_url, headers=headers, rate_limiter=rate_limiter, cache=cache)
     if not response:
         logger.error(f"❌ Failed to fetch initial page: {base_url}")
-        return
+        return None
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    articles = soup.select("article")
+    articles = parse_page(response.text)
     logger.debug(f"🔎 Found {len(articles)} articles on the initial page")
-
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [
-            executor.submit(parse_article, article, min_delay, max_delay)
-            for article in articles
-        ]
-        for future in as_completed(futures):
-            result = future.result()
-            if result:
-                scraped_data.append(result)
-                if len(scraped_data) >= 1000:
-                    logger.info("✅ Reached 1000 articles. Stopping.")
-                    break
+    if collector.add_page(articles):
+        logger.info("🛑 Initial page already crawled — nothing new.")
+        return collector.articles
 
     # Scrape "Load More" articles
-    start = 24
-    while len(scraped_data) < 1000:
+    start = PAGE_SIZE
+    while not collector.full:
         page_url = next_url_template.format(start=start)
         logger.debug(f"🔁 Requesting: {page_url}")
-        response = safe_request(page_url, headers=headers)
+        response = safe_request(page_url, headers=headers, rate_limiter=rate_limiter, cache=cache)
         if not response:
             logger.warning(f"⚠️ Skipping start={start} due to fetch failure.")
-            start += 24
+            start += PAGE_SIZE
             continue
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        articles = soup.select("article")
+        articles = parse_page(response.text)
         logger.debug(f"🔎 Found {len(articles)} articles at start={start}")
 
         if not articles:
             logger.info("📭 No more articles found — ending early.")
             break
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(parse_article, article, min_delay, max_delay)
-                for article in articles
-            ]
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    scraped_data.append(result)
-                    if len(scraped_data) >= 1000:
-                        logger.info("✅ Reached 1000 articles. Stopping.")
-                        break
-
-        start += 24
-
-    os.makedirs("data_output/raw", exist_ok=True)
-    output_path = "data_output/raw/npr_static.json"
-    with open(output_path, "w") as f:
-        json.dump(scraped_data, f, indent=2)
+        if collector.add_page(articles):
+            logger.info(f"🛑 Page start={start} already crawled — stopping.")
+            break
+        start += PAGE_SIZE
 
-    logger.debug(f"📁 Saved {len(scraped_data)} articles to {output_path}")
-    logger.info(f"✅ Scraped and saved {len(scraped_data)} NPR articles.")
+    if collector.full:
+        logger.info(f"✅ Reached {max_articles} articles. Stopping.")
+    return collector.articles
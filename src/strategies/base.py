@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 
 class ScraperStrategy(ABC):
     """Abstract base class that defines a standard interface for scraper strategies."""
+    name = "base"
+
     @abstractmethod
     def run(self):
         """Execute the scraper logic. Must be implemented by all concrete strategy subclasses."""
@@ -11,6 +11,8 @@ from src.scrapers.selenium_scraper import run_dynamic_scrapers
 
 class DynamicScraperStrategy(ScraperStrategy):
     """Concrete strategy class for running dynamic (Selenium-based) scrapers."""
+    name = "dynamic"
+
     def run(self):
         """Execute the dynamic scraper using Selenium and multithreaded logic."""
         run_dynamic_scrapers()
@@ -0,0 +1,231 @@
+"""
+Runs several scraper strategies side by side, each in its own process.
+
+Every strategy gets a fresh spawned process (Scrapy's reactor and
+Selenium's drivers stay isolated), an optional wall-clock timeout and
+optional resource limits. The caller gets back one `StrategyResult` per
+strategy. With `parallel=True` the total wall-clock time is that of the
+slowest scraper instead of the sum.
+
+Timeouts and limits come from the `runner` section of `config/settings.yaml`:
+
+    runner:
+      timeouts:            # seconds per strategy name
+        static: 1800
+      limits:
+        scrapy: {memory_mb: 2048, cpu_seconds: 3600}
+
+`memory_mb` caps the address space (RLIMIT_AS) and `cpu_seconds` the CPU
+time (RLIMIT_CPU) of the strategy's process and its children; an address
+space cap is unsuitable for Chrome, which reserves far more than it uses.
+Limits are only applied on POSIX systems.
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+POLL_INTERVAL = 1.0
+
+
+@dataclass
+class StrategyResult:
+    """
+        Outcome of one strategy run.
+
+        Attributes:
+            name (str): Strategy name ('static', 'dynamic', 'scrapy', ...).
+            status (str): 'ok', 'error', 'timeout' or 'crashed'.
+            elapsed (float): Wall-clock seconds.
+            result: Whatever the strategy's `run()` returned (e.g. a CrawlResult).
+            error (str, optional): Error message or exit code description.
+    """
+
+    name: str
+    status: str
+    elapsed: float
+    result: object = None
+    error: str = None
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+def strategy_name(strategy):
+    """Return the strategy's `name`, falling back to its class name."""
+    return getattr(strategy, "name", type(strategy).__name__)
+
+
+def _apply_limits(limits):
+    """Apply `memory_mb` / `cpu_seconds` limits to the current process (POSIX only)."""
+    if not limits:
+        return
+    try:
+        import resource
+    except ImportError:
+        logger.warning("⚠️ Resource limits are not supported on this platform")
+        return
+    if limits.get("memory_mb"):
+        size = int(limits["memory_mb"]) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+    if limits.get("cpu_seconds"):
+        seconds = int(limits["cpu_seconds"])
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds))
+
+
+def _run_child(strategy, conn, limits):
+    """Process entry point: run one strategy and send back ('ok'|'error', payload)."""
+    if hasattr(os, "setpgrp"):
+        # Own process group, so a timeout also stops chromedriver/Chrome children
+        os.setpgrp()
+    try:
+        _apply_limits(limits)
+        conn.send(("ok", strategy.run()))
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class _Running:
+    """Bookkeeping for one started strategy process."""
+
+    def __init__(self, ctx, strategy, timeout, limits):
+        self.name = strategy_name(strategy)
+        receiver, sender = ctx.Pipe(duplex=False)
+        self.conn = receiver
+        self.proc = ctx.Process(
+            target=_run_child, args=(strategy, sender, limits), name=f"scraper-{self.name}"
+        )
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout if timeout else None
+        self.proc.start()
+        sender.close()
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def stop(self):
+        """Terminate the process and everything in its process group."""
+        if self.proc.is_alive():
+            try:
+                os.killpg(self.proc.pid, signal.SIGTERM)
+            except (AttributeError, OSError):
+                self.proc.terminate()
+        self.proc.join(5)
+        if self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join()
+
+    def poll(self, now):
+        """Return a StrategyResult once the process has finished or overrun its deadline."""
+        alive = self.proc.is_alive()  # checked first: a dead child has sent everything
+        if self.conn.poll():
+            try:
+                status, payload = self.conn.recv()
+            except EOFError:
+                status, payload = None, None
+            self.proc.join()
+            if status == "ok":
+                return StrategyResult(self.name, "ok", self.elapsed(), result=payload)
+            if status == "error":
+                return StrategyResult(self.name, "error", self.elapsed(), error=payload)
+            alive = False
+        if not alive:
+            self.proc.join()
+            return StrategyResult(
+                self.name, "crashed", self.elapsed(), error=f"exit code {self.proc.exitcode}"
+            )
+        if self.deadline and now >= self.deadline:
+            self.stop()
+            return StrategyResult(
+                self.name, "timeout", self.elapsed(), error=f"killed after {self.elapsed():.0f}s"
+            )
+        return None
+
+
+def run_strategies(strategies, parallel=True, timeouts=None, limits=None):
+    """
+        Run scraper strategies in separate processes and collect their results.
+
+        Args:
+            strategies (list): ScraperStrategy instances (must be picklable).
+            parallel (bool): Run all at once; otherwise one after another.
+            timeouts (dict, optional): Seconds per strategy name; a '*' key
+                applies to strategies without their own entry.
+            limits (dict, optional): Resource limits per strategy name, see
+                the module docstring.
+
+        Returns:
+            list: One StrategyResult per strategy, in the order given.
+    """
+    timeouts = timeouts or {}
+    limits = limits or {}
+    ctx = multiprocessing.get_context("spawn")
+    pending = list(strategies)
+    max_running = len(pending) if parallel else 1
+    running, finished = [], {}
+
+    try:
+        while pending or running:
+            while pending and len(running) < max_running:
+                strategy = pending.pop(0)
+                name = strategy_name(strategy)
+                logger.info(f"🚀 Starting {name} scraper")
+                running.append(
+                    _Running(ctx, strategy, timeouts.get(name, timeouts.get("*")), limits.get(name))
+                )
+
+            now = time.monotonic()
+            deadlines = [r.deadline - now for r in running if r.deadline]
+            wait(
+                [r.conn for r in running] + [r.proc.sentinel for r in running],
+                timeout=max(0.0, min(deadlines + [POLL_INTERVAL])),
+            )
+
+            now = time.monotonic()
+            for run in list(running):
+                result = run.poll(now)
+                if result is not None:
+                    running.remove(run)
+                    finished.setdefault(run.name, []).append(result)
+                    icon = "✅" if result.ok else "❌"
+                    logger.info(f"{icon} {result.name} scraper {result.status} in {result.elapsed:.1f}s")
+    finally:
+        for run in running:
+            run.stop()
+
+    ordered = []
+    for strategy in strategies:
+        ordered.append(finished[strategy_name(strategy)].pop(0))
+    return ordered
+
+
+def format_summary(results, wall_time=None):
+    """
+        Render a combined summary table of strategy results.
+
+        Args:
+            results (list): StrategyResult objects.
+            wall_time (float, optional): Wall-clock seconds of the whole run.
+
+        Returns:
+            str: One line per strategy, then the wall-clock and summed times.
+    """
+    lines = [f"{'scraper':<10} {'status':<8} {'seconds':>8}  details"]
+    for r in results:
+        details = r.error or ""
+        if r.ok and r.result is not None:
+            details = str(r.result)
+        lines.append(f"{r.name:<10} {r.status:<8} {r.elapsed:>8.1f}  {details}")
+    if wall_time is not None:
+        total = sum(r.elapsed for r in results)
+        lines.append(f"{len(results)} scrapers in {wall_time:.1f}s wall clock ({total:.1f}s summed)")
+    return "\n".join(lines)
@@ -1,16 +1,27 @@
 """
 Implements the Scrapy-based scraping strategy.
 
-This strategy runs the Scrapy crawler via a shell command,
+This strategy runs the Scrapy crawler in-process through `CrawlerProcess`,
 integrating it into the unified scraping framework using the Strategy design pattern.
 """
 
 from src.strategies.base import ScraperStrategy
-import os
+from src.scrapers.scrapy_crawler.runner import crawl_settings, run_scrapy_crawl
 
 
 class ScrapyScraperStrategy(ScraperStrategy):
-    """Concrete strategy class for running Scrapy-based scrapers."""
+    """
+        Concrete strategy class for running Scrapy-based scrapers.
+
+        Args:
+            **options: Overrides for `crawl_settings` (concurrent_requests,
+                per_domain, download_delay, autothrottle, autothrottle_target).
+    """
+    name = "scrapy"
+
+    def __init__(self, **options):
+        self.options = options
+
     def run(self):
-        """Execute the Scrapy spider by invoking a system shell command."""
-        os.system("scrapy crawl generic_news_spider")
+        """Execute the Scrapy spider in this process and return its CrawlResult."""
+        return run_scrapy_crawl(crawl_settings(**self.options))
@@ -10,7 +10,9 @@ from src.scrapers.static_scraper import run_static_scrapers
 
 
 class StaticScraperStrategy(ScraperStrategy):
-    """Concrete strategy for running static scraping logic using BeautifulSoup and requests."""
+    """Concrete strategy for running static scraping logic using requests and the configured HTML parser."""
+    name = "static"
+
     def run(self):
         """Execute the static scraper defined in the static_scraper module."""
         run_static_scrapers()
@@ -0,0 +1,99 @@
+"""
+Helpers for reading and appending compressed JSON Lines files.
+
+Supports plain files, gzip (`.gz`) and Zstandard (`.zst`). Zstandard uses
+the standard-library `compression.zstd` module (Python 3.14+) or the
+`backports.zstd` package; it is optional and only required when a `.zst`
+file is actually read or written.
+
+Appended gzip/zstd data starts a new compressed member/frame, which both
+formats decode transparently, so one file can grow across many crawls.
+"""
+
+import gzip
+import io
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _require_zstd():
+    if zstd is None:
+        raise RuntimeError(
+            "Zstandard support needs Python 3.14+ or `pip install backports.zstd`"
+        )
+    return zstd
+
+
+def compression_for(path):
+    """Return 'gzip', 'zstd' or None based on the file suffix."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def open_text(path):
+    """
+        Open a plain, gzip or zstd file for reading text.
+
+        Args:
+            path (str): File path; the suffix selects the decompressor.
+
+        Returns:
+            TextIO: UTF-8 text stream. Reading a truncated compressed file
+            raises EOFError after the last complete data.
+    """
+    compression = compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == "zstd":
+        return _require_zstd().open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def open_compressed_appender(fileobj, compression=None):
+    """
+        Wrap a binary file opened for appending in a compressor.
+
+        The returned stream's `flush()` pushes all written data through to
+        `fileobj` in a decodable state (gzip sync flush / zstd block flush);
+        closing it leaves `fileobj` open.
+
+        Args:
+            fileobj (BinaryIO): Underlying file, opened with mode 'ab'.
+            compression (str, optional): 'gzip', 'zstd' or None.
+
+        Returns:
+            BinaryIO: Stream to write uncompressed bytes to.
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="ab")
+    if compression == "zstd":
+        return _require_zstd().ZstdFile(fileobj, mode="a")
+    if compression is None:
+        return _Unclosable(fileobj)
+    raise ValueError(f"Unknown compression: {compression!r}")
+
+
+class _Unclosable(io.RawIOBase):
+    """Pass-through writer whose close() does not close the wrapped file."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self._fileobj.write(data)
+
+    def flush(self):
+        self._fileobj.flush()
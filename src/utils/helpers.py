@@ -7,6 +7,7 @@ import random
 import requests
 import time
 import yaml
+from urllib.parse import urlparse
 
 
 def get_random_user_agent():
@@ -25,23 +26,45 @@ def get_random_user_agent():
     return random.choice(user_agents)
 
 
-def safe_request(url, headers=None, retries=3, timeout=5):
+def safe_request(url, headers=None, retries=3, timeout=5, rate_limiter=None, cache=None):
     """
         Sends an HTTP GET request with retry logic and error handling.
 
+        Every attempt first takes a token from the per-host rate limiter.
+        With a `cache`, a previously stored copy is revalidated with
+        `If-None-Match` / `If-Modified-Since` and reused on `304 Not Modified`.
+
         Args:
             url (str): The target URL to request.
             headers (dict, optional): Optional HTTP headers to include.
             retries (int): Number of retry attempts on failure.
             timeout (int): Timeout duration for each request.
+            rate_limiter (RateLimiter, optional): Limiter to use. Defaults to
+                the shared limiter from `src.utils.rate_limiter`.
+            cache (HttpCache, optional): Response cache from `src.utils.http_cache`.
 
         Returns:
             requests.Response or None: The response object if successful, otherwise None.
     """
+    if rate_limiter is None:
+        # Imported here because rate_limiter itself depends on this module
+        from src.utils.rate_limiter import get_rate_limiter
+
+        rate_limiter = get_rate_limiter()
+
+    cached = cache.get(url) if cache else None
+    if cached:
+        headers = {**(headers or {}), **cached.conditional_headers()}
+
     for attempt in range(1, retries + 1):
+        rate_limiter.acquire(url)
         try:
             response = requests.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 304 and cached:
+                return cached.to_response()
             if response.status_code == 200:
+                if cache:
+                    cache.store(url, response.content, response.headers)
                 return response
             else:
                 print(f"⚠️ Status {response.status_code} on attempt {attempt}")
@@ -51,6 +74,21 @@ def safe_request(url, headers=None, retries=3, timeout=5):
     return None
 
 
+def source_from_link(link):
+    """
+        Derives the source domain of an article from its URL.
+
+        Args:
+            link (str): Article URL.
+
+        Returns:
+            str: Lower-cased host without a leading 'www.' (e.g. 'npr.org'),
+            or 'unknown' if the URL has no host.
+    """
+    host = urlparse(link or "").hostname or ""
+    return host[4:] if host.startswith("www.") else host or "unknown"
+
+
 def load_config(path="config/settings.yaml"):
     """
         Loads YAML configuration settings from the specified file path.
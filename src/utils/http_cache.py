@@ -0,0 +1,249 @@
+"""
+On-disk HTTP response cache with conditional revalidation.
+
+Responses that carry an `ETag` or `Last-Modified` validator are stored with
+their body gzip-compressed in one file per URL. Metadata (validators,
+content type, compressed size and last access time) lives in a small SQLite
+index next to the bodies.
+
+On the next request for the same URL the scraper sends `If-None-Match` /
+`If-Modified-Since`; a `304 Not Modified` answer is served from the cached
+body, so unchanged pages cost one header round trip instead of a download.
+When the cache grows beyond `max_bytes`, least recently used entries are
+evicted first.
+
+Settings come from the `http_cache` section of `config/settings.yaml`.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+import requests
+from requests.structures import CaseInsensitiveDict
+from src.utils.helpers import load_config
+
+HTTP_CACHE_DIR = "data_output/cache/http"
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+COMPRESS_LEVEL = 6
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+@dataclass
+class CacheEntry:
+    """
+        A cached response body and the validators needed to revalidate it.
+
+        Attributes:
+            url (str): Requested URL.
+            body (bytes): Decompressed response body.
+            etag (str or None): `ETag` header of the cached response.
+            last_modified (str or None): `Last-Modified` header of the cached response.
+            content_type (str or None): `Content-Type` header, used to decode the body.
+    """
+    url: str
+    body: bytes
+    etag: str = None
+    last_modified: str = None
+    content_type: str = None
+
+    def conditional_headers(self):
+        """Return the revalidation headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def text(self, default_encoding="utf-8"):
+        """Decode the body using the charset from the cached `Content-Type`."""
+        match = _CHARSET_RE.search(self.content_type or "")
+        try:
+            return self.body.decode(match.group(1) if match else default_encoding, "replace")
+        except LookupError:  # Unknown charset name
+            return self.body.decode(default_encoding, "replace")
+
+    def to_response(self):
+        """Rebuild a 200 `requests.Response` from the cached body."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": self.content_type} if self.content_type else {}
+        )
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+class HttpCache:
+    """
+        Size-bounded, LRU-evicted store of revalidatable HTTP responses.
+
+        Safe to share between threads.
+
+        Args:
+            directory (str, optional): Cache directory. Defaults to HTTP_CACHE_DIR.
+            max_bytes (int): Upper bound on the total compressed body size.
+    """
+
+    def __init__(self, directory=None, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.directory = directory or HTTP_CACHE_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.directory, "index.db"), check_same_thread=False
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                size INTEGER,
+                accessed REAL
+            )
+        """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed)")
+        self._conn.commit()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f"{key}.gz")
+
+    def get(self, url):
+        """
+            Look up a cached response and mark it as recently used.
+
+            Args:
+                url (str): Requested URL.
+
+            Returns:
+                CacheEntry or None: The cached entry, or None on a miss.
+        """
+        key = self._key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            try:
+                with gzip.open(self._body_path(key), "rb") as f:
+                    body = f.read()
+            except (OSError, EOFError):
+                # Body file missing or truncated: forget the entry
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return CacheEntry(url, body, *row)
+
+    def store(self, url, body, headers):
+        """
+            Cache a 200 response if it carries an `ETag` or `Last-Modified` validator.
+
+            Args:
+                url (str): Requested URL.
+                body (bytes): Raw response body.
+                headers (Mapping): Response headers (case-insensitive lookups).
+
+            Returns:
+                bool: True if the response was cached.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        key = self._key(url)
+        compressed = gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+        with self._lock:
+            tmp_path = self._body_path(key) + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, self._body_path(key))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    etag,
+                    last_modified,
+                    headers.get("Content-Type"),
+                    len(compressed),
+                    time.time(),
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+        return True
+
+    def total_bytes(self):
+        """Return the total compressed size of all cached bodies."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in `max_bytes`."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            if os.path.exists(self._body_path(key)):
+                os.remove(self._body_path(key))
+            total -= size
+
+    def close(self):
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_http_cache():
+    """
+        Return the process-wide HttpCache, or None when caching is disabled.
+
+        Reads `http_cache.enabled`, `http_cache.directory` and `http_cache.max_mb`
+        from `config/settings.yaml` on first use.
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            try:
+                settings = load_config().get("http_cache", {})
+            except OSError:
+                settings = {}
+            if not settings.get("enabled", False):
+                return None
+            _shared_cache = HttpCache(
+                settings.get("directory"),
+                int(settings.get("max_mb", HTTP_CACHE_MAX_BYTES // (1024 * 1024)) * 1024 * 1024),
+            )
+        return _shared_cache
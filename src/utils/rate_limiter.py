@@ -0,0 +1,197 @@
+"""
+Per-host token-bucket rate limiting shared by every scraper.
+
+Each host gets a bucket refilled at `requests_per_second` tokens per second
+and holding at most `burst` tokens. A request takes one token before it is
+sent; when the bucket is empty the caller waits for its reserved slot, so
+concurrent callers are served in arrival order instead of bursting.
+
+Limits come from the `rate_limits` section of `config/settings.yaml`:
+
+    rate_limits:
+      requests_per_second: 2
+      burst: 1
+      hosts:
+        euronews.com: {requests_per_second: 0.5}
+
+Hosts are matched without a leading 'www.'. Only real network requests
+should acquire a token — parsing already-downloaded pages never waits.
+"""
+
+import asyncio
+import threading
+import time
+from src.utils.helpers import load_config, source_from_link
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 1
+
+
+class TokenBucket:
+    """
+        Thread-safe token bucket.
+
+        Args:
+            rate (float): Tokens added per second; 0 or None means unlimited.
+            burst (int): Bucket capacity, i.e. requests allowed back to back.
+            clock (callable): Monotonic time source, replaceable in tests.
+    """
+
+    def __init__(self, rate, burst=DEFAULT_BURST, clock=time.monotonic):
+        self.rate = rate or 0.0
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+            Take one token, borrowing against future refills if necessary.
+
+            Returns:
+                float: Seconds the caller must wait before sending its request.
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+        Token buckets keyed by host.
+
+        Args:
+            requests_per_second (float): Default per-host rate.
+            burst (int): Default per-host burst size.
+            hosts (dict, optional): Per-host overrides, e.g.
+                {"euronews.com": {"requests_per_second": 0.5, "burst": 1}}.
+    """
+
+    def __init__(
+        self,
+        requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+        burst=DEFAULT_BURST,
+        hosts=None,
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.hosts = {_host_key(host): limits or {} for host, limits in (hosts or {}).items()}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+            Build a limiter from parsed settings.
+
+            Args:
+                config (dict): Parsed settings from `config/settings.yaml`.
+
+            Returns:
+                RateLimiter: Limiter using the `rate_limits` section (defaults if absent).
+        """
+        limits = (config or {}).get("rate_limits", {})
+        return cls(
+            requests_per_second=limits.get("requests_per_second", DEFAULT_REQUESTS_PER_SECOND),
+            burst=limits.get("burst", DEFAULT_BURST),
+            hosts=limits.get("hosts"),
+        )
+
+    def limits_for(self, host):
+        """Return (requests_per_second, burst) for a host, applying overrides."""
+        override = self.hosts.get(_host_key(host), {})
+        return (
+            override.get("requests_per_second", self.requests_per_second),
+            override.get("burst", self.burst),
+        )
+
+    def bucket(self, url):
+        """Return the shared bucket for the host of `url`."""
+        host = source_from_link(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(*self.limits_for(host))
+            return self._buckets[host]
+
+    def acquire(self, url):
+        """Block until a request to `url` is allowed."""
+        delay = self.bucket(url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url):
+        """Wait, without blocking the event loop, until a request to `url` is allowed."""
+        delay = self.bucket(url).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _host_key(host):
+    """Normalize a configured host name the same way `source_from_link` does."""
+    host = host.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _load_settings():
+    """Read `config/settings.yaml`, or return {} when it is unavailable."""
+    try:
+        return load_config()
+    except OSError:
+        return {}
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+        Return the process-wide RateLimiter, built from `config/settings.yaml` on first use.
+
+        Falls back to the default limits when the settings file cannot be read.
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter.from_config(_load_settings())
+        return _shared_limiter
+
+
+def scrapy_rate_settings(config=None):
+    """
+        Translate the `rate_limits` settings into Scrapy download settings.
+
+        Scrapy throttles per download slot (one per host), so the default rate
+        becomes `DOWNLOAD_DELAY` and per-host overrides become `DOWNLOAD_SLOTS`.
+
+        Args:
+            config (dict, optional): Parsed settings; read from
+                `config/settings.yaml` when omitted.
+
+        Returns:
+            dict: Scrapy settings to merge into the project settings.
+    """
+    limiter = RateLimiter.from_config(_load_settings() if config is None else config)
+
+    def delay(rate):
+        return 1.0 / rate if rate else 0.0
+
+    slots = {}
+    for host in limiter.hosts:
+        rate, burst = limiter.limits_for(host)
+        for slot in (host, f"www.{host}"):
+            slots[slot] = {"delay": delay(rate), "concurrency": burst}
+
+    return {
+        "DOWNLOAD_DELAY": delay(limiter.requests_per_second),
+        "RANDOMIZE_DOWNLOAD_DELAY": False,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": limiter.burst,
+        "DOWNLOAD_SLOTS": slots,
+    }
@@ -0,0 +1,156 @@
+"""
+Integration test comparing the sync and async NPR static scraper engines.
+
+A local HTTP server stands in for NPR: it serves a fixed number of listing
+pages with artificial latency and records when each request arrives. Both
+engines must collect the same articles; the async engine must finish
+clearly faster while never exceeding its configured requests/sec, and a
+re-crawl with the HTTP cache must be answered entirely with 304s without
+touching the cache from the event loop thread.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+from src.scrapers.static_scraper import PAGE_SIZE, scrape_npr
+from src.scrapers.async_static_scraper import scrape_npr_async
+from src.utils.http_cache import HttpCache
+from src.utils.rate_limiter import RateLimiter
+
+LATENCY = 0.2
+PAGES = 8
+RATE = 20
+
+
+class _ListingHandler(BaseHTTPRequestHandler):
+    """Serves PAGES listing pages of PAGE_SIZE articles, then empty pages."""
+
+    arrivals = []
+    statuses = []
+
+    def do_GET(self):
+        self.arrivals.append(time.monotonic())
+        time.sleep(LATENCY)
+        query = parse_qs(urlparse(self.path).query)
+        start = int(query.get("start", ["0"])[0])
+        etag = f'"page-{start}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        articles = ""
+        if start < PAGES * PAGE_SIZE:
+            articles = "".join(
+                f'<article><h2 class="title"><a href="https://www.npr.org/{n}">'
+                f'Story {n}</a></h2><time datetime="2025-06-17"></time></article>'
+                for n in range(start, start + PAGE_SIZE)
+            )
+        body = f"<html><body>{articles}</body></html>".encode()
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def npr_server():
+    """
+        Fixture that runs the stand-in listing server on a free local port.
+
+        Yields the base URL and 'Load More' template pointing at the server.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ListingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    _ListingHandler.arrivals = []
+    _ListingHandler.statuses = []
+    yield f"{base}/sections/news/", f"{base}/next?start={{start}}&count=24"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_engine_is_faster_at_the_same_request_rate(npr_server):
+    """
+        Test that the async engine matches the sync results, respects the rate
+        limit and beats the latency-bound sequential loop.
+    """
+    base_url, template = npr_server
+
+    began = time.monotonic()
+    sync_articles = scrape_npr(base_url, template, rate_limiter=RateLimiter(RATE))
+    sync_elapsed = time.monotonic() - began
+
+    _ListingHandler.arrivals = []
+    began = time.monotonic()
+    async_articles = asyncio.run(
+        scrape_npr_async(
+            base_url, template, concurrency=8, rate_limiter=RateLimiter(RATE)
+        )
+    )
+    async_elapsed = time.monotonic() - began
+
+    assert len(sync_articles) == PAGES * PAGE_SIZE
+    assert [a["link"] for a in async_articles] == [
+        f"https://www.npr.org/{n}" for n in range(PAGES * PAGE_SIZE)
+    ]
+    assert {a["link"] for a in sync_articles} == {a["link"] for a in async_articles}
+
+    # Arrival jitter can shorten single gaps, so check the sustained rate
+    arrivals = _ListingHandler.arrivals
+    assert (len(arrivals) - 1) / (arrivals[-1] - arrivals[0]) <= RATE * 1.1
+    assert async_elapsed < 0.6 * sync_elapsed
+
+
+class _ThreadRecordingCache(HttpCache):
+    """HttpCache that records the thread of every lookup and write."""
+
+    threads = set()
+
+    def get(self, url):
+        self.threads.add(threading.get_ident())
+        return super().get(url)
+
+    def store(self, url, body, headers):
+        self.threads.add(threading.get_ident())
+        return super().store(url, body, headers)
+
+
+def test_async_recrawl_is_served_from_the_http_cache(npr_server, tmp_path):
+    """
+        Test that a second crawl revalidates every page and rebuilds the same
+        articles from cached bodies.
+    """
+    base_url, template = npr_server
+    cache = _ThreadRecordingCache(str(tmp_path / "http"))
+
+    def crawl():
+        # asyncio.run drives the loop on this thread
+        return asyncio.run(
+            scrape_npr_async(
+                base_url, template, concurrency=2, rate_limiter=RateLimiter(0), cache=cache
+            )
+        )
+
+    first = crawl()
+    _ListingHandler.statuses = []
+    second = crawl()
+
+    assert second == first
+    assert len(first) == PAGES * PAGE_SIZE
+    # The first page, every article page and the empty end page are unchanged;
+    # only look-ahead offsets cancelled during the first crawl may be new
+    assert _ListingHandler.statuses.count(304) >= PAGES + 1
+    assert cache.threads and threading.get_ident() not in cache.threads
+    cache.close()
@@ -24,6 +24,7 @@ PROCESSED_PATH = os.path.abspath(
         os.path.dirname(__file__), "../../data_output/processed/cleaned_articles.json"
     )
 )
+PARQUET_DIR = os.path.join(os.path.dirname(PROCESSED_PATH), "articles")
 
 
 @pytest.fixture
@@ -69,6 +70,8 @@ def setup_raw_data():
         os.remove(test_file)
     if os.path.exists(PROCESSED_PATH):
         os.remove(PROCESSED_PATH)
+    if os.path.isdir(PARQUET_DIR):
+        shutil.rmtree(PARQUET_DIR)
 
     # Restore backup
     for file in os.listdir(temp_backup):
@@ -0,0 +1,60 @@
+"""
+Unit tests for the SQLite storage layer in database.py.
+
+Tests include:
+- Bulk insertion counts for inserted and duplicate rows
+- Row-by-row fallback when a chunk contains an unbindable value
+All tests use a temporary database file.
+"""
+
+import pytest
+from src.data import database
+from src.data.models import NewsArticle
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """
+        Fixture that points the database module at a fresh temporary file.
+    """
+    monkeypatch.setattr("src.data.database.DB_PATH", str(tmp_path / "news.db"))
+    database.create_table()
+    return tmp_path / "news.db"
+
+
+def make_article(i, title=None):
+    """Build a NewsArticle with a unique link per index."""
+    return NewsArticle(
+        title=title or f"Article {i}",
+        link=f"https://example.com/{i}",
+        category="test",
+        published="2025-06-17",
+        source="example.com",
+    )
+
+
+def test_insert_articles_reports_inserted_and_ignored(temp_db):
+    """
+        Test that chunked bulk inserts count new rows and ignored duplicates.
+    """
+    result = database.insert_articles((make_article(i) for i in range(25)), chunk_size=10)
+    assert (result.inserted, result.ignored, result.failed) == (25, 0, 0)
+
+    result = database.insert_articles([make_article(i) for i in range(20, 30)], chunk_size=4)
+    assert (result.inserted, result.ignored, result.failed) == (5, 5, 0)
+
+    with database.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 30
+
+
+def test_insert_articles_isolates_bad_rows(temp_db, caplog):
+    """
+        Test that a row SQLite cannot bind fails alone without losing its chunk,
+        and is logged with its link.
+    """
+    articles = [make_article(1), make_article(2, title={"not": "bindable"}), make_article(3)]
+    result = database.insert_articles(articles)
+    assert (result.inserted, result.ignored, result.failed) == (2, 0, 1)
+    failures = [r for r in caplog.records if r.levelname == "ERROR"]
+    assert len(failures) == 1
+    assert articles[1].link in failures[0].getMessage()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the shared analysis dataset in dataset.py.
+
+Tests include:
+- Typed columns (categoricals, datetime64 dates) from the processed JSON
+- One load shared by trend analysis and export in the same run
+- Reloading after the processed file changes
+- Persisted snapshots reused across instances until the data changes
+- Exports keeping every field and the processing order with a Parquet store
+All tests use temporary paths to avoid altering real data.
+"""
+
+import json
+import os
+import pandas as pd
+import pytest
+from src.analysis import dataset as dataset_module
+from src.analysis import export, trends
+from src.analysis.dataset import ArticleDataset
+from src.data.parquet_store import ParquetArticleWriter
+
+ARTICLES = [
+    {"title": "Budget vote passes", "link": "https://www.npr.org/1", "category": "politics", "published": "2025-06-01"},
+    {"title": "Heat wave budget", "link": "https://www.euronews.com/2", "category": "climate", "published": "2025-06-02"},
+    {"title": "Film festival opens", "link": "https://www.npr.org/3", "category": None, "published": "N/A"},
+]
+
+
+@pytest.fixture
+def processed_path(tmp_path):
+    """
+        Fixture writing ARTICLES as a processed JSON file under tmp_path.
+
+        Returns:
+            Path to cleaned_articles.json.
+    """
+    path = tmp_path / "processed" / "cleaned_articles.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps(ARTICLES), encoding="utf-8")
+    return path
+
+
+def _touch(path, articles):
+    """Rewrite a processed file and move its mtime forward."""
+    path.write_text(json.dumps(articles), encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_frame_has_typed_columns(processed_path):
+    """
+        Test that categories and sources are categoricals and dates are datetime64.
+    """
+    df = ArticleDataset(str(processed_path)).frame()
+
+    assert str(df["category"].dtype) == "category"
+    assert str(df["source"].dtype) == "category"
+    assert pd.api.types.is_datetime64_dtype(df["date"])
+    assert list(df["source"]) == ["npr.org", "euronews.com", "npr.org"]
+    assert df["date"].isna().tolist() == [False, False, True]
+
+
+def test_analysis_and_export_share_one_load(processed_path, tmp_path, monkeypatch):
+    """
+        Test that a full analysis plus export parses the processed file once.
+    """
+    shared = ArticleDataset(str(processed_path))
+    monkeypatch.setattr(dataset_module, "_shared_dataset", shared)
+    monkeypatch.setattr(trends, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(export, "EXPORT_DIR", str(tmp_path))
+
+    trends.run_full_analysis(use_rollups=False)
+    export.export_cleaned_articles()
+
+    assert shared.loads == 1
+    assert json.loads((tmp_path / "articles.json").read_text(encoding="utf-8")) == ARTICLES
+    assert (tmp_path / "top_keywords_titles.csv").read_text().splitlines()[1] == "budget,2"
+
+
+def test_frame_reloads_after_the_file_changes(processed_path):
+    """
+        Test that the cache is keyed by the processed file's size and mtime.
+    """
+    dataset = ArticleDataset(str(processed_path))
+    first = dataset.frame()
+    assert dataset.frame() is first
+
+    _touch(processed_path, ARTICLES[:1])
+
+    assert len(dataset.frame()) == 1
+    assert dataset.loads == 2
+
+
+def test_snapshot_is_reused_until_the_data_changes(processed_path, tmp_path):
+    """
+        Test that a new instance loads from the snapshot and ignores a stale one.
+    """
+    snapshot = str(tmp_path / "cache" / "snapshot.pkl")
+    ArticleDataset(str(processed_path), snapshot_path=snapshot).frame()
+
+    warm = ArticleDataset(str(processed_path), snapshot_path=snapshot)
+    assert len(warm.frame()) == 3
+    assert warm.loads == 0
+
+    _touch(processed_path, ARTICLES[:2])
+    stale = ArticleDataset(str(processed_path), snapshot_path=snapshot)
+    assert len(stale.frame()) == 2
+    assert stale.loads == 1
+
+
+def test_export_keeps_all_fields_in_processing_order(processed_path, tmp_path, monkeypatch):
+    """
+        Test that exports match cleaned_articles.json (extra keys, row order)
+        even when the analysis frame is read from the Parquet store.
+    """
+    articles = [
+        {**ARTICLES[2], "author": "Staff"},
+        ARTICLES[0],
+        {**ARTICLES[1], "summary": "Temperatures rise"},
+    ]
+    _touch(processed_path, articles)
+    with ParquetArticleWriter(str(processed_path.parent / "articles")) as writer:
+        for article in articles:
+            writer.write(article)
+    shared = ArticleDataset(str(processed_path))
+    monkeypatch.setattr(dataset_module, "_shared_dataset", shared)
+    monkeypatch.setattr(export, "EXPORT_DIR", str(tmp_path))
+
+    assert list(shared.frame()["link"]) != [a["link"] for a in articles]
+    export.export_cleaned_articles()
+
+    assert json.loads((tmp_path / "articles.json").read_text(encoding="utf-8")) == articles
+    exported = pd.read_csv(tmp_path / "articles.csv")
+    assert list(exported.columns) == ["title", "link", "category", "published", "author", "summary"]
+    assert list(exported["link"]) == [a["link"] for a in articles]
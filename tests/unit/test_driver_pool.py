@@ -0,0 +1,300 @@
+"""
+Unit tests for the WebDriver pool and the Selenium job-queue scraper.
+
+Fake drivers stand in for Chrome, so no browser is needed.
+
+Tests include:
+- Drivers being created lazily, reused and capped at the pool size
+- Broken drivers being replaced instead of reused
+- Every tag being paginated through the shared (tag, page) queue
+- Pages of a single tag being fetched on every pooled driver
+- JavaScript and WebDriver card extraction agreeing, with one round-trip per page
+- Hybrid mode parsing server-rendered pages and escalating only JS-rendered tags
+"""
+
+import json
+import threading
+import time
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from src.scrapers import selenium_scraper
+from src.scrapers.driver_pool import DriverPool
+from src.utils.rate_limiter import RateLimiter
+from types import SimpleNamespace
+
+PAGES_PER_TAG = 3
+ARTICLES_PER_PAGE = 4
+
+
+class FakeElement:
+    """Minimal WebElement whose lookups count as WebDriver round-trips."""
+
+    calls = 0
+
+    def __init__(self, attributes=None, text="", children=None):
+        self.attributes = attributes or {}
+        self._text = text
+        self.children = children or {}
+
+    @property
+    def text(self):
+        FakeElement.calls += 1
+        return self._text
+
+    def get_attribute(self, name):
+        FakeElement.calls += 1
+        return self.attributes.get(name)
+
+    def find_elements(self, by, value):
+        FakeElement.calls += 1
+        return self.children.get(value, [])
+
+    def find_element(self, by, value):
+        FakeElement.calls += 1
+        return self.children[value][0]
+
+    def to_js(self):
+        """What EXTRACT_CARDS_JS returns for this card."""
+        anchor, time_tag = self.children["a"][0], self.children["time"][0]
+        return {
+            "href": anchor.attributes["href"],
+            "title": anchor._text,
+            "published": time_tag.attributes["datetime"],
+        }
+
+
+def _card(tag, page, n):
+    link = f"https://www.euronews.com/{tag}/2025/06/17/story-{page}-{n}"
+    anchor = FakeElement({"href": link}, text=f"{tag} story {page}-{n}")
+    time_tag = FakeElement({"datetime": "2025-06-17T10:00:00+02:00"})
+    return FakeElement(children={"a": [anchor], "time": [time_tag]})
+
+
+class FakeDriver:
+    """Serves PAGES_PER_TAG tag pages of article cards, then empty pages."""
+
+    def __init__(self, log):
+        self.log = log
+        self.cards = []
+        self.page_source = "<html></html>"
+        self.quit_called = False
+        self.scripts = 0
+
+    def get(self, url):
+        self.log.append(url)
+        time.sleep(0.01)
+        tag = url.split("/tag/")[1].split("?")[0]
+        page = int(url.split("p=")[1])
+        self.cards = (
+            [_card(tag, page, n) for n in range(ARTICLES_PER_PAGE)]
+            if page <= PAGES_PER_TAG
+            else []
+        )
+
+    def find_elements(self, by, value):
+        assert (by, value) == (By.CSS_SELECTOR, "article")
+        return self.cards
+
+    def execute_script(self, script):
+        assert script == selenium_scraper.EXTRACT_CARDS_JS
+        self.scripts += 1
+        return [card.to_js() for card in self.cards]
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_pool():
+    """
+        Fixture providing a two-driver pool of fake drivers and the URLs they loaded.
+    """
+    log, drivers = [], []
+
+    def factory():
+        driver = FakeDriver(log)
+        drivers.append(driver)
+        return driver
+
+    pool = DriverPool(size=2, factory=factory)
+    yield pool, log, drivers
+    pool.close()
+
+
+def test_pool_reuses_and_caps_drivers(fake_pool):
+    """
+        Test that concurrent borrowers never create more drivers than the pool size.
+    """
+    pool, _, drivers = fake_pool
+    in_use, peak = [0], [0]
+    lock = threading.Lock()
+
+    def borrow():
+        with pool.driver():
+            with lock:
+                in_use[0] += 1
+                peak[0] = max(peak[0], in_use[0])
+            time.sleep(0.02)
+            with lock:
+                in_use[0] -= 1
+
+    threads = [threading.Thread(target=borrow) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(drivers) == pool.created == 2
+    assert peak[0] == 2
+
+
+def test_broken_driver_is_replaced(fake_pool):
+    """
+        Test that a driver raising WebDriverException is quit and not handed out again.
+    """
+    pool, _, drivers = fake_pool
+    with pytest.raises(WebDriverException):
+        with pool.driver():
+            raise WebDriverException("session deleted")
+
+    with pool.driver() as driver:
+        assert driver is drivers[1]
+    assert drivers[0].quit_called
+    assert pool.created == 2
+
+
+def test_job_queue_paginates_every_tag(fake_pool, tmp_path):
+    """
+        Test that all tags are scraped through the shared queue until their last page.
+    """
+    pool, log, drivers = fake_pool
+    tags = ["europe", "culture", "business", "tech", "green"]
+    output_path = tmp_path / "euronews_dynamic.json"
+
+    articles = selenium_scraper._scrape_euronews(
+        None,
+        pool=pool,
+        rate_limiter=RateLimiter(requests_per_second=1000, burst=10),
+        tags=tags,
+        output_path=str(output_path),
+        wait_timeout=0.05,
+        mode="browser",
+        decisions_path=None,
+    )
+
+    assert len(articles) == len(tags) * PAGES_PER_TAG * ARTICLES_PER_PAGE
+    assert json.loads(output_path.read_text()) == articles
+    # every tag: its pages, the first empty page that ends it and at most
+    # pool.size - 1 pages read ahead past it
+    assert len(tags) * (PAGES_PER_TAG + 1) <= len(log) <= len(tags) * (PAGES_PER_TAG + pool.size)
+    assert len(drivers) == 2
+    assert {a["published"] for a in articles} == {"2025-06-17"}
+
+
+def test_single_tag_uses_every_pooled_driver(fake_pool, tmp_path):
+    """
+        Test that pages of one tag are fetched concurrently and committed in page order.
+    """
+    pool, log, drivers = fake_pool
+
+    articles = selenium_scraper._scrape_euronews(
+        None,
+        pool=pool,
+        rate_limiter=RateLimiter(requests_per_second=1000, burst=10),
+        tags=["europe"],
+        output_path=str(tmp_path / "euronews_dynamic.json"),
+        wait_timeout=0.05,
+        mode="browser",
+        decisions_path=None,
+    )
+
+    assert len(drivers) == pool.size == 2
+    assert [a["link"] for a in articles] == [
+        f"https://www.euronews.com/europe/2025/06/17/story-{p}-{n}"
+        for p in range(1, PAGES_PER_TAG + 1)
+        for n in range(ARTICLES_PER_PAGE)
+    ]
+
+
+def test_js_extraction_matches_python_in_one_round_trip():
+    """
+        Test that the single execute_script path returns what the per-element path does.
+    """
+    driver = FakeDriver([])
+    driver.get("https://www.euronews.com/tag/europe?p=1")
+    cards = driver.find_elements(By.CSS_SELECTOR, "article")
+
+    FakeElement.calls = 0
+    from_python = selenium_scraper.extract_page_articles(driver, cards, extraction="python")
+    python_calls = FakeElement.calls
+
+    FakeElement.calls = 0
+    from_js = selenium_scraper.extract_page_articles(driver, cards, extraction="js")
+
+    assert from_js == from_python and len(from_js) == ARTICLES_PER_PAGE
+    assert (FakeElement.calls, driver.scripts) == (0, 1)
+    # anchors, href, aria-label, text, <time>, datetime for every card
+    assert python_calls == 6 * ARTICLES_PER_PAGE
+
+
+def _snapshot_html(tag, page):
+    """Server-rendered tag page; the 'culture' tag renders its cards with JavaScript."""
+    if tag == "culture" or page > PAGES_PER_TAG:
+        return "<html><body><div id='app'></div></body></html>"
+    cards = "".join(
+        f'<article><a href="#comments">0</a>'
+        f'<a href="/{tag}/2025/06/17/story-{page}-{n}">\n  {tag} story {page}-{n}\n</a>'
+        f'<time datetime="2025-06-17T10:00:00+02:00">17/06</time></article>'
+        for n in range(ARTICLES_PER_PAGE)
+    )
+    return f"<html><body>{cards}</body></html>"
+
+
+def test_hybrid_mode_escalates_only_js_pages(fake_pool, tmp_path, monkeypatch):
+    """
+        Test that server-rendered tags never open the browser and the decisions are recorded.
+    """
+    pool, log, drivers = fake_pool
+
+    def fake_request(url, **kwargs):
+        tag = url.split("/tag/")[1].split("?")[0]
+        return SimpleNamespace(text=_snapshot_html(tag, int(url.split("p=")[1])))
+
+    monkeypatch.setattr(selenium_scraper, "safe_request", fake_request)
+    monkeypatch.setattr(selenium_scraper, "get_http_cache", lambda: None)
+    decisions_path = tmp_path / "decisions.jsonl"
+
+    articles = selenium_scraper._scrape_euronews(
+        None,
+        pool=pool,
+        rate_limiter=RateLimiter(requests_per_second=1000, burst=10),
+        tags=["europe", "culture"],
+        output_path=str(tmp_path / "euronews_dynamic.json"),
+        wait_timeout=0.05,
+        mode="hybrid",
+        decisions_path=str(decisions_path),
+    )
+
+    assert len(articles) == 2 * PAGES_PER_TAG * ARTICLES_PER_PAGE
+    assert {a["link"] for a in articles if "/europe/" in a["link"]} == {
+        f"https://www.euronews.com/europe/2025/06/17/story-{p}-{n}"
+        for p in range(1, PAGES_PER_TAG + 1)
+        for n in range(ARTICLES_PER_PAGE)
+    }
+    assert all("/tag/culture?" in url for url in log)
+
+    decisions = [json.loads(line) for line in decisions_path.read_text().splitlines()]
+    by_tag = {}
+    for d in decisions:
+        by_tag.setdefault(d["tag"], []).append((d["renderer"], d["reason"]))
+    # Pages read ahead past the end of a tag are decided like the page that ended it
+    end = PAGES_PER_TAG + 1
+    assert by_tag["europe"][:end] == [("snapshot", "server_rendered")] * PAGES_PER_TAG + [
+        ("snapshot", "end_of_tag")
+    ]
+    assert set(by_tag["europe"][end:]) <= {("snapshot", "end_of_tag")}
+    assert by_tag["culture"][:end] == [("browser", "escalated:no_cards")] + [
+        ("browser", "tag_needs_browser")
+    ] * PAGES_PER_TAG
+    assert set(by_tag["culture"][end:]) <= {("browser", "tag_needs_browser")}
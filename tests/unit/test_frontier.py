@@ -0,0 +1,127 @@
+"""
+Unit tests for the crawl frontier in frontier.py and its use by the scrapers.
+
+Tests include:
+- Known-URL lookups across the articles table and the frontier table
+- Crawl deltas written to their own raw files, never rewriting history
+- The NPR sync engine stopping at the first fully known page
+- The Scrapy spider skipping known articles and stopping pagination
+All tests use a temporary database file.
+"""
+
+import json
+import pytest
+from scrapy.http import HtmlResponse, Request
+from src.data.database import insert_articles
+from datetime import datetime, timezone
+from src.data.frontier import CrawlFrontier, write_crawl_delta
+from src.data.models import NewsArticle
+from src.scrapers import static_scraper
+from src.scrapers.scrapy_crawler.scrapy_crawler import GenericNewsSpider
+
+
+@pytest.fixture
+def frontier(tmp_path, monkeypatch):
+    """
+        Fixture providing a CrawlFrontier over a fresh temporary database.
+    """
+    monkeypatch.setattr("src.data.database.DB_PATH", str(tmp_path / "news.db"))
+    frontier = CrawlFrontier()
+    yield frontier
+    frontier.close()
+
+
+def test_known_checks_articles_and_frontier_tables(frontier):
+    """
+        Test that URLs are known once stored as articles or recorded by a crawl.
+    """
+    insert_articles(
+        [NewsArticle("Stored", "https://npr.org/stored", "news", "2025-06-17", "npr.org")]
+    )
+    frontier.add(["https://npr.org/crawled"])
+
+    urls = ["https://npr.org/stored", "https://npr.org/crawled", "https://npr.org/new"]
+    assert frontier.known(urls) == set(urls[:2])
+    assert "https://npr.org/new" not in frontier
+    assert frontier.page_is_known(urls[:2])
+    assert not frontier.page_is_known(urls)
+    assert not frontier.page_is_known([])
+
+
+def test_crawl_delta_is_written_beside_untouched_history(tmp_path):
+    """
+        Test that each incremental crawl gets its own raw file and existing
+        (even unreadable) raw files are never rewritten.
+    """
+    path = tmp_path / "raw" / "npr_static.json"
+    path.parent.mkdir()
+    path.write_text("[{not json")
+    before = path.stat()
+    now = datetime(2025, 6, 17, 8, 0, tzinfo=timezone.utc)
+
+    first = write_crawl_delta(str(path), [{"link": "a"}], now=now)
+    second = write_crawl_delta(str(path), [{"link": "b"}], now=now)
+
+    assert first.endswith("npr_static-20250617T080000Z.json")
+    assert second.endswith("npr_static-20250617T080000Z-2.json")
+    with open(first, "r", encoding="utf-8") as f:
+        assert json.load(f) == [{"link": "a"}]
+    assert path.read_text() == "[{not json"
+    assert path.stat().st_mtime_ns == before.st_mtime_ns
+    assert write_crawl_delta(str(path), [], now=now) is None
+    assert sorted(p.name for p in path.parent.iterdir()) == [
+        "npr_static-20250617T080000Z-2.json", "npr_static-20250617T080000Z.json", "npr_static.json"
+    ]
+
+
+def _npr_page(start):
+    return "".join(
+        f'<article><h2 class="title"><a href="https://npr.org/{n}">Story {n}</a></h2>'
+        f'<time datetime="2025-06-17"></time></article>'
+        for n in range(start, start + 24)
+    )
+
+
+def test_sync_npr_engine_stops_at_first_known_page(frontier, monkeypatch):
+    """
+        Test that an incremental crawl only fetches the new head of the listing.
+    """
+    frontier.add(f"https://npr.org/{n}" for n in range(24, 24 * 5))
+    requested = []
+
+    class Page:
+        def __init__(self, text):
+            self.text = text
+
+    def fake_request(url, **kwargs):
+        requested.append(url)
+        return Page(_npr_page(0 if url == "base" else int(url.split("=")[1])))
+
+    monkeypatch.setattr(static_scraper, "safe_request", fake_request)
+
+    articles = static_scraper.scrape_npr("base", "next?start={start}", frontier=frontier)
+
+    assert [a["link"] for a in articles] == [f"https://npr.org/{n}" for n in range(24)]
+    assert requested == ["base", "next?start=24"]
+
+
+def test_spider_skips_known_articles_and_stops_pagination(frontier):
+    """
+        Test that the spider requests only unknown articles and stops on a fully known page.
+    """
+    url = "https://www.theverge.com/news/archives/1"
+
+    def archive(links):
+        anchors = "".join(f'<a class="yy0d3l8" aria-label="T" href="{l}">T</a>' for l in links)
+        return HtmlResponse(url, body=anchors.encode(), encoding="utf-8", request=Request(url))
+
+    frontier.add(["https://www.theverge.com/old"])
+    spider = GenericNewsSpider(frontier=frontier)
+
+    requests = list(spider.parse(archive(["/new", "/old"])))
+    assert [r.url for r in requests] == [
+        "https://www.theverge.com/new",
+        "https://www.theverge.com/news/archives/2",
+    ]
+
+    assert list(spider.parse(archive(["/old"]))) == []
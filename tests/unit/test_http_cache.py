@@ -0,0 +1,194 @@
+"""
+Unit tests for the on-disk HTTP cache in http_cache.py and its integrations.
+
+Tests include:
+- Compressed storage and validator round trips
+- Size-based LRU eviction
+- safe_request revalidating with If-None-Match and reusing the body on 304
+- The Scrapy downloader middleware turning a 304 into the cached page
+- Gzip-encoded pages cached decoded and replayed as plain HTML
+All tests use a temporary cache directory.
+"""
+
+import gzip
+import os
+import pytest
+from scrapy.downloadermiddlewares.httpcompression import HttpCompressionMiddleware
+from scrapy.http import HtmlResponse, Request, Response
+from scrapy.settings.default_settings import DOWNLOADER_MIDDLEWARES_BASE
+from scrapy.utils.test import get_crawler
+from src.scrapers.scrapy_crawler import settings as scrapy_settings
+from src.utils import helpers
+from src.utils.http_cache import HttpCache
+from src.scrapers.scrapy_crawler.middlewares import ConditionalCacheMiddleware
+
+PAGE = ("<html><body>" + "<article>Story</article>" * 500 + "</body></html>").encode()
+
+
+class NoLimit:
+    """Rate limiter stand-in that never waits."""
+
+    def acquire(self, url):
+        pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """
+        Fixture providing an HttpCache in a temporary directory.
+    """
+    cache = HttpCache(str(tmp_path / "http"))
+    yield cache
+    cache.close()
+
+
+def test_store_and_get_roundtrip_compressed(cache):
+    """
+        Test that bodies are stored gzip-compressed and returned with their validators.
+    """
+    assert cache.store("https://npr.org/a", PAGE, {"ETag": '"v1"', "Content-Type": "text/html"})
+
+    entry = cache.get("https://npr.org/a")
+    assert entry.body == PAGE
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert cache.total_bytes() < len(PAGE) / 10
+    assert cache.get("https://npr.org/missing") is None
+
+
+def test_responses_without_validators_are_not_cached(cache):
+    """
+        Test that a response that cannot be revalidated is not stored.
+    """
+    assert not cache.store("https://npr.org/a", PAGE, {"Content-Type": "text/html"})
+    assert cache.get("https://npr.org/a") is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    """
+        Test that exceeding max_bytes evicts the entry that was used longest ago.
+    """
+    bodies = {url: os.urandom(1000) for url in ("u1", "u2", "u3")}
+    cache = HttpCache(str(tmp_path / "http"), max_bytes=2500)
+    cache.store("u1", bodies["u1"], {"ETag": "1"})
+    cache.store("u2", bodies["u2"], {"ETag": "2"})
+    cache.get("u1")  # u2 is now the least recently used
+    cache.store("u3", bodies["u3"], {"ETag": "3"})
+
+    assert cache.get("u2") is None
+    assert cache.get("u1").body == bodies["u1"]
+    assert cache.get("u3").body == bodies["u3"]
+    assert cache.total_bytes() <= 2500
+    cache.close()
+
+
+def test_safe_request_reuses_cached_body_on_304(cache, monkeypatch):
+    """
+        Test that a second request sends If-None-Match and a 304 returns the cached page.
+    """
+    sent = []
+
+    class FakeResponse:
+        def __init__(self, status_code, content=b"", headers=None):
+            self.status_code = status_code
+            self.content = content
+            self.headers = headers or {}
+
+    def fake_get(url, headers=None, timeout=None):
+        sent.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, PAGE, {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"})
+
+    monkeypatch.setattr(helpers.requests, "get", fake_get)
+
+    first = helpers.safe_request("https://npr.org/a", rate_limiter=NoLimit(), cache=cache)
+    second = helpers.safe_request("https://npr.org/a", rate_limiter=NoLimit(), cache=cache)
+
+    assert first.content == PAGE
+    assert second.status_code == 200
+    assert second.text == PAGE.decode()
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+
+
+def test_scrapy_middleware_serves_cached_body_on_304(cache):
+    """
+        Test that the middleware adds validators and replaces a 304 with the cached HTML.
+    """
+    middleware = ConditionalCacheMiddleware(cache)
+    url = "https://www.theverge.com/news/archives/1"
+
+    request = Request(url)
+    middleware.process_request(request, spider=None)
+    assert b"If-None-Match" not in request.headers
+    fresh = HtmlResponse(
+        url, body=PAGE, headers={"ETag": '"v1"', "Content-Type": "text/html"}, request=request
+    )
+    assert middleware.process_response(request, fresh, spider=None) is fresh
+
+    request = Request(url)
+    middleware.process_request(request, spider=None)
+    assert request.headers[b"If-None-Match"] == b'"v1"'
+    result = middleware.process_response(request, Response(url, status=304), spider=None)
+
+    assert isinstance(result, HtmlResponse)
+    assert result.status == 200
+    assert result.body == PAGE
+    assert "cached" in result.flags
+    assert len(result.css("article")) == 500
+
+
+def test_scrapy_middleware_replays_decoded_gzip_body_on_304(cache):
+    """
+        Test that a gzip-encoded page is cached decoded (the middleware runs after
+        HttpCompressionMiddleware) and a 304 replays plain HTML.
+    """
+    priority = scrapy_settings.DOWNLOADER_MIDDLEWARES[
+        "src.scrapers.scrapy_crawler.middlewares.ConditionalCacheMiddleware"
+    ]
+    assert priority < DOWNLOADER_MIDDLEWARES_BASE[
+        "scrapy.downloadermiddlewares.httpcompression.HttpCompressionMiddleware"
+    ]
+
+    # Responses pass through higher priorities first: decompression, then the cache
+    compression = HttpCompressionMiddleware.from_crawler(get_crawler())
+    middleware = ConditionalCacheMiddleware(cache)
+    url = "https://www.theverge.com/news/archives/2"
+
+    request = Request(url)
+    middleware.process_request(request, spider=None)
+    encoded = Response(
+        url,
+        body=gzip.compress(PAGE),
+        headers={"ETag": '"v1"', "Content-Type": "text/html", "Content-Encoding": "gzip"},
+        request=request,
+    )
+    middleware.process_response(request, compression.process_response(request, encoded), spider=None)
+
+    request = Request(url)
+    middleware.process_request(request, spider=None)
+    not_modified = compression.process_response(request, Response(url, status=304, request=request))
+    result = middleware.process_response(request, not_modified, spider=None)
+
+    assert result.status == 200
+    assert result.body == PAGE
+    assert len(result.css("article")) == 500
+
+
+def test_scrapy_middleware_skips_still_encoded_bodies(cache):
+    """
+        Test that a response that was not decoded is not cached, so it is never
+        replayed without its Content-Encoding header.
+    """
+    middleware = ConditionalCacheMiddleware(cache)
+    url = "https://www.theverge.com/news/archives/3"
+    request = Request(url)
+    encoded = Response(
+        url,
+        body=gzip.compress(PAGE),
+        headers={"ETag": '"v1"', "Content-Type": "text/html", "Content-Encoding": "gzip"},
+        request=request,
+    )
+
+    assert middleware.process_response(request, encoded, spider=None) is encoded
+    assert cache.get(url) is None
@@ -0,0 +1,126 @@
+"""
+Unit tests for the streaming JSON Lines Scrapy pipeline in pipelines.py.
+
+Tests include:
+- Round trips through plain, gzip and zstd output via the processing readers
+- Flushed items surviving a crawl that never reaches close_spider
+- Recovery from a line truncated by a killed crawl
+- Frontier marks and SQLite write-through
+All tests write to temporary files.
+"""
+
+import logging
+import sqlite3
+import pytest
+from src.data.processors import list_raw_files, read_raw_articles
+from src.scrapers.scrapy_crawler.pipelines import JsonLinesExportPipeline
+from src.utils.fileio import zstd
+
+needs_zstd = pytest.mark.skipif(zstd is None, reason="zstd support not installed")
+
+
+class FakeSpider:
+    """Minimal spider with a logger and an optional frontier."""
+
+    def __init__(self, frontier=None):
+        self.logger = logging.getLogger("test-spider")
+        self.frontier = frontier
+
+
+def _items(count, start=0):
+    return [
+        {
+            "title": f"Story {n}",
+            "link": f"https://www.theverge.com/news/{n}",
+            "category": "news",
+            "published": "2025-06-17",
+        }
+        for n in range(start, start + count)
+    ]
+
+
+def _run(pipeline, items, spider=None, close=True):
+    spider = spider or FakeSpider()
+    pipeline.open_spider(spider)
+    for item in items:
+        pipeline.process_item(item, spider)
+    if close:
+        pipeline.close_spider(spider)
+    return pipeline
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", pytest.param("zstd", marks=needs_zstd)])
+def test_pipeline_roundtrip_and_append(tmp_path, compression):
+    """
+        Test that items from two crawls are read back in order from the raw directory.
+    """
+    base = str(tmp_path / "theverge_articles.jsonl")
+    _run(JsonLinesExportPipeline(base, compression, config={}), _items(3))
+    pipeline = _run(JsonLinesExportPipeline(base, compression, config={}), _items(2, start=3))
+
+    assert list_raw_files(str(tmp_path)) == [pipeline.path]
+    assert list(read_raw_articles(pipeline.path)) == _items(5)
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_flushed_items_survive_without_close(tmp_path, compression):
+    """
+        Test that everything up to the last flush is readable while the crawl is still open.
+    """
+    pipeline = JsonLinesExportPipeline(
+        str(tmp_path / "out.jsonl"), compression, flush_items=10, fsync_interval=0, config={}
+    )
+    _run(pipeline, _items(25), close=False)
+
+    records = [r for r in read_raw_articles(pipeline.path) if r is not None]
+    assert records[:20] == _items(20)
+
+
+def test_truncated_line_from_killed_crawl_is_isolated(tmp_path):
+    """
+        Test that a half-written line does not swallow the next crawl's first record.
+    """
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"title": "Story 0", "link": "x"}\n{"title": "Sto')
+
+    _run(JsonLinesExportPipeline(str(path), config={}), _items(1))
+
+    records = list(read_raw_articles(str(path)))
+    assert records == [{"title": "Story 0", "link": "x"}, None] + _items(1)
+
+
+def test_links_reach_frontier_only_after_flush(tmp_path):
+    """
+        Test that the frontier learns links when their lines are flushed, not before.
+    """
+    added = []
+
+    class RecordingFrontier:
+        def add(self, urls):
+            added.extend(urls)
+
+    pipeline = JsonLinesExportPipeline(str(tmp_path / "out.jsonl"), flush_items=2, config={})
+    spider = FakeSpider(RecordingFrontier())
+    _run(pipeline, _items(3), spider=spider, close=False)
+    assert added == [item["link"] for item in _items(2)]
+
+    pipeline.close_spider(spider)
+    assert added == [item["link"] for item in _items(3)]
+
+
+def test_write_through_inserts_into_sqlite(tmp_path, monkeypatch):
+    """
+        Test that items are batch-inserted when database.write_through is enabled.
+    """
+    db_path = tmp_path / "news.db"
+    monkeypatch.setattr("src.data.database.DB_PATH", str(db_path))
+
+    _run(
+        JsonLinesExportPipeline(
+            str(tmp_path / "out.jsonl"), config={"database": {"write_through": True}}
+        ),
+        _items(5),
+    )
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 5
@@ -0,0 +1,101 @@
+"""
+Unit tests for the title keyword engine in keywords.py.
+
+Tests include:
+- Tokenization and stopword removal matching the original title counter
+- Bigrams that never span two titles
+- Per-key counts and heap-based top-N
+- Process-pool counting giving the same result as in-process counting
+- Stopwords configured through settings
+"""
+
+from collections import Counter
+import re
+from src.analysis.keywords import (
+    DEFAULT_STOPWORDS,
+    KeywordEngine,
+    load_stopwords,
+    top_terms,
+)
+
+TITLES = [
+    "Climate summit opens in Bonn",
+    "EU budget vote: climate funds cut",
+    None,
+    "Budget vote delayed as climate talks stall",
+    "What the climate summit means for you",
+]
+
+
+def legacy_counts(titles):
+    """The per-title loop trends.py used before the engine existed."""
+    counts = Counter()
+    for title in titles:
+        words = re.findall(r"\b[a-z]{3,}\b", (title or "").lower())
+        counts.update(word for word in words if word not in DEFAULT_STOPWORDS)
+    return counts
+
+
+def test_keyword_counts_match_the_per_title_loop():
+    """
+        Test that chunked counting gives exactly the legacy counts.
+    """
+    engine = KeywordEngine(chunk_size=2)
+
+    assert engine.count(TITLES) == legacy_counts(TITLES)
+    assert engine.count(TITLES)["climate"] == 4
+
+
+def test_bigrams_do_not_cross_titles():
+    """
+        Test that the last word of one title never pairs with the next title's first word.
+    """
+    bigrams = KeywordEngine().count(TITLES, n=2)
+
+    assert bigrams["budget vote"] == 2
+    assert bigrams["climate summit"] == 2
+    assert bigrams["bonn budget"] == 0
+    assert KeywordEngine().count(TITLES, n=3)["budget vote delayed"] == 1
+
+
+def test_count_by_key_and_top_terms():
+    """
+        Test per-key counts (e.g. per day) and the heap-based top-N.
+    """
+    days = ["2025-06-01", "2025-06-01", "2025-06-01", "2025-06-02", "2025-06-02"]
+
+    by_day = KeywordEngine(chunk_size=3).count_by(TITLES, days)
+
+    assert by_day["2025-06-01"]["climate"] == 2
+    assert by_day["2025-06-02"]["stall"] == 1
+    assert top_terms(by_day["2025-06-02"], 1) == [("climate", 2)]
+    assert top_terms(Counter({"a": 1, "b": 3, "c": 2}), 2) == [("b", 3), ("c", 2)]
+
+
+def test_parallel_counting_matches_in_process():
+    """
+        Test that a two-process pool merges chunk counts into the same totals.
+    """
+    titles = TITLES * 50
+
+    parallel = KeywordEngine(workers=2, chunk_size=40)
+
+    assert parallel.count(titles) == KeywordEngine().count(titles)
+    assert parallel.count_by(titles, ["x", "y"] * 125, n=2) == KeywordEngine().count_by(
+        titles, ["x", "y"] * 125, n=2
+    )
+
+
+def test_stopwords_from_settings(tmp_path):
+    """
+        Test extra stopwords and a stopword file replacing the defaults.
+    """
+    stopwords_file = tmp_path / "stopwords.txt"
+    stopwords_file.write_text("Climate\n\nsummit\n", encoding="utf-8")
+
+    assert "says" in load_stopwords({"extra_stopwords": ["Says"]})
+    assert load_stopwords({"stopwords_file": str(stopwords_file)}) == {"climate", "summit"}
+
+    counts = KeywordEngine(load_stopwords({"stopwords_file": str(stopwords_file)})).count(TITLES)
+    assert counts["climate"] == 0
+    assert counts["the"] == 1
@@ -0,0 +1,126 @@
+"""
+Unit tests for the partitioned Parquet article store in parquet_store.py.
+
+Tests include:
+- Round-tripping cleaned articles through the month/source partitions
+- Column and partition pruning on load
+- Dictionary-encoded category/source columns
+- Appending runs and the processing pipeline writing the store
+All tests write to temporary directories.
+"""
+
+import json
+import os
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from src.analysis.dataset import ArticleDataset
+from src.data.parquet_store import (
+    ParquetArticleWriter,
+    has_parquet_store,
+    load_articles_frame,
+    load_articles_table,
+)
+from src.data.processors import process_raw_articles
+
+ARTICLES = [
+    {"title": "Budget vote", "link": "https://www.npr.org/1", "category": "politics", "published": "2025-05-30"},
+    {"title": "Heat wave", "link": "https://www.npr.org/2", "category": "climate", "published": "2025-06-02"},
+    {"title": "Film festival", "link": "https://www.euronews.com/3", "category": "culture", "published": "2025-06-17"},
+    {"title": "Chip exports", "link": "https://www.theverge.com/4", "category": "tech", "published": "2025-06-18"},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """
+        Fixture writing ARTICLES to a Parquet store under tmp_path.
+
+        Returns:
+            str: The store directory.
+    """
+    directory = str(tmp_path / "articles")
+    with ParquetArticleWriter(directory, batch_size=3) as writer:
+        for article in ARTICLES:
+            writer.write(article)
+    return directory
+
+
+def test_round_trip_is_partitioned_by_month_and_source(store):
+    """
+        Test that every article comes back and lands in its month/source directory.
+    """
+    assert has_parquet_store(store)
+    assert sorted(os.listdir(store)) == ["month=2025-05", "month=2025-06"]
+    assert sorted(os.listdir(os.path.join(store, "month=2025-06"))) == [
+        "source=euronews.com", "source=npr.org", "source=theverge.com"
+    ]
+
+    rows = load_articles_table(["title", "link", "category", "published"], directory=store).to_pylist()
+
+    assert sorted(rows, key=lambda r: r["link"]) == sorted(ARTICLES, key=lambda r: r["link"])
+
+
+def test_loaders_prune_columns_and_partitions(store):
+    """
+        Test that only the requested columns and partitions are returned.
+    """
+    table = load_articles_table(["title"], months=["2025-06"], sources=["npr.org"], directory=store)
+
+    assert table.column_names == ["title"]
+    assert table.to_pylist() == [{"title": "Heat wave"}]
+    assert load_articles_table(["link"], months=["2024-01"], directory=store).num_rows == 0
+
+
+def test_category_and_source_are_dictionary_encoded(store):
+    """
+        Test that the low-cardinality columns load as dictionaries and categoricals.
+    """
+    table = load_articles_table(["category", "source"], directory=store)
+    frame = load_articles_frame(["category", "source"], directory=store)
+
+    assert pa.types.is_dictionary(table.schema.field("category").type)
+    assert pa.types.is_dictionary(table.schema.field("source").type)
+    assert str(frame["category"].dtype) == "category"
+    assert sorted(frame["source"].unique()) == ["euronews.com", "npr.org", "theverge.com"]
+
+
+def test_append_keeps_existing_rows_and_replace_does_not(store):
+    """
+        Test that append=True adds files while the default replaces the store.
+    """
+    extra = {"title": "Late story", "link": "https://www.npr.org/5", "category": "news", "published": ""}
+
+    with ParquetArticleWriter(store, append=True) as writer:
+        writer.write(extra)
+    assert load_articles_table(["link"], directory=store).num_rows == 5
+    assert load_articles_table(["title"], months=["unknown"], directory=store).to_pylist() == [
+        {"title": "Late story"}
+    ]
+
+    with ParquetArticleWriter(store) as writer:
+        writer.write(extra)
+    assert load_articles_table(["link"], directory=store).num_rows == 1
+
+
+def test_processing_writes_the_store_used_by_the_dataset(tmp_path, monkeypatch):
+    """
+        Test that processing fills the store next to PROCESSED_PATH and that
+        the analysis dataset reads it instead of the JSON file.
+    """
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    (raw_dir / "npr.json").write_text(json.dumps(ARTICLES), encoding="utf-8")
+    processed_path = tmp_path / "processed" / "cleaned_articles.json"
+    processed_path.parent.mkdir()
+    monkeypatch.setattr("src.data.processors.RAW_DIR", str(raw_dir))
+    monkeypatch.setattr("src.data.processors.PROCESSED_PATH", str(processed_path))
+
+    process_raw_articles()
+    processed_path.write_text("not json", encoding="utf-8")
+
+    assert has_parquet_store(str(tmp_path / "processed" / "articles"))
+    articles = ArticleDataset(str(processed_path)).records(["title", "category", "published"])
+    assert sorted(a["title"] for a in articles) == sorted(a["title"] for a in ARTICLES)
+    assert set(articles[0]) == {"title", "category", "published"}
@@ -0,0 +1,79 @@
+"""
+Unit tests for the pluggable HTML parser backends in parsers.py.
+
+Uses the saved NPR listing page in tests/fixtures (23 stories, one promo
+card without a headline, one story without a <time>).
+
+Tests include:
+- Every installed backend extracting the same articles as BeautifulSoup
+- Fragments such as NPR's 'Load More' partials and empty pages
+- Unknown backend names being rejected
+"""
+
+import os
+import pytest
+from src.scrapers.parsers import PARSERS, create_parser
+from src.scrapers.static_scraper import parse_page
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "npr_news_page.html")
+
+
+def _available(name):
+    try:
+        create_parser(name)
+        return True
+    except RuntimeError:
+        return False
+
+
+BACKENDS = [
+    pytest.param(name, marks=pytest.mark.skipif(not _available(name), reason=f"{name} not installed"))
+    for name in PARSERS
+]
+
+
+@pytest.fixture(scope="module")
+def npr_html():
+    """
+        Fixture returning the saved NPR listing page.
+    """
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_match_beautifulsoup(npr_html, name):
+    """
+        Test that each backend yields exactly the articles html.parser does.
+    """
+    expected = parse_page(npr_html, create_parser("html.parser"))
+
+    articles = parse_page(npr_html, create_parser(name))
+
+    assert articles == expected
+    assert len(articles) == 23
+    assert articles[0]["published"] == "2025-06-17"
+    assert sum(a["published"] == "N/A" for a in articles) == 1
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_parse_fragments_and_empty_pages(name):
+    """
+        Test that a lone <article> partial parses and an empty response yields nothing.
+    """
+    parser = create_parser(name)
+    fragment = '<article><h2 class="title"><a href="https://npr.org/1"> One </a></h2></article>'
+
+    assert parse_page(fragment, parser) == [
+        {"title": "One", "link": "https://npr.org/1", "category": "news", "published": "N/A"}
+    ]
+    assert parse_page("", parser) == []
+    assert parse_page("<html><body></body></html>", parser) == []
+
+
+def test_unknown_backend_is_rejected():
+    """
+        Test that a misspelled parser name fails loudly.
+    """
+    with pytest.raises(ValueError):
+        create_parser("html5lib-typo")
@@ -0,0 +1,101 @@
+"""
+Unit tests for the thread-safe database access layer in pool.py.
+
+Tests include:
+- One pooled connection per thread
+- Batched writes from many producer threads through the single writer
+- Writer thread failures surfacing from flush() and close() instead of hanging
+All tests use a temporary database file.
+"""
+
+import sqlite3
+import threading
+import pytest
+from src.data import database
+from src.data.pool import ArticleWriter, ConnectionPool
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """
+        Fixture that points the database module at a fresh temporary file.
+    """
+    db_path = tmp_path / "news.db"
+    monkeypatch.setattr("src.data.database.DB_PATH", str(db_path))
+    return db_path
+
+
+def test_pool_reuses_one_connection_per_thread(temp_db):
+    """
+        Test that a thread always gets the same connection and threads never share one.
+    """
+    pool = ConnectionPool()
+    connections = {}
+
+    def grab(name):
+        connections[name] = (pool.connection(), pool.connection())
+
+    threads = [threading.Thread(target=grab, args=(i,)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(first is second for first, second in connections.values())
+    assert len({id(first) for first, _ in connections.values()}) == 3
+    pool.close_all()
+
+
+def test_writer_batches_articles_from_many_threads(temp_db):
+    """
+        Test that concurrent producers are persisted once each, with invalid
+        records rejected and duplicate links ignored.
+    """
+    def produce(writer, offset):
+        for i in range(250):
+            writer.submit({
+                "title": f"Article {offset + i}",
+                "link": f"https://example.com/{(offset + i) % 900}",
+                "published": "2025-06-17T08:00:00+00:00",
+                "category": "test",
+            })
+        writer.submit({"title": "", "link": "https://example.com/bad", "published": "2025-06-17"})
+
+    with ArticleWriter(batch_size=64, flush_interval=0.05) as writer:
+        producers = [
+            threading.Thread(target=produce, args=(writer, n * 250)) for n in range(4)
+        ]
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        writer.flush()
+
+    assert writer.rejected == 4
+    assert writer.result.inserted == 900
+    assert writer.result.ignored == 100
+
+    with database.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 900
+        assert conn.execute("SELECT DISTINCT published FROM articles").fetchall() == [("2025-06-17",)]
+
+
+def test_writer_failure_is_raised_instead_of_hanging(temp_db, monkeypatch):
+    """
+        Test that a writer whose setup fails counts submissions as failed and
+        re-raises the error from flush() and on context exit.
+    """
+    def broken_create_table(conn):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr("src.data.pool.create_table", broken_create_table)
+
+    writer = ArticleWriter(max_queue=2, flush_interval=0.01)
+    with pytest.raises(sqlite3.OperationalError):
+        with writer:
+            for i in range(5):
+                writer.submit({"title": f"A{i}", "link": f"https://example.com/{i}", "published": "2025-06-17"})
+            with pytest.raises(sqlite3.OperationalError):
+                writer.flush()
+
+    assert writer.result.failed == 5
@@ -5,15 +5,25 @@ Tests include:
 - Processing of raw article files and deduplication
 - Date normalization function for various formats
 - Article validity checking based on required fields
+- Streaming ingestion of JSON arrays and JSON Lines files
+- Parallel processing parity with the sequential pipeline
+- Incremental runs driven by the processed-file manifest
+- Articles stored through write-through still reaching the processed outputs
 All tests use temporary paths to avoid altering real data.
 """
 
 import sys
+import io
 import os
 import json
 import pytest
 from src.data.processors import process_raw_articles, RAW_DIR, PROCESSED_PATH
 from src.data.processors import normalize_date, is_valid_article
+from src.data.processors import iter_json_array, stream_raw_articles
+from src.data.processors import read_json_lines_shard, read_raw_articles
+from src.data.processors import read_json_array_shard, scan_json_array_shards
+from src.data.processors import process_and_save_all_articles
+from src.data.pool import ArticleWriter
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
@@ -117,3 +127,198 @@ def test_is_valid_article():
     assert is_valid_article(valid)
     for article in invalids:
         assert not is_valid_article(article)
+
+
+def test_iter_json_array_across_chunk_boundaries():
+    """
+        Test that incremental decoding matches json.load even when elements,
+        numbers and strings are split across tiny read chunks.
+    """
+    data = [{"title": "A, [tricky] \"title\"", "n": 12345}, 678, [], {"x": None}]
+    text = " \n" + json.dumps(data, indent=2)
+
+    for chunk_size in (1, 3, 7, 64):
+        assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == data
+
+    assert list(iter_json_array(io.StringIO("[ ]"))) == []
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO('[{"a": 1} {"b": 2}]')))
+
+
+def test_stream_raw_articles_matches_batch_output(setup_test_file):
+    """
+        Test that streaming mode writes the same file as the in-memory path,
+        reads JSON Lines files, and tolerates a truncated trailing line.
+    """
+    processed_path = setup_test_file
+    jsonl_file = processed_path.parent.parent / "raw" / "extra.jsonl"
+    jsonl_file.write_text(
+        json.dumps({
+            "title": "Line Article",
+            "link": "http://test.com/article-2",
+            "published": "2025/06/18",
+            "category": "test",
+        })
+        + "\n"
+        + '{"title": "Truncated", "li',
+        encoding="utf-8",
+    )
+
+    expected = process_raw_articles()
+    expected_text = processed_path.read_text(encoding="utf-8")
+
+    batches = []
+    stats = stream_raw_articles(on_batch=batches.append, batch_size=1)
+
+    assert processed_path.read_text(encoding="utf-8") == expected_text
+    assert [a["title"] for a in expected] == ["Test Article", "Line Article"]
+    assert stats.cleaned == 2
+    assert stats.skipped_articles == 2
+    assert [len(b) for b in batches] == [1, 1]
+
+
+def test_json_lines_shards_cover_every_line_once(tmp_path):
+    """
+        Test that byte-range shards of a JSON Lines file yield each record exactly once.
+    """
+    path = tmp_path / "big.jsonl"
+    records = [{"i": i, "pad": "x" * (i % 7)} for i in range(50)]
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    size = path.stat().st_size
+
+    for shard in (1, 13, 64, size):
+        seen = []
+        for start in range(0, size, shard):
+            seen.extend(read_json_lines_shard(str(path), start, min(start + shard, size)))
+        assert seen == records
+
+
+def test_json_array_shards_cover_every_element_once(tmp_path):
+    """
+        Test that element-aligned shards of a JSON array yield each element
+        exactly once, with multi-byte text and nested values across boundaries.
+    """
+    path = tmp_path / "big.json"
+    records = [{"i": i, "title": "Ünïcødé, [x] {y} €" * (i % 3), "tags": [{"n": i}]} for i in range(40)]
+
+    for indent in (None, 2):
+        path.write_text(json.dumps(records, indent=indent, ensure_ascii=False), encoding="utf-8")
+        for shard in (1, 50, 333, path.stat().st_size):
+            ranges = scan_json_array_shards(str(path), shard)
+            seen = []
+            for start, end in ranges:
+                seen.extend(read_json_array_shard(str(path), start, end))
+            assert seen == records
+        assert len(scan_json_array_shards(str(path), 1)) == len(records)
+
+
+def test_parallel_processing_matches_sequential(setup_test_file, monkeypatch):
+    """
+        Test that --workers mode produces the same output and counters as the
+        sequential path, including cross-file duplicates and sharded JSON
+        Lines and JSON array files.
+    """
+    processed_path = setup_test_file
+    raw_dir = processed_path.parent.parent / "raw"
+    (raw_dir / "bad.json").write_text("[{", encoding="utf-8")
+    lines = [
+        {"title": f"T{i}", "link": f"http://test.com/article-{i % 5}",
+         "published": "2025-06-1%d" % (i % 10), "category": "test"}
+        for i in range(40)
+    ]
+    (raw_dir / "many.jsonl").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8"
+    )
+    (raw_dir / "many.json").write_text(json.dumps(lines[::-1], indent=2), encoding="utf-8")
+    monkeypatch.setattr("src.data.processors.SHARD_BYTES", 200)
+
+    sequential = stream_raw_articles()
+    expected_text = processed_path.read_text(encoding="utf-8")
+
+    parallel = stream_raw_articles(workers=2)
+
+    assert processed_path.read_text(encoding="utf-8") == expected_text
+    assert parallel == sequential
+    assert sequential.skipped_files == 1
+
+
+def test_incremental_run_only_reads_new_files(setup_test_file, tmp_path, monkeypatch):
+    """
+        Test that an incremental run skips unchanged raw files, appends new
+        articles to the cleaned output and deduplicates against the database.
+    """
+    processed_path = setup_test_file
+    raw_dir = processed_path.parent.parent / "raw"
+    monkeypatch.setattr("src.data.database.DB_PATH", str(tmp_path / "news.db"))
+    monkeypatch.setattr("src.data.manifest.MANIFEST_PATH", str(tmp_path / "manifest.json"))
+
+    assert process_and_save_all_articles(incremental=True) == 1
+
+    read_paths = []
+
+    def tracking_reader(path, stream=True):
+        read_paths.append(os.path.basename(path))
+        return read_raw_articles(path, stream=stream)
+
+    monkeypatch.setattr("src.data.processors.read_raw_articles", tracking_reader)
+    (raw_dir / "hourly.json").write_text(json.dumps([
+        {"title": "Already Stored", "link": "http://test.com/article-1",
+         "published": "2025-06-17", "category": "test"},
+        {"title": "Fresh Article", "link": "http://test.com/article-3",
+         "published": "2025-06-19", "category": "test"},
+    ]), encoding="utf-8")
+
+    assert process_and_save_all_articles(incremental=True) == 1
+    assert read_paths == ["hourly.json"]
+
+    with open(processed_path, "r", encoding="utf-8") as f:
+        result = json.load(f)
+    assert [a["title"] for a in result] == ["Test Article", "Fresh Article"]
+
+    assert process_and_save_all_articles(incremental=True) == 0
+    assert read_paths == ["hourly.json"]
+
+
+def test_incremental_run_rebuilds_missing_output(setup_test_file, tmp_path, monkeypatch):
+    """
+        Test that an incremental run after the cleaned output was deleted rebuilds
+        it from every raw file instead of skipping articles already in the database.
+    """
+    processed_path = setup_test_file
+    monkeypatch.setattr("src.data.database.DB_PATH", str(tmp_path / "news.db"))
+    monkeypatch.setattr("src.data.manifest.MANIFEST_PATH", str(tmp_path / "manifest.json"))
+
+    assert process_and_save_all_articles(incremental=True) == 1
+    processed_path.unlink()
+
+    assert process_and_save_all_articles(incremental=True) == 1
+
+    with open(processed_path, "r", encoding="utf-8") as f:
+        result = json.load(f)
+    assert [a["title"] for a in result] == ["Test Article"]
+
+
+def test_incremental_run_keeps_write_through_articles(setup_test_file, tmp_path, monkeypatch):
+    """
+        Test that an article already stored by a write-through scraper is still
+        added to the cleaned output by the next incremental run.
+    """
+    processed_path = setup_test_file
+    raw_dir = processed_path.parent.parent / "raw"
+    monkeypatch.setattr("src.data.database.DB_PATH", str(tmp_path / "news.db"))
+    monkeypatch.setattr("src.data.manifest.MANIFEST_PATH", str(tmp_path / "manifest.json"))
+
+    assert process_and_save_all_articles(incremental=True) == 1
+
+    scraped = {"title": "Written Through", "link": "http://test.com/article-2",
+               "published": "2025-06-18", "category": "test"}
+    with ArticleWriter() as writer:
+        writer.submit(scraped)
+    assert writer.result.inserted == 1
+    (raw_dir / "npr_static.json").write_text(json.dumps([scraped]), encoding="utf-8")
+
+    assert process_and_save_all_articles(incremental=True) == 1
+
+    with open(processed_path, "r", encoding="utf-8") as f:
+        result = json.load(f)
+    assert [a["link"] for a in result] == ["http://test.com/article-1", "http://test.com/article-2"]
@@ -0,0 +1,132 @@
+"""
+Unit tests for the schema migrations and SQL query API.
+
+Tests include:
+- Migrating a legacy 'articles' table to the indexed schema
+- Per-day and per-category counts with date filters
+- Paginated date-range queries
+- Full-text title search kept in sync by triggers
+All tests use a temporary database file.
+"""
+
+import sqlite3
+import pytest
+from src.data import database, queries
+from src.data.models import NewsArticle
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """
+        Fixture that points the database module at a fresh temporary file.
+    """
+    db_path = tmp_path / "news.db"
+    monkeypatch.setattr("src.data.database.DB_PATH", str(db_path))
+    return db_path
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    """
+        Fixture with six articles across two categories, two sources and three days.
+    """
+    database.create_table()
+    rows = [
+        ("tech", "2025-06-01", "https://www.theverge.com/a"),
+        ("tech", "2025-06-01", "https://www.theverge.com/b"),
+        ("tech", "2025-06-02", "https://npr.org/c"),
+        ("europe", "2025-06-02", "https://www.euronews.com/d"),
+        ("europe", "2025-06-02", "https://www.euronews.com/e"),
+        ("europe", "2025-06-05", "https://www.euronews.com/f"),
+    ]
+    titles = [
+        "Climate policy stalls in Brussels",
+        "New chips for climate models",
+        "Policy makers debate AI rules",
+        "Climate summit opens",
+        "Café culture returns to Paris",
+        "Markets rally on policy shift",
+    ]
+    database.insert_articles(
+        NewsArticle(titles[i], link, category, published, link.split("/")[2].replace("www.", ""))
+        for i, (category, published, link) in enumerate(rows)
+    )
+    return temp_db
+
+
+def test_migration_upgrades_legacy_table(temp_db):
+    """
+        Test that a pre-migration table gains typed dates, domain sources and indexes.
+    """
+    conn = sqlite3.connect(temp_db)
+    conn.execute(
+        "CREATE TABLE articles (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, "
+        "link TEXT UNIQUE, category TEXT, published TEXT, source TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO articles (title, link, category, published, source) VALUES "
+        "('A', 'https://www.npr.org/x', 'news', '2025-06-17', 'merged'), "
+        "('B', 'https://npr.org/y', 'news', 'N/A', 'merged')"
+    )
+    conn.commit()
+    conn.close()
+
+    database.create_table()
+
+    with database.get_connection() as conn:
+        rows = conn.execute("SELECT published_date, source FROM articles ORDER BY id").fetchall()
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(articles)")}
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+    assert rows == [("2025-06-17", "npr.org"), (None, "npr.org")]
+    assert {"idx_articles_published", "idx_articles_category_published",
+            "idx_articles_source_published"} <= indexes
+    assert version == len(database.MIGRATIONS)
+
+
+def test_counts(populated_db):
+    """
+        Test per-day, per-category and total counts with filters.
+    """
+    assert queries.count_by_day() == [("2025-06-01", 2), ("2025-06-02", 3), ("2025-06-05", 1)]
+    assert queries.count_by_day(category="europe", end="2025-06-04") == [("2025-06-02", 2)]
+    assert queries.count_by_category() == [("europe", 3), ("tech", 3)]
+    assert queries.count_by_category(source="euronews.com") == [("europe", 3)]
+    assert queries.top_days(1) == [("2025-06-02", 3)]
+    assert queries.total_articles(start="2025-06-02") == 4
+
+
+def test_articles_in_range_paginates(populated_db):
+    """
+        Test that pages are disjoint, newest first, and cover the range.
+    """
+    first = queries.articles_in_range(start="2025-06-01", end="2025-06-02", limit=3)
+    second = queries.articles_in_range(start="2025-06-01", end="2025-06-02", limit=3, offset=3)
+
+    assert [a["published"] for a in first] == ["2025-06-02"] * 3
+    assert [a["published"] for a in second] == ["2025-06-01"] * 2
+    assert {a["link"] for a in first}.isdisjoint(a["link"] for a in second)
+
+
+def test_search_articles_ranks_and_filters(populated_db):
+    """
+        Test ranked matching, prefix queries, accent folding and filters.
+    """
+    titles = [a["title"] for a in queries.search_articles("climate policy")]
+    assert titles == ["Climate policy stalls in Brussels"]
+
+    assert len(queries.search_articles("clim*")) == 3
+    assert len(queries.search_articles("pol", prefix=True)) == 3
+    assert [a["title"] for a in queries.search_articles("cafe")] == ["Café culture returns to Paris"]
+    filtered = queries.search_articles("climate", category="europe", end="2025-06-02")
+    assert [a["link"] for a in filtered] == ["https://www.euronews.com/d"]
+    assert queries.search_articles('" OR *') == []
+
+
+def test_search_index_follows_deletes(populated_db):
+    """
+        Test that the FTS triggers drop deleted articles from search results.
+    """
+    with database.get_connection() as conn:
+        conn.execute("DELETE FROM articles WHERE title = 'Climate summit opens'")
+    assert len(queries.search_articles("climate")) == 2
@@ -0,0 +1,100 @@
+"""
+Unit tests for the per-host token-bucket rate limiter in rate_limiter.py.
+
+Tests include:
+- Burst allowance and queued reservations on a fake clock
+- Independent buckets per host with configured overrides
+- Scrapy settings export
+- safe_request taking a token before every network attempt
+"""
+
+from src.utils import helpers
+from src.utils.rate_limiter import RateLimiter, TokenBucket, scrapy_rate_settings
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    """
+        Test that a full bucket serves `burst` requests at once and queues the rest.
+    """
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    clock.now = 10.0  # Long idle period refills only up to `burst`
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_unlimited_bucket_never_waits():
+    """
+        Test that a rate of 0 disables limiting.
+    """
+    bucket = TokenBucket(rate=0)
+    assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+def test_limiter_uses_one_bucket_per_host_with_overrides():
+    """
+        Test that hosts are keyed without 'www.' and per-host overrides apply.
+    """
+    limiter = RateLimiter.from_config(
+        {
+            "rate_limits": {
+                "requests_per_second": 4,
+                "hosts": {"www.euronews.com": {"requests_per_second": 0.5}},
+            }
+        }
+    )
+
+    assert limiter.bucket("https://www.npr.org/a") is limiter.bucket("https://npr.org/b")
+    assert limiter.bucket("https://npr.org/a") is not limiter.bucket("https://euronews.com/a")
+    assert limiter.bucket("https://npr.org/a").rate == 4
+    assert limiter.bucket("https://www.euronews.com/a").rate == 0.5
+
+
+def test_scrapy_rate_settings_export_delays():
+    """
+        Test that the default rate becomes DOWNLOAD_DELAY and overrides become slots.
+    """
+    settings = scrapy_rate_settings(
+        {
+            "rate_limits": {
+                "requests_per_second": 2,
+                "hosts": {"theverge.com": {"requests_per_second": 0.5}},
+            }
+        }
+    )
+
+    assert settings["DOWNLOAD_DELAY"] == 0.5
+    assert settings["DOWNLOAD_SLOTS"]["www.theverge.com"]["delay"] == 2.0
+    assert settings["DOWNLOAD_SLOTS"]["theverge.com"]["delay"] == 2.0
+
+
+def test_safe_request_acquires_before_each_attempt(monkeypatch):
+    """
+        Test that every retry attempt takes a token from the rate limiter.
+    """
+    acquired = []
+
+    class RecordingLimiter:
+        def acquire(self, url):
+            acquired.append(url)
+
+    class Response:
+        status_code = 503
+
+    monkeypatch.setattr(helpers.requests, "get", lambda *args, **kwargs: Response())
+    monkeypatch.setattr(helpers.time, "sleep", lambda seconds: None)
+
+    assert helpers.safe_request("https://npr.org/x", rate_limiter=RecordingLimiter()) is None
+    assert acquired == ["https://npr.org/x"] * 3
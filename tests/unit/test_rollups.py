@@ -0,0 +1,198 @@
+"""
+Unit tests for the daily count and keyword rollups.
+
+Tests include:
+- Trigger-maintained daily counts on insert, update and delete
+- Backfilling the rollups when an existing database is migrated
+- Incremental keyword refreshes behind an id watermark, and resets
+- N-gram rollups per configured size, backfilled when a size is added
+- Rollup-backed queries and trend reports
+All tests use a temporary database file and reports directory.
+"""
+
+import sqlite3
+import pandas as pd
+import pytest
+from src.analysis import trends
+from src.analysis.keywords import KeywordEngine
+from src.data import database, queries, rollups
+from src.data.models import NewsArticle
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """
+        Fixture that points the database module at a fresh temporary file.
+    """
+    db_path = tmp_path / "news.db"
+    monkeypatch.setattr("src.data.database.DB_PATH", str(db_path))
+    return db_path
+
+
+def _store(articles):
+    """Insert (title, category, published, link) tuples."""
+    database.insert_articles(
+        NewsArticle(title, link, category, published, link.split("/")[2])
+        for title, category, published, link in articles
+    )
+
+
+def _daily(conn):
+    return conn.execute(
+        "SELECT day, category, source, count FROM daily_counts WHERE count > 0 ORDER BY 1, 2, 3"
+    ).fetchall()
+
+
+def test_triggers_keep_daily_counts_exact(temp_db):
+    """
+        Test that inserts, updates and deletes on articles adjust daily_counts.
+    """
+    database.create_table()
+    _store([
+        ("Budget vote", "politics", "2025-06-01", "https://npr.org/1"),
+        ("Budget cuts", "politics", "2025-06-01", "https://npr.org/2"),
+        ("Heat wave", None, "2025-06-02", "https://euronews.com/3"),
+        ("Undated", "politics", "N/A", "https://npr.org/4"),
+    ])
+
+    with database.get_connection() as conn:
+        assert _daily(conn) == [
+            ("2025-06-01", "politics", "npr.org", 2),
+            ("2025-06-02", "", "euronews.com", 1),
+        ]
+
+        conn.execute("UPDATE articles SET category = 'climate' WHERE link = 'https://euronews.com/3'")
+        conn.execute("UPDATE articles SET published_date = '2025-06-03' WHERE link = 'https://npr.org/4'")
+        conn.execute("DELETE FROM articles WHERE link = 'https://npr.org/1'")
+
+        assert _daily(conn) == [
+            ("2025-06-01", "politics", "npr.org", 1),
+            ("2025-06-02", "climate", "euronews.com", 1),
+            ("2025-06-03", "politics", "npr.org", 1),
+        ]
+
+
+def test_migration_backfills_existing_articles(temp_db):
+    """
+        Test that upgrading a database created before the rollups counts its stored articles.
+    """
+    database.create_table()
+    _store([
+        ("Budget vote", "politics", "2025-06-01", "https://npr.org/1"),
+        ("Heat wave", "climate", "2025-06-01", "https://euronews.com/2"),
+    ])
+    conn = sqlite3.connect(temp_db)
+    conn.executescript(
+        "DROP TABLE daily_counts; DROP TABLE daily_keyword_counts; "
+        "DROP TABLE keyword_counts; DROP TABLE rollup_state;"
+        f"PRAGMA user_version = {database.MIGRATIONS.index(database._migration_rollups)};"
+    )
+    conn.close()
+
+    database.create_table()
+
+    with database.get_connection() as conn:
+        assert _daily(conn) == [
+            ("2025-06-01", "climate", "euronews.com", 1),
+            ("2025-06-01", "politics", "npr.org", 1),
+        ]
+
+
+def test_keyword_refresh_only_counts_new_articles(temp_db):
+    """
+        Test that a refresh rolls up articles above the watermark once, and a reset recounts.
+    """
+    database.create_table()
+    engine = KeywordEngine()
+    _store([
+        ("Budget vote passes", "politics", "2025-06-01", "https://npr.org/1"),
+        ("Budget talks stall", "politics", "2025-06-02", "https://npr.org/2"),
+    ])
+
+    with database.get_connection() as conn:
+        assert rollups.refresh_keyword_rollups(conn, engine) == 2
+        assert rollups.refresh_keyword_rollups(conn, engine) == 0
+
+    _store([("Heat wave and budget", "climate", "2025-06-02", "https://euronews.com/3")])
+
+    with database.get_connection() as conn:
+        assert rollups.refresh_keyword_rollups(conn, engine, batch_size=1) == 1
+        totals = dict(conn.execute("SELECT keyword, count FROM keyword_counts"))
+        assert totals["budget"] == 3
+        assert conn.execute(
+            "SELECT count FROM daily_keyword_counts "
+            "WHERE day = '2025-06-02' AND category = 'politics' AND keyword = 'budget'"
+        ).fetchone() == (1,)
+
+        rollups.reset_keyword_rollups(conn)
+        assert conn.execute("SELECT COUNT(*) FROM keyword_counts").fetchone() == (0,)
+        assert rollups.refresh_keyword_rollups(conn, engine) == 3
+        assert dict(conn.execute("SELECT keyword, count FROM keyword_counts")) == totals
+
+
+def test_ngram_rollups_backfill_added_sizes(temp_db):
+    """
+        Test that each n-gram size has its own watermark, so enabling it later
+        counts the articles already rolled up for keywords.
+    """
+    database.create_table()
+    engine = KeywordEngine()
+    _store([
+        ("Budget vote passes", "politics", "2025-06-01", "https://npr.org/1"),
+        ("Budget vote stalls", "politics", "2025-06-02", "https://npr.org/2"),
+    ])
+
+    with database.get_connection() as conn:
+        assert rollups.refresh_keyword_rollups(conn, engine, ngrams=(1,)) == 2
+        assert queries.top_ngrams(2) == []
+
+        assert rollups.refresh_keyword_rollups(conn, engine, ngrams=(1, 2, 3)) == 2
+        assert queries.top_ngrams(2, 2) == [("budget vote", 2), ("vote passes", 1)]
+        assert queries.top_ngrams(3) == [("budget vote passes", 1), ("budget vote stalls", 1)]
+        assert rollups.refresh_keyword_rollups(conn, engine, ngrams=(1, 2, 3)) == 0
+
+        rollups.reset_keyword_rollups(conn)
+        assert queries.top_ngrams(2) == []
+        assert rollups.refresh_keyword_rollups(conn, engine, ngrams=(2,)) == 2
+        assert queries.top_ngrams(2, 1) == [("budget vote", 2)]
+
+
+def test_rollup_queries_and_reports(temp_db, tmp_path, monkeypatch):
+    """
+        Test the rollup-backed queries and the trend reports written without loading articles.
+    """
+    database.create_table()
+    _store([
+        ("Budget vote passes", "politics", "2025-06-01", "https://npr.org/1"),
+        ("Budget talks stall", "politics", "2025-06-03", "https://npr.org/2"),
+        ("Heat wave warning", "climate", "2025-06-03", "https://euronews.com/3"),
+    ])
+    monkeypatch.setattr(trends, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(trends, "get_keyword_engine", lambda: (KeywordEngine(), (1, 2)))
+
+    assert queries.count_by_day_and_group("source") == [
+        ("2025-06-01", "npr.org", 1),
+        ("2025-06-03", "euronews.com", 1),
+        ("2025-06-03", "npr.org", 1),
+    ]
+    with pytest.raises(ValueError):
+        queries.count_by_day_and_group("title")
+
+    trends.run_full_analysis(use_rollups=True)
+
+    assert queries.top_keywords(1) == [("budget", 2)]
+    assert queries.top_keywords(5, category="climate", end="2025-06-03") == [
+        ("heat", 1), ("warning", 1), ("wave", 1)
+    ]
+    keywords = (tmp_path / "top_keywords_titles.csv").read_text().splitlines()
+    assert keywords[:2] == ["keyword,count", "budget,2"]
+    bigrams = (tmp_path / "top_bigrams_titles.csv").read_text().splitlines()
+    assert bigrams[:3] == ["bigram,count", "budget talks,1", "budget vote,1"]
+    assert not (tmp_path / "top_trigrams_titles.csv").exists()
+    by_category = pd.read_csv(tmp_path / "top_keywords_by_category.csv")
+    assert set(by_category["category"]) == {"climate", "politics"}
+    by_source = pd.read_csv(tmp_path / "publishing_by_source.csv")
+    assert len(by_source) == 3 * 2
+    assert by_source["count"].sum() == 3
+    assert (tmp_path / "publishing_trend.png").exists()
+    assert (tmp_path / "articles_by_category.png").exists()
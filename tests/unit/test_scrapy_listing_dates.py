@@ -0,0 +1,83 @@
+"""
+Unit tests for listing-page date extraction in the Scrapy spider.
+
+Uses the saved archive fixture in tests/fixtures, whose ten articles carry
+their dates in card markup (4), JSON-LD (3), `__NEXT_DATA__` (2) or nowhere (1).
+
+Tests include:
+- Dates found in each listing source
+- The spider fetching only the article without a listing date
+- The article-page fallback still filling in the missing date
+"""
+
+import os
+import pytest
+import scrapy
+from scrapy.http import HtmlResponse, Request
+from src.scrapers.scrapy_crawler.items import NewsArticle
+from src.scrapers.scrapy_crawler.scrapy_crawler import GenericNewsSpider, extract_listing_dates
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+ARCHIVE_URL = "https://www.theverge.com/news/archives/1"
+
+
+def _fixture_response(name, url):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return HtmlResponse(url, body=f.read(), encoding="utf-8", request=Request(url))
+
+
+@pytest.fixture
+def archive():
+    """
+        Fixture returning the saved archive page as a Scrapy response.
+    """
+    return _fixture_response("theverge_archive.html", ARCHIVE_URL)
+
+
+def _crawl_listing(archive, listing_dates):
+    """Run `parse` on the archive and split its output into article requests and items."""
+    spider = GenericNewsSpider(frontier=False, listing_dates=listing_dates)
+    output = list(spider.parse(archive))
+    requests = [r for r in output if isinstance(r, scrapy.Request) and r.callback == spider.parse_article]
+    items = [i for i in output if isinstance(i, NewsArticle)]
+    return spider, requests, items
+
+
+def test_extract_listing_dates_reads_markup_json_ld_and_next_data(archive):
+    """
+        Test that every listing source contributes dates, keyed by absolute URL.
+    """
+    dates = extract_listing_dates(archive)
+
+    expected = {
+        f"https://www.theverge.com/news/{i}/story-{i}": f"2025-06-{10 + i}T09:00:00Z"
+        for i in range(9)
+    }
+    assert dates == expected
+
+
+def test_listing_dates_cut_article_requests(archive):
+    """
+        Test that only the article without a listing date is fetched
+        (1 request instead of 10 per archive page).
+    """
+    _, baseline_requests, baseline_items = _crawl_listing(archive, listing_dates=False)
+    _, requests, items = _crawl_listing(archive, listing_dates=True)
+
+    assert len(baseline_requests) == 10 and not baseline_items
+    assert [r.url for r in requests] == ["https://www.theverge.com/news/9/story-9"]
+    assert len(items) == 9
+    assert all(item["published"].startswith("2025-06-") for item in items)
+
+
+def test_article_fallback_fills_missing_date(archive):
+    """
+        Test that the remaining article request still yields a dated item.
+    """
+    spider, requests, _ = _crawl_listing(archive, listing_dates=True)
+    article = _fixture_response("theverge_article.html", requests[0].url)
+    article.request.meta["item"] = requests[0].meta["item"]
+
+    (item,) = spider.parse_article(article)
+    assert item["link"] == "https://www.theverge.com/news/9/story-9"
+    assert item["published"] == "2025-06-19T09:00:00Z"
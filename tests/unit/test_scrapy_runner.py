@@ -0,0 +1,76 @@
+"""
+Unit tests for the Scrapy crawl settings built in runner.py.
+
+Tests include:
+- Defaults derived from the shared rate limits
+- The `scrapy` config section and its AutoThrottle block
+- Explicit (CLI) overrides taking precedence over the config
+"""
+
+from src.scrapers.scrapy_crawler.runner import CrawlResult, crawl_settings
+
+CONFIG = {
+    "rate_limits": {
+        "requests_per_second": 2,
+        "burst": 1,
+        "hosts": {"theverge.com": {"requests_per_second": 0.5}},
+    },
+}
+
+
+def test_defaults_follow_rate_limits():
+    """
+        Test that without a scrapy section the rate limits drive the delays.
+    """
+    settings = crawl_settings(CONFIG)
+
+    assert settings["CONCURRENT_REQUESTS"] == 16
+    assert settings["DOWNLOAD_DELAY"] == 0.5
+    assert settings["CONCURRENT_REQUESTS_PER_DOMAIN"] == 1
+    assert settings["DOWNLOAD_SLOTS"]["www.theverge.com"] == {"delay": 2.0, "concurrency": 1}
+    assert settings["AUTOTHROTTLE_ENABLED"] is False
+
+
+def test_config_section_and_cli_overrides():
+    """
+        Test that the scrapy section applies and explicit arguments win over it.
+    """
+    config = dict(
+        CONFIG,
+        scrapy={
+            "concurrent_requests": 32,
+            "concurrent_requests_per_domain": 4,
+            "autothrottle": {"enabled": True, "target_concurrency": 2.0, "max_delay": 10},
+        },
+    )
+
+    settings = crawl_settings(config, download_delay=0.25, autothrottle_target=3.0)
+
+    assert settings["CONCURRENT_REQUESTS"] == 32
+    assert settings["CONCURRENT_REQUESTS_PER_DOMAIN"] == 4
+    assert settings["DOWNLOAD_DELAY"] == 0.25
+    assert settings["DOWNLOAD_SLOTS"]["theverge.com"] == {"delay": 0.25, "concurrency": 4}
+    assert settings["AUTOTHROTTLE_ENABLED"] is True
+    assert settings["AUTOTHROTTLE_TARGET_CONCURRENCY"] == 3.0
+    assert settings["AUTOTHROTTLE_MAX_DELAY"] == 10.0
+
+    assert crawl_settings(config, autothrottle=False)["AUTOTHROTTLE_ENABLED"] is False
+
+
+def test_crawl_result_from_stats():
+    """
+        Test that Scrapy stats are summarized with an items/sec rate.
+    """
+    stats = {
+        "item_scraped_count": 50,
+        "downloader/response_count": 60,
+        "retry/count": 3,
+        "elapsed_time_seconds": 10.0,
+        "finish_reason": "finished",
+    }
+
+    result = CrawlResult.from_stats(stats, elapsed=12.0)
+
+    assert (result.items, result.responses, result.retries) == (50, 60, 3)
+    assert result.items_per_sec == 5.0
+    assert result.ok
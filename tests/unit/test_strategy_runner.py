@@ -0,0 +1,101 @@
+"""
+Unit tests for running scraper strategies concurrently in runner.py.
+
+Small sleeping strategies stand in for the real scrapers; each still runs
+in its own spawned process.
+
+Tests include:
+- Parallel runs taking about as long as the slowest strategy
+- Results, errors, crashes and timeouts reported per strategy
+- Resource limits applied inside the strategy's process
+"""
+
+import os
+import time
+from src.strategies.base import ScraperStrategy
+from src.strategies.runner import format_summary, run_strategies
+
+
+class SleepStrategy(ScraperStrategy):
+    """Sleeps, then returns its pid so the test can tell processes apart."""
+
+    def __init__(self, name, seconds):
+        self.name = name
+        self.seconds = seconds
+
+    def run(self):
+        time.sleep(self.seconds)
+        return os.getpid()
+
+
+class FailingStrategy(ScraperStrategy):
+    name = "failing"
+
+    def run(self):
+        raise RuntimeError("site changed its markup")
+
+
+class CrashingStrategy(ScraperStrategy):
+    name = "crashing"
+
+    def run(self):
+        os._exit(3)
+
+
+class LimitsStrategy(ScraperStrategy):
+    name = "limits"
+
+    def run(self):
+        import resource
+        return resource.getrlimit(resource.RLIMIT_CPU)
+
+
+def test_parallel_run_takes_the_slowest_not_the_sum():
+    """
+        Test that three strategies run concurrently in separate processes.
+    """
+    strategies = [SleepStrategy(f"sleep{i}", 1.5) for i in range(3)]
+
+    started = time.monotonic()
+    results = run_strategies(strategies, parallel=True)
+    elapsed = time.monotonic() - started
+
+    assert [r.name for r in results] == ["sleep0", "sleep1", "sleep2"]
+    assert all(r.ok for r in results)
+    assert len({r.result for r in results} | {os.getpid()}) == 4
+    # sequential would need 4.5 s of sleeping alone
+    assert elapsed < 4.0
+
+
+def test_failures_and_timeouts_are_reported_per_strategy():
+    """
+        Test that errors, crashes and overruns do not affect the other strategies.
+    """
+    results = run_strategies(
+        [SleepStrategy("quick", 0), FailingStrategy(), CrashingStrategy(), SleepStrategy("slow", 30)],
+        timeouts={"slow": 3},
+    )
+
+    by_name = {r.name: r for r in results}
+    assert by_name["quick"].ok
+    assert by_name["failing"].status == "error"
+    assert "site changed its markup" in by_name["failing"].error
+    assert by_name["crashing"].status == "crashed"
+    assert by_name["crashing"].error == "exit code 3"
+    assert by_name["slow"].status == "timeout"
+    assert by_name["slow"].elapsed < 10
+
+    summary = format_summary(results, wall_time=3.5)
+    assert "timeout" in summary and "3.5s wall clock" in summary
+
+
+def test_limits_apply_inside_the_strategy_process():
+    """
+        Test that cpu_seconds becomes an RLIMIT_CPU of the child only.
+    """
+    import resource
+
+    (result,) = run_strategies([LimitsStrategy()], limits={"limits": {"cpu_seconds": 120}})
+
+    assert result.result == (120, 120)
+    assert resource.getrlimit(resource.RLIMIT_CPU) != (120, 120)
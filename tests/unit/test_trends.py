@@ -0,0 +1,83 @@
+"""
+Unit tests for the vectorized publishing-activity trends in trends.py.
+
+Tests include:
+- Daily counts on a dense calendar index, overall and per group
+- 7D/30D rolling means over calendar days, not observed dates
+- The per-category/per-source CSV reports and chart
+Charts and reports are written to a temporary directory.
+"""
+
+import pandas as pd
+import pytest
+from src.analysis import trends
+from src.analysis.dataset import parse_dates
+from src.analysis.trends import activity_by, daily_counts, rolling_activity
+
+
+@pytest.fixture
+def articles():
+    """
+        Fixture returning a dataset frame with a gap of quiet days and one undated article.
+    """
+    published = pd.Series(["2025-06-01", "2025-06-01", "2025-06-08", "2025-06-08", "N/A"])
+    return pd.DataFrame(
+        {
+            "published": published,
+            "category": pd.Categorical(["politics", "climate", "politics", "politics", "politics"]),
+            "source": pd.Categorical(["npr.org", "npr.org", "npr.org", "euronews.com", "npr.org"]),
+            "date": parse_dates(published),
+        }
+    )
+
+
+def test_daily_counts_fill_quiet_days(articles):
+    """
+        Test that days without articles are counted as 0 and undated articles are dropped.
+    """
+    counts = daily_counts(articles)
+
+    assert list(counts.index) == list(pd.date_range("2025-06-01", "2025-06-08"))
+    assert counts.tolist() == [2, 0, 0, 0, 0, 0, 0, 2]
+
+    by_category = daily_counts(articles, "category")
+    assert by_category["politics"].tolist() == [1, 0, 0, 0, 0, 0, 0, 2]
+    assert by_category["climate"].sum() == 1
+
+
+def test_rolling_windows_cover_calendar_days(articles):
+    """
+        Test that the 7D mean on 06-08 spans 06-02..06-08 (including the quiet days).
+    """
+    rolling = rolling_activity(daily_counts(articles))
+
+    # An observation-based window of 7 would average both busy days: (2 + 2) / 2
+    assert rolling["7D"].loc["2025-06-08"] == pytest.approx(2 / 7)
+    assert rolling["30D"].loc["2025-06-08"] == pytest.approx(4 / 8)
+
+
+def test_activity_by_source_is_long_format(articles):
+    """
+        Test the per-group table layout written to the CSV reports.
+    """
+    table = activity_by(articles, "source")
+
+    assert list(table.columns) == ["date", "source", "count", "avg_7d", "avg_30d"]
+    assert len(table) == 8 * 2
+    last = table[(table["date"] == "2025-06-08") & (table["source"] == "npr.org")].iloc[0]
+    assert last["count"] == 1
+    assert last["avg_7d"] == pytest.approx(1 / 7)
+
+
+def test_analyze_publishing_activity_writes_reports(articles, tmp_path, monkeypatch):
+    """
+        Test that the chart and both per-group CSV files are saved.
+    """
+    monkeypatch.setattr(trends, "REPORTS_DIR", str(tmp_path))
+
+    trends.analyze_publishing_activity(articles)
+
+    assert (tmp_path / "publishing_trend.png").exists()
+    by_category = pd.read_csv(tmp_path / "publishing_by_category.csv")
+    assert set(by_category["category"]) == {"politics", "climate"}
+    assert (tmp_path / "publishing_by_source.csv").exists()